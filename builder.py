@@ -6,7 +6,9 @@ Interactive CLI tool and build engine for creating firmware release packages.
 Generates manifests, compiles bytecode, creates ZIP packages, and generates releases.json.
 Also builds/minifies captive portal web assets (src/www → build/www).
 
-Full reset strategy: every release contains complete firmware (no partial updates).
+Full reset strategy: every release contains complete firmware. When the previous full
+package is available, a delta package against it is built alongside for devices that
+are already on that release (see build_delta_package).
 Note: releases.json is generated but not committed (gitignored, deployed separately).
 """
 
@@ -15,9 +17,11 @@ import json
 import os
 import re
 import shutil
+import struct
 import subprocess
 import sys
 import zipfile
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -26,6 +30,16 @@ os.environ["COPYFILE_DISABLE"] = "1"  # Prevent macOS ._ resource fork files in
 
 INSTALL_SCRIPTS_DIR = "firmware_install_scripts"
 
+# Delta packages - format shared with src/utils/update_install.py (apply_delta)
+DELTA_PACKAGE_NAME = "wicid_delta.zip"
+DELTA_BASE_STASH = "wicid_install.previous"  # Previous full package kept as the delta base
+DELTA_INDEX_NAME = "delta.json"
+DELTA_PATCH_SUFFIX = ".wdelta"
+_PATCH_MAGIC = b"WDL1"
+_PATCH_COPY = 0
+_PATCH_INSERT = 1
+_PATCH_BLOCK_SIZE = 32  # Shortest run of base bytes worth a copy op
+
 # Optional minifiers / HTML parser (graceful fallback if not installed)
 try:
     from rjsmin import jsmin as _jsmin
@@ -657,15 +671,21 @@ def interactive_build() -> bool:
             f.write("\n")
 
         # Build package (returns path and checksum)
+        delta = None
         if script_only:
             package_path, checksum = build_script_only_package(manifest, version, install_scripts)
         else:
+            delta_base = stash_delta_base()
             package_path, checksum = build_package(manifest, version)
+            if delta_base:
+                delta = build_delta_package(delta_base, package_path)
 
         # Update releases.json with checksum
         print_success("Updating releases.json...")
         releases_data = load_releases_json()
-        update_releases_json(releases_data, manifest, target_machines, target_oses, release_type, version, checksum)
+        update_releases_json(
+            releases_data, manifest, target_machines, target_oses, release_type, version, checksum, delta=delta
+        )
         save_releases_json(releases_data)
 
         # Show preview
@@ -842,6 +862,7 @@ def update_releases_json(
     release_type: str,
     version: str,
     sha256_checksum: str,
+    delta: dict[str, Any] | None = None,
 ) -> None:
     """Update releases.json with multi-platform structure, archive handling, and MPV.
 
@@ -861,6 +882,9 @@ def update_releases_json(
         release_type: "production" or "development".
         version: Version string used for generating zip_url.
         sha256_checksum: SHA-256 of the built ZIP file.
+        delta: Optional result of build_delta_package(); adds delta_from, delta_url
+            and delta_sha256 to the new release when WICID_RELEASE_ASSETS_URL says
+            where the package is published (see delta_package_url).
     """
     # Find existing release entry matching these machine types and OSes
     release_entry = None
@@ -913,6 +937,14 @@ def update_releases_json(
     if "minimum_prior_version" in manifest:
         new_release["minimum_prior_version"] = manifest["minimum_prior_version"]
 
+    delta_url = delta_package_url() if delta else None
+    if delta and delta_url:
+        new_release["delta_from"] = delta["delta_from"]
+        new_release["delta_url"] = delta_url
+        new_release["delta_sha256"] = delta["sha256"]
+    elif delta:
+        print_warning("Delta package not published: WICID_RELEASE_ASSETS_URL is not set")
+
     release_entry[release_type] = new_release
 
     # Clean archive: remove any releases that are now current in production or development
@@ -969,6 +1001,26 @@ def update_releases_json(
     releases_data["last_updated"] = datetime.now(timezone.utc).isoformat()
 
 
+def current_release_version(releases_data: dict[str, Any], manifest: dict[str, Any]) -> str | None:
+    """
+    Return the version currently published for the manifest's platform and release type.
+
+    This is the release a new build replaces, i.e. the natural delta base.
+
+    Args:
+        releases_data: Parsed releases.json
+        manifest: Manifest of the release being built
+
+    Returns:
+        str | None: Current version, or None if nothing is published yet
+    """
+    platform = (manifest.get("target_machine_types"), manifest.get("target_operating_systems"))
+    for entry in releases_data.get("releases", []):
+        if (entry.get("target_machine_types"), entry.get("target_operating_systems")) == platform:
+            return entry.get(manifest.get("release_type", "production"), {}).get("version")
+    return None
+
+
 def _copy_install_scripts_to_build(build_dir: Path, install_scripts: dict[str, Any]) -> None:
     """
     Copy install scripts to build directory in standard location.
@@ -993,7 +1045,13 @@ def _copy_install_scripts_to_build(build_dir: Path, install_scripts: dict[str, A
         print(f"  Copied: {INSTALL_SCRIPTS_DIR}/{src.name}")
 
 
-def _create_zip_package(build_dir: Path, package_path: Path, package_name: str, skip_py_with_mpy: bool = False) -> None:
+def _create_zip_package(
+    build_dir: Path,
+    package_path: Path,
+    package_name: str,
+    skip_py_with_mpy: bool = False,
+    record_file_hashes: bool = False,
+) -> None:
     """
     Create ZIP package from build directory.
 
@@ -1002,34 +1060,229 @@ def _create_zip_package(build_dir: Path, package_path: Path, package_name: str,
         package_path: Destination zip file path
         package_name: Package name for display
         skip_py_with_mpy: If True, skip .py files that have corresponding .mpy files
+        record_file_hashes: If True, add a "files" table ({"/path": sha256}) of every
+            other packaged file to the packaged manifest.json, so the installer can
+            skip files that are already identical on the device
     """
     print_success(f"Creating package: {package_name}...")
 
-    file_count = 0
-    with zipfile.ZipFile(package_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for file in build_dir.rglob("*"):
-            if file.is_file():
-                arcname = file.relative_to(build_dir)
+    entries: list[tuple[Path, Path]] = []
+    for file in build_dir.rglob("*"):
+        if file.is_file():
+            arcname = file.relative_to(build_dir)
 
-                # Skip hidden files and __pycache__
-                if any(part.startswith(".") or part == "__pycache__" for part in arcname.parts):
-                    continue
+            # Skip hidden files and __pycache__
+            if any(part.startswith(".") or part == "__pycache__" for part in arcname.parts):
+                continue
+
+            # Skip macOS resource fork files
+            if file.name.startswith("._"):
+                continue
 
-                # Skip macOS resource fork files
-                if file.name.startswith("._"):
+            # Skip .py source files if a corresponding .mpy exists (for full firmware builds)
+            # Exception: boot.py and code.py must remain as source
+            if skip_py_with_mpy and file.suffix == ".py" and file.name not in ("boot.py", "code.py"):
+                mpy_file = file.with_suffix(".mpy")
+                if mpy_file.exists():
                     continue
 
-                # Skip .py source files if a corresponding .mpy exists (for full firmware builds)
-                # Exception: boot.py and code.py must remain as source
-                if skip_py_with_mpy and file.suffix == ".py" and file.name not in ("boot.py", "code.py"):
-                    mpy_file = file.with_suffix(".mpy")
-                    if mpy_file.exists():
-                        continue
+            entries.append((file, arcname))
 
-                zf.write(file, arcname)
-                file_count += 1
+    manifest_file = build_dir / "manifest.json"
+    if record_file_hashes and manifest_file.exists():
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        manifest["files"] = {
+            f"/{arcname.as_posix()}": calculate_sha256(file)
+            for file, arcname in sorted(entries, key=lambda entry: entry[1])
+            if file != manifest_file
+        }
+        with open(manifest_file, "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+
+    with zipfile.ZipFile(package_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for file, arcname in entries:
+            zf.write(file, arcname)
 
-    print(f"  Packaged {file_count} files")
+    print(f"  Packaged {len(entries)} files")
+
+
+def make_delta_patch(old: bytes, new: bytes, block_size: int = _PATCH_BLOCK_SIZE) -> bytes:
+    """
+    Encode new as copy/insert operations against old.
+
+    Every block_size window of old is indexed; matches found in new are extended in
+    both directions and emitted as copies, everything else as literal inserts. The
+    device replays this with a fixed buffer (update_install._apply_patch).
+
+    Args:
+        old: Base file contents (installed on the device)
+        new: New file contents
+        block_size: Minimum match length
+
+    Returns:
+        bytes: Patch in WDL1 format
+    """
+    index: dict[bytes, int] = {}
+    for offset in range(len(old) - block_size + 1):
+        index.setdefault(old[offset : offset + block_size], offset)
+
+    ops = [_PATCH_MAGIC]
+
+    def insert(data: bytes) -> None:
+        if data:
+            ops.append(struct.pack("<BI", _PATCH_INSERT, len(data)) + data)
+
+    literal_start = 0
+    i = 0
+    while i <= len(new) - block_size:
+        j = index.get(new[i : i + block_size])
+        if j is None:
+            i += 1
+            continue
+        # Extend the match backwards into the pending literal, then forwards
+        while i > literal_start and j > 0 and new[i - 1] == old[j - 1]:
+            i -= 1
+            j -= 1
+        length = block_size
+        while i + length < len(new) and j + length < len(old) and new[i + length] == old[j + length]:
+            length += 1
+        insert(new[literal_start:i])
+        ops.append(struct.pack("<BII", _PATCH_COPY, j, length))
+        i += length
+        literal_start = i
+    insert(new[literal_start:])
+    return b"".join(ops)
+
+
+def _read_package_files(package_path: Path) -> dict[str, bytes]:
+    """Read every file in a package ZIP, keyed by device path ("/core/foo.mpy")."""
+    with zipfile.ZipFile(package_path) as zf:
+        return {f"/{info.filename}": zf.read(info) for info in zf.infolist() if not info.is_dir()}
+
+
+def build_delta_package(
+    base_package: Path, package_path: Path, delta_path: Path | None = None
+) -> dict[str, Any] | None:
+    """
+    Build a delta package that upgrades devices on the base release to the new one.
+
+    Unchanged files are omitted (their hashes are listed so the device can check
+    them), changed files ship as a copy/insert patch when that compresses smaller
+    than the whole file, and everything else ships whole. delta.json describes the
+    result and the packaged manifest.json gains delta_from.
+
+    Args:
+        base_package: Previous full package (what devices have installed)
+        package_path: New full package
+        delta_path: Output path (default: releases/wicid_delta.zip)
+
+    Returns:
+        dict | None: {"delta_from", "sha256", "path"}, or None when no delta applies
+            (script-only release on either side, or same version)
+    """
+    base_files = _read_package_files(base_package)
+    new_files = _read_package_files(package_path)
+    base_manifest = json.loads(base_files["/manifest.json"])
+    manifest = json.loads(new_files["/manifest.json"])
+    base_version = base_manifest.get("version")
+
+    if base_manifest.get("script_only_release") or manifest.get("script_only_release"):
+        print_warning("Skipping delta package: script-only release")
+        return None
+    if not base_version or base_version == manifest.get("version"):
+        print_warning("Skipping delta package: base package is not a previous release")
+        return None
+
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    delta_index: dict[str, Any] = {
+        "delta_from": base_version,
+        "unchanged": {},
+        "patched": {},
+        "replaced": {},
+        "removed": sorted(set(base_files) - set(new_files)),
+    }
+    members: dict[str, bytes] = {}
+    for path, data in sorted(new_files.items()):
+        if path == "/manifest.json":
+            continue
+        old = base_files.get(path)
+        if old == data:
+            delta_index["unchanged"][path] = digest(data)
+            continue
+        if old is not None:
+            patch = make_delta_patch(old, data)
+            if len(zlib.compress(patch)) < len(zlib.compress(data)):
+                delta_index["patched"][path] = {"base_sha256": digest(old), "sha256": digest(data)}
+                members[path + DELTA_PATCH_SUFFIX] = patch
+                continue
+        delta_index["replaced"][path] = digest(data)
+        members[path] = data
+
+    manifest["delta_from"] = base_version
+
+    if delta_path is None:
+        delta_path = Path("releases") / DELTA_PACKAGE_NAME
+    with zipfile.ZipFile(delta_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2) + "\n")
+        zf.writestr(DELTA_INDEX_NAME, json.dumps(delta_index, indent=2) + "\n")
+        for path, data in members.items():
+            zf.writestr(path[1:], data)
+
+    checksum = calculate_sha256(delta_path)
+    print_success(
+        f"Delta package created: {delta_path} (from {base_version}: "
+        f"{len(delta_index['patched'])} patched, {len(delta_index['replaced'])} replaced, "
+        f"{len(delta_index['unchanged'])} unchanged, {len(delta_index['removed'])} removed)"
+    )
+    print(f"  Size: {delta_path.stat().st_size / 1024:.1f} KB (full: {package_path.stat().st_size / 1024:.1f} KB)")
+    print(f"  SHA-256: {checksum}")
+    return {"delta_from": base_version, "sha256": checksum, "path": delta_path}
+
+
+def delta_package_url() -> str | None:
+    """
+    Return the URL the delta package will be served from, if it is being published.
+
+    The release workflow uploads releases/*.zip as assets of the GitHub release and
+    sets WICID_RELEASE_ASSETS_URL to that release's download prefix. Without it (local
+    builds) nothing uploads the delta package, so no delta_url is published.
+
+    Returns:
+        str | None: Download URL of wicid_delta.zip, or None when it is not uploaded
+    """
+    assets_url = os.environ.get("WICID_RELEASE_ASSETS_URL")
+    if not assets_url:
+        return None
+    return f"{assets_url.rstrip('/')}/{DELTA_PACKAGE_NAME}"
+
+
+def stash_delta_base() -> Path | None:
+    """
+    Set aside the previous full package before it is overwritten by a new build.
+
+    Uses WICID_DELTA_BASE (path to the previous wicid_install.zip, e.g. downloaded in
+    CI) if set, otherwise the last local build in releases/.
+
+    Returns:
+        Path | None: Base package for build_delta_package(), or None if unavailable
+    """
+    env_base = os.environ.get("WICID_DELTA_BASE")
+    if env_base:
+        if Path(env_base).is_file():
+            return Path(env_base)
+        print_warning(f"WICID_DELTA_BASE not found: {env_base}")
+        return None
+
+    previous = Path("releases") / "wicid_install.zip"
+    if not previous.is_file():
+        return None
+    stash = Path("releases") / DELTA_BASE_STASH
+    shutil.copy2(previous, stash)
+    return stash
 
 
 def build_package(manifest: dict[str, Any], version: str) -> tuple[Path, str]:
@@ -1117,7 +1370,7 @@ def build_package(manifest: dict[str, Any], version: str) -> tuple[Path, str]:
         _copy_install_scripts_to_build(build_dir, scripts_info)
 
     # Create ZIP package
-    _create_zip_package(build_dir, package_path, package_name, skip_py_with_mpy=True)
+    _create_zip_package(build_dir, package_path, package_name, skip_py_with_mpy=True, record_file_hashes=True)
 
     validate_build_artifacts(build_dir)
 
@@ -1429,6 +1682,8 @@ and builds/minifies captive portal web assets.
 {Colors.BOLD}USAGE:{Colors.ENDC}
     builder.py              Run interactive build wizard
     builder.py --build      Non-interactive build from existing manifest
+    builder.py --delta-base-version
+                            Print the published version a new build replaces
     builder.py --help       Display this help message
 
 {Colors.BOLD}WORKFLOW:{Colors.ENDC}
@@ -1441,6 +1696,8 @@ and builds/minifies captive portal web assets.
        • Default mode: single (inline)
        • Override with WICID_WWW_MODE=split|both
     5. Bundles firmware into releases/wicid_install.zip
+       • Also builds releases/wicid_delta.zip against the previous package
+         (WICID_DELTA_BASE, or the last local build) when one is available
     6. Generates releases.json (gitignored)
     7. Optionally commits, tags (v{{version}}), and pushes to git
 
@@ -1473,9 +1730,11 @@ def main() -> None:
             with open("src/manifest.json") as f:
                 manifest = json.load(f)
             version = manifest["version"]
+            delta_base = stash_delta_base()
             package_path, checksum = build_package(manifest, version)
             print_success(f"Build complete: {package_path}")
             print_success(f"SHA-256: {checksum}")
+            delta = build_delta_package(delta_base, package_path) if delta_base else None
 
             # Update releases.json with checksum
             print("Updating releases.json with checksum...")
@@ -1488,10 +1747,19 @@ def main() -> None:
                 manifest["release_type"],
                 version,
                 checksum,
+                delta=delta,
             )
             save_releases_json(releases_data)
             print_success("releases.json updated")
             sys.exit(0)
+        elif arg == "--delta-base-version":
+            # Print the release a new build replaces (CI fetches its package as WICID_DELTA_BASE)
+            with open("src/manifest.json") as f:
+                manifest = json.load(f)
+            base_version = current_release_version(load_releases_json(), manifest)
+            if base_version:
+                print(base_version)
+            sys.exit(0)
         else:
             print_error(f"Unknown option: {arg}")
             print("Run 'builder.py --help' for usage information.")
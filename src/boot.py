@@ -10,8 +10,10 @@ EMERGENCY RECOVERY:
 This file includes inline emergency recovery for boot-critical files.
 If boot_support.mpy or its dependencies are missing/corrupted, the normal
 recovery mechanism in boot_support.py cannot run (because boot_support.py
-itself fails to import). This inline recovery uses ONLY the built-in 'os'
-module to restore these files from /recovery/ before attempting the import.
+itself fails to import). This inline recovery uses ONLY built-in modules
+('os', and 'hashlib'/'binascii' where the port has them) to restore these
+files from /recovery/ before attempting the import. Backup copies are checked
+against /recovery/.integrity first, so a corrupted copy is never restored.
 """
 
 import os
@@ -29,16 +31,40 @@ _BOOT_CRITICAL = [
 ]
 
 _RECOVERY_DIR = "/recovery"
+# Written by utils.recovery: one "<sha256> <path>" line per backed-up file
+_RECOVERY_INTEGRITY_FILE = "/recovery/.integrity"
+# Hash index of the installed release; no longer describes the root once a file is restored
+_INSTALLED_INDEX_FILE = "/installed_files.json"
+
+
+def _backup_sha256(path: str, buffer: bytearray) -> str | None:
+    """Hex SHA-256 of a file using the built-in hashlib, or None if unavailable."""
+    try:
+        import binascii
+        import hashlib
+    except ImportError:
+        return None
+    sha256 = hashlib.new("sha256")
+    view = memoryview(buffer)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            sha256.update(view[:n])
+    return binascii.hexlify(sha256.digest()).decode()
 
 
 def _emergency_recovery() -> None:
     """
-    Emergency recovery using only built-in os module.
+    Emergency recovery using only built-in modules.
 
     Runs BEFORE any imports that could fail. If boot-critical files are missing,
     attempts to restore them from /recovery/. This is a last-resort mechanism
     to prevent complete device bricking.
     """
+    expected = None
+    buffer = None
     for path in _BOOT_CRITICAL:
         try:
             os.stat(path)
@@ -46,9 +72,25 @@ def _emergency_recovery() -> None:
             # File missing - try to restore from recovery
             recovery_path = _RECOVERY_DIR + path
             try:
-                # Read from recovery
-                with open(recovery_path, "rb") as src:
-                    content = src.read()
+                if buffer is None:
+                    buffer = bytearray(2048)
+                if expected is None:
+                    expected = {}
+                    try:
+                        with open(_RECOVERY_INTEGRITY_FILE) as f:
+                            for line in f:
+                                digest, _, listed_path = line.strip().partition(" ")
+                                expected[listed_path] = digest
+                    except OSError:
+                        pass  # Legacy backup without hashes
+
+                # Refuse a backup copy that no longer matches its recorded hash
+                if path in expected:
+                    actual = _backup_sha256(recovery_path, buffer)
+                    if actual is not None and actual != expected[path]:
+                        print(f"EMERGENCY RECOVERY FAILED: {path} - backup copy is corrupted")
+                        print("Device may not boot. Enter Safe Mode and run installer.py")
+                        continue
 
                 # Create parent directory if needed
                 # Note: Can't use contextlib.suppress here - boot.py uses minimal imports
@@ -59,9 +101,19 @@ def _emergency_recovery() -> None:
                     except OSError:
                         pass  # Directory exists
 
-                # Write to target location
-                with open(path, "wb") as dst:
-                    dst.write(content)
+                # Copy in chunks so large modules don't need a heap-sized buffer
+                view = memoryview(buffer)
+                with open(recovery_path, "rb") as src, open(path, "wb") as dst:
+                    while True:
+                        n = src.readinto(view)
+                        if not n:
+                            break
+                        dst.write(view[:n])
+
+                try:  # noqa: SIM105
+                    os.remove(_INSTALLED_INDEX_FILE)
+                except OSError:
+                    pass  # No index, or already removed
 
                 os.sync()
                 print(f"EMERGENCY RECOVERY: Restored {path}")
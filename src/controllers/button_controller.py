@@ -1,12 +1,22 @@
 """
 ButtonController - hardware abstraction for the physical button.
 
-Provides a simple polling interface that is scheduler-friendly
-and does not spin up its own asyncio tasks.
+Two backends, neither of which spins up its own asyncio tasks:
+- KeysButtonController: keypad.Keys scans and debounces the pin in the background
+  and queues timestamped press/release events for InputManager to drain.
+- ButtonController: plain DigitalInOut polling, used when keypad is unavailable.
+
+create_button_controller() picks the event-driven backend and falls back to polling.
 """
 
 import board  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
 import digitalio  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
+import supervisor  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
+
+try:
+    import keypad  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
+except ImportError:
+    keypad = None  # Builds without keypad fall back to ButtonController polling
 
 from core.app_typing import Any
 
@@ -19,6 +29,8 @@ class ButtonController:
     without any background asyncio helpers that might interfere with the scheduler.
     """
 
+    EVENT_DRIVEN = False  # InputManager samples is_pressed() at BUTTON_MONITOR_PERIOD
+
     def __init__(self, logger: Any, button_pin: Any = None, input_factory: Any = None) -> None:
         """
         Initialize ButtonController.
@@ -75,3 +87,122 @@ class ButtonController:
             pass
         finally:
             self._digital_in = None
+
+
+# supervisor.ticks_ms() (and keypad event timestamps) wrap at 2**29 ms
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALF = _TICKS_PERIOD // 2
+
+
+class KeysButtonController:
+    """
+    Event-driven hardware abstraction for the physical button, built on keypad.Keys.
+
+    keypad scans and debounces the pin in the background and records each press and
+    release with a timestamp, so InputManager only drains the queue now and then and
+    still classifies clicks and holds from exact times instead of 10ms samples.
+    """
+
+    EVENT_DRIVEN = True  # InputManager drains read_event() at BUTTON_EVENT_PERIOD
+
+    def __init__(self, logger: Any, button_pin: Any = None, keys_factory: Any = None, ticks_ms: Any = None) -> None:
+        """
+        Initialize KeysButtonController.
+
+        Args:
+            logger: Logger instance for logging
+            button_pin: Optional Pin object. If None, uses board.BUTTON
+            keys_factory: Optional callable used to construct a keypad.Keys-like object.
+                Tests can inject a scripted event queue here.
+            ticks_ms: Optional millisecond clock matching the event timestamps
+                (defaults to supervisor.ticks_ms)
+        """
+        if keys_factory is None:
+            if keypad is None:
+                raise RuntimeError("keypad module not available")
+            keys_factory = keypad.Keys
+        self._logger = logger
+        self._ticks_ms = ticks_ms or supervisor.ticks_ms
+        self._button_pin = button_pin if button_pin is not None else board.BUTTON
+        # Button is active-low with a pull-up
+        self._keys = keys_factory((self._button_pin,), value_when_pressed=False, pull=True)
+        self._pressed = False
+
+    @property
+    def button_pin(self) -> Any:
+        """Return the raw Pin object."""
+        return self._button_pin
+
+    def is_pressed(self) -> bool:
+        """
+        Return True if the last event read was a press.
+
+        Returns:
+            bool: True if button is pressed, False otherwise
+        """
+        return self._pressed
+
+    def read_event(self, now: float) -> tuple[bool, float] | None:
+        """
+        Pop the next queued button event.
+
+        If the queue overflowed, events were lost: the queue is cleared and the
+        scanner reset (which re-reports a held button as a new press), and a release
+        is returned if the button was believed pressed so the caller's state stays
+        consistent.
+
+        Args:
+            now: Current time.monotonic(), used to convert the event timestamp
+
+        Returns:
+            tuple | None: (pressed, monotonic time of the event), or None if the queue is empty
+        """
+        events = self._keys.events
+        if events.overflowed:
+            self._logger.warning("Button event queue overflowed; resynchronizing")
+            events.clear()
+            self._keys.reset()
+            if self._pressed:
+                self._pressed = False
+                return (False, now)
+
+        event = events.get()
+        if event is None:
+            return None
+
+        # Age of the event on the wrapping millisecond clock
+        age_ms = (self._ticks_ms() - event.timestamp) & _TICKS_MAX
+        if age_ms >= _TICKS_HALF:
+            age_ms = 0  # Timestamp ahead of the clock read - treat as "just now"
+        self._pressed = bool(event.pressed)
+        return (self._pressed, now - age_ms / 1000)
+
+    def deinit(self) -> None:
+        """Deinitialize hardware resources."""
+        try:
+            if hasattr(self, "_keys") and self._keys is not None:
+                self._keys.deinit()
+        except Exception:
+            # Best-effort cleanup; ignore hardware-specific errors
+            pass
+        finally:
+            self._keys = None
+
+
+def create_button_controller(logger: Any, button_pin: Any = None) -> Any:
+    """
+    Create the event-driven button backend, falling back to polling.
+
+    Args:
+        logger: Logger instance for logging
+        button_pin: Optional Pin object. If None, uses board.BUTTON
+
+    Returns:
+        KeysButtonController, or ButtonController if keypad could not claim the pin
+    """
+    try:
+        return KeysButtonController(logger, button_pin)
+    except Exception as exc:
+        logger.warning(f"keypad unavailable ({exc}); polling the button instead")
+        return ButtonController(logger, button_pin)
@@ -5,7 +5,14 @@ import neopixel  # pyright: ignore[reportMissingImports]  # CircuitPython-only m
 
 from core.app_typing import Any, Dict, Optional
 from core.logging_helper import logger
-from core.scheduler import Scheduler
+from core.scheduler import OverrunPolicy, Scheduler, Signal
+
+
+class Easing:
+    """How a keyframe moves toward the next one (see PixelController.play)."""
+
+    STEP = 0  # Hold the keyframe's color for its whole duration
+    LINEAR = 1  # Fade linearly from the keyframe's color to the next keyframe's color
 
 
 class _OperationContext:
@@ -55,6 +62,9 @@ class PixelController:
     _MODE_PULSING = 1
     _MODE_FLASHING = 2
 
+    ANIMATION_PERIOD = 0.04  # seconds (25Hz) while a pulse/flash animation is active
+    _FRAME_MS = 40  # ANIMATION_PERIOD in milliseconds, for keyframe fades
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "PixelController":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -75,6 +85,7 @@ class PixelController:
             cls._instance = cls(pixel=pixel)
         elif pixel is not None:
             cls._instance.pixels = pixel
+            cls._instance._shown = -1  # New hardware: next write must be committed
         return cls._instance
 
     def __init__(self, pixel: Any = None) -> None:
@@ -97,12 +108,19 @@ class PixelController:
         """
         self.logger = logger("wicid.pixel")
 
-        # Initialize the NeoPixel hardware
+        # Initialize the NeoPixel hardware. auto_write is off: set_color() calls show()
+        # itself, and only when the color actually changed (each show() is a
+        # timing-critical transfer with interrupts masked).
         if pixel is None:
-            self.pixels = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.3, auto_write=True)
+            self.pixels = neopixel.NeoPixel(board.NEOPIXEL, 1, brightness=0.3, auto_write=False)
         else:
             self.pixels = pixel
 
+        # Frame diffing: last committed color packed as 0xRRGGBB (-1 = unknown), and a
+        # reusable buffer for writes (NeoPixel copies it, so no tuple per frame)
+        self._shown = -1
+        self._color_buf = [0, 0, 0]
+
         # Animation state (frame-based, not time-based)
         self._mode = self._MODE_SOLID
         self._frame_counter = 0
@@ -114,34 +132,76 @@ class PixelController:
         self._brightness = 0.5
         self._direction = 1
 
+        # Precomputed pulse cycle (see _build_pulse_table): 3 bytes of RGB and one
+        # (brightness, direction) state per frame, so frames are pure lookups
+        self._pulse_rgb = b""
+        self._pulse_states: list[tuple[float, int]] = []
+        self._pulse_loop = 0  # Index the cycle wraps back to after the last entry
+        self._pulse_index = 0
+
         # Flashing parameters
         self._flash_colors = [(0, 0, 255), (0, 255, 0)]  # Blue/Green
         self._flash_frame_duration = 12  # Frames per color change at 25Hz (0.5s per color)
         self._manual_tick_interval = 0.04  # seconds between manual animation ticks
         self._last_manual_tick = 0.0
 
-        # Register LED animation task with scheduler (25Hz = 40ms period)
-        animation_period = 0.04
-        scheduler = Scheduler.instance()
-        self._task_handle = scheduler.schedule_periodic(
+        # LED animation task handle - only registered while a pulse/flash is active
+        self._task_handle: Any = None
+
+        # Wake-up signal of the keyframe sequence being played (None when idle)
+        self._playback: Any = None
+
+        PixelController._initialized = True
+        self.logger.info("PixelController initialized (animation task idle in solid mode)")
+
+    def _set_mode(self, mode: int) -> None:
+        """Switch animation mode, running the animation task only while it has frames to render."""
+        self._mode = mode
+        if mode == self._MODE_SOLID:
+            self._suspend_animation()
+        else:
+            self._resume_animation()
+
+    def _resume_animation(self) -> None:
+        """Register the 25Hz animation task if it is not already running."""
+        if self._task_handle is not None:
+            return
+        self._task_handle = Scheduler.instance().schedule_periodic(
             coroutine=self._animation_task,
-            period=animation_period,
+            period=self.ANIMATION_PERIOD,
             priority=0,  # Highest priority (critical real-time)
             name="LED Animation",
+            resident=True,  # 25Hz - avoid a new asyncio task per frame
+            overrun=OverrunPolicy.SKIP,  # Drop late frames instead of bursting to catch up
         )
 
-        PixelController._initialized = True
-        self.logger.info("PixelController initialized with scheduled animation task")
+    def _suspend_animation(self) -> None:
+        """Cancel the animation task; a solid color needs no frames."""
+        if self._task_handle is None:
+            return
+        Scheduler.instance().cancel(self._task_handle)
+        self._task_handle = None
 
     def set_color(self, rgb: tuple[int, int, int]) -> None:
         try:
             r, g, b = rgb
-            self.pixels[0] = (int(r), int(g), int(b))
-            # Some builds require explicit show
-            if hasattr(self.pixels, "show"):
-                self.pixels.show()
+            self._write(int(r), int(g), int(b))
         except Exception as e:
-            self.logger.warning(f"set_color error: {e}")
+            self.logger.warning("set_color error: %s", e)
+
+    def _write(self, r: int, g: int, b: int) -> None:
+        """Commit a color to the pixel, skipping the write and show() if it is already shown."""
+        packed = (r << 16) | (g << 8) | b
+        if packed == self._shown:
+            return
+        buf = self._color_buf
+        buf[0] = r
+        buf[1] = g
+        buf[2] = b
+        self.pixels[0] = buf
+        if hasattr(self.pixels, "show"):
+            self.pixels.show()
+        self._shown = packed
 
     def off(self) -> None:
         self.set_color((0, 0, 0))
@@ -170,7 +230,7 @@ class PixelController:
         if state is None:
             return
 
-        self._mode = state["mode"]
+        self._set_mode(state["mode"])
         self._pulse_color = state["pulse_color"]
         self._min_b = state["min_b"]
         self._max_b = state["max_b"]
@@ -182,7 +242,8 @@ class PixelController:
 
         # Re-render current frame based on mode
         if self._mode == self._MODE_PULSING:
-            self.set_color(self._apply_brightness(self._pulse_color, self._brightness))
+            self._build_pulse_table()
+            self._show_pulse_frame(0)
         elif self._mode == self._MODE_FLASHING:
             self._render_flash_frame()
         elif self._mode == self._MODE_SOLID:
@@ -197,14 +258,15 @@ class PixelController:
         start_brightness: float = 0.5,
     ) -> None:
         """Internal method to start pulsing animation (frame-based)."""
-        self._mode = self._MODE_PULSING
+        self._set_mode(self._MODE_PULSING)
         self._pulse_color = color
         self._min_b = min_b
         self._max_b = max_b
         self._brightness = start_brightness
         self._direction = 1
         self._frame_counter = 0
-        self.set_color(self._apply_brightness(self._pulse_color, self._brightness))
+        self._build_pulse_table()
+        self._show_pulse_frame(0)
 
     def _start_flashing(self, colors: list[tuple[int, int, int]] | None = None, frame_duration: int = 12) -> None:
         """Internal method to start flashing animation (frame-based).
@@ -213,7 +275,7 @@ class PixelController:
             colors: List of RGB colors to flash between
             frame_duration: Frames per color (at 25Hz, 12 frames = 0.5s per color)
         """
-        self._mode = self._MODE_FLASHING
+        self._set_mode(self._MODE_FLASHING)
         if colors:
             self._flash_colors = colors
         else:
@@ -271,7 +333,7 @@ class PixelController:
 
     def clear(self) -> None:
         """Turn off LED and reset to solid mode."""
-        self._mode = self._MODE_SOLID
+        self._set_mode(self._MODE_SOLID)
         self.off()
 
     def indicate_operation(self, operation_name: str) -> _OperationContext:
@@ -305,17 +367,53 @@ class PixelController:
 
         return _OperationContext(self, operation_method)
 
+    def _build_pulse_table(self) -> None:
+        """
+        Precompute the pulse cycle from the current brightness and direction.
+
+        Runs the brightness recurrence (0.04 step per frame at 25Hz = 1.0 brightness
+        change per second, reversing at min_b/max_b) until a state repeats, which
+        happens within one up/down sweep after the first clamp. Frames then cost
+        an index step and three byte lookups instead of float math, and only
+        changing the pulse parameters rebuilds the table.
+        """
+        color = self._pulse_color
+        min_b = self._min_b
+        max_b = self._max_b
+        states: list[tuple[float, int]] = []
+        rgb = bytearray()
+        seen: dict[tuple[float, int], int] = {}
+        state = (self._brightness, self._direction)
+        while state not in seen:
+            seen[state] = len(states)
+            states.append(state)
+            rgb.extend(self._apply_brightness(color, state[0]))
+            brightness = state[0] + 0.04 * state[1]
+            if brightness >= max_b:
+                state = (max_b, -1)
+            elif brightness <= min_b:
+                state = (min_b, 1)
+            else:
+                state = (brightness, state[1])
+        self._pulse_rgb = bytes(rgb)
+        self._pulse_states = states
+        self._pulse_loop = seen[state]
+        self._pulse_index = 0
+
+    def _show_pulse_frame(self, index: int) -> None:
+        """Show entry index of the pulse table and make it the current brightness/direction."""
+        self._pulse_index = index
+        self._brightness, self._direction = self._pulse_states[index]
+        rgb = self._pulse_rgb
+        i = index * 3
+        self._write(rgb[i], rgb[i + 1], rgb[i + 2])
+
     def _render_pulse_frame(self) -> None:
         """Render one frame of pulsing animation (frame-based, called at 25Hz)."""
-        # Update brightness every frame (0.04 step at 25Hz = 1.0 brightness change per second)
-        self._brightness += 0.04 * self._direction
-        if self._brightness >= self._max_b:
-            self._brightness = self._max_b
-            self._direction = -1
-        elif self._brightness <= self._min_b:
-            self._brightness = self._min_b
-            self._direction = 1
-        self.set_color(self._apply_brightness(self._pulse_color, self._brightness))
+        index = self._pulse_index + 1
+        if index == len(self._pulse_states):
+            index = self._pulse_loop
+        self._show_pulse_frame(index)
 
     def _render_flash_frame(self) -> None:
         """Render one frame of flashing animation (frame-based, called at 25Hz)."""
@@ -338,6 +436,83 @@ class PixelController:
         """
         self._advance_frame()
 
+    async def play(self, keyframes: list[tuple[tuple[int, int, int], int, int]]) -> bool:
+        """
+        Play a keyframe sequence, returning when it ends.
+
+        Each keyframe is (color, duration_ms, easing). Frames are computed from
+        elapsed monotonic time, and between color changes the caller sleeps: once
+        per Easing.STEP keyframe, or every ANIMATION_PERIOD while fading. Any
+        pulse/flash animation is suspended, and the last keyframe's color is
+        left showing. Starting a new sequence stops the current one.
+
+        Args:
+            keyframes: List of (RGB color, duration in ms, Easing value)
+
+        Returns:
+            bool: True if the sequence finished, False if stop() ended it early
+        """
+        self.stop()
+        self._set_mode(self._MODE_SOLID)
+        playback = Signal()
+        self._playback = playback
+        start = time.monotonic()
+        try:
+            while True:
+                # Round to the nearest ms so float error can't add a 1ms wake-up before a boundary
+                wait_ms = self._render_keyframes(keyframes, int((time.monotonic() - start) * 1000 + 0.5))
+                if wait_ms < 0:
+                    return True
+                if await playback.wait(wait_ms / 1000):
+                    return False
+        finally:
+            if self._playback is playback:
+                self._playback = None
+
+    def stop(self) -> None:
+        """End the keyframe sequence being played, if any. Safe to call from button callbacks."""
+        if self._playback is not None:
+            self._playback.set()
+
+    def _render_keyframes(self, keyframes: list[tuple[tuple[int, int, int], int, int]], elapsed_ms: int) -> int:
+        """
+        Show the frame for elapsed_ms into the sequence.
+
+        Returns:
+            int: Milliseconds until the color next changes, or -1 once the sequence is over
+        """
+        segment_start = 0
+        last = len(keyframes) - 1
+        for index in range(last + 1):
+            color, duration, easing = keyframes[index]
+            segment_end = segment_start + duration
+            if elapsed_ms < segment_end:
+                if easing == Easing.LINEAR:
+                    target = keyframes[index + 1][0] if index < last else color
+                    progress = elapsed_ms - segment_start
+                    self._write(
+                        color[0] + (target[0] - color[0]) * progress // duration,
+                        color[1] + (target[1] - color[1]) * progress // duration,
+                        color[2] + (target[2] - color[2]) * progress // duration,
+                    )
+                    return min(self._FRAME_MS, segment_end - elapsed_ms)
+                self._write(color[0], color[1], color[2])
+                return segment_end - elapsed_ms
+            segment_start = segment_end
+        if keyframes:
+            color = keyframes[last][0]
+            self._write(color[0], color[1], color[2])
+        return -1
+
+    @staticmethod
+    def _blink_keyframes(
+        color: tuple[int, int, int], times: int, on_time: float, off_time: float
+    ) -> list[tuple[tuple[int, int, int], int, int]]:
+        """Keyframes for times on/off blinks of color, ending off."""
+        on = (color, int(on_time * 1000), Easing.STEP)
+        off = ((0, 0, 0), int(off_time * 1000), Easing.STEP)
+        return [on, off] * times
+
     async def blink_success(
         self, times: int = 3, on_time: float = 0.5, off_time: float = 0.2, restore_previous_state: bool = True
     ) -> None:
@@ -352,19 +527,14 @@ class PixelController:
         try:
             # Save previous state
             saved_state = self._save_state()
-            self._mode = self._MODE_SOLID
 
-            for _ in range(times):
-                self.set_color((0, 255, 0))
-                await Scheduler.sleep(on_time)
-                self.off()
-                await Scheduler.sleep(off_time)
+            await self.play(self._blink_keyframes((0, 255, 0), times, on_time, off_time))
 
             # Restore previous animation state if requested
             if restore_previous_state:
                 self._restore_state(saved_state)
         except Exception as e:
-            self.logger.warning(f"blink_success error: {e}")
+            self.logger.warning("blink_success error: %s", e)
 
     async def blink_error(
         self, times: int = 3, on_time: float = 0.5, off_time: float = 0.2, restore_previous_state: bool = True
@@ -373,19 +543,14 @@ class PixelController:
         try:
             # Save previous state
             saved_state = self._save_state()
-            self._mode = self._MODE_SOLID
 
-            for _ in range(times):
-                self.set_color((255, 0, 0))
-                await Scheduler.sleep(on_time)
-                self.off()
-                await Scheduler.sleep(off_time)
+            await self.play(self._blink_keyframes((255, 0, 0), times, on_time, off_time))
 
             # Restore previous animation state if requested
             if restore_previous_state:
                 self._restore_state(saved_state)
         except Exception as e:
-            self.logger.warning(f"blink_error error: {e}")
+            self.logger.warning("blink_error error: %s", e)
 
     def manual_tick(self) -> None:
         """
@@ -399,4 +564,4 @@ class PixelController:
         try:
             self._advance_frame()
         except Exception as e:
-            self.logger.debug(f"manual_tick error: {e}")
+            self.logger.debug("manual_tick error: %s", e)
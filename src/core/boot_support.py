@@ -43,7 +43,7 @@ sys.path.insert(0, "/")
 # If they still fail, the device is in an unrecoverable state.
 # -----------------------------------------------------------------------------
 try:
-    from core.logging_helper import configure_logging, logger
+    from core.logging_helper import configure_logging, flush_logs, logger
     from utils.recovery import check_and_restore_from_recovery
     from utils.update_install import process_pending_update
 except ImportError as e:
@@ -116,8 +116,12 @@ def main() -> None:
         log.info("\n→ Rebooting after recovery...")
         # NOTE: time.sleep() is acceptable here - this runs in boot.py before the scheduler is initialized
         time.sleep(2)
+        flush_logs()
         os.sync()
 
         microcontroller.reset()
 
     process_pending_update()
+
+    # Boot log is buffered; make sure it is on flash before code.py reads it
+    flush_logs()
@@ -13,7 +13,7 @@ import microcontroller  # pyright: ignore[reportMissingImports]  # CircuitPython
 sys.path.insert(0, "/")
 
 from controllers.pixel_controller import PixelController
-from core.logging_helper import configure_logging, logger
+from core.logging_helper import configure_logging, flush_logs, logger
 from core.scheduler import Scheduler
 from managers.configuration_manager import ConfigurationManager
 from managers.input_manager import InputManager
@@ -21,7 +21,9 @@ from managers.mode_manager import ModeManager
 from modes import test_mode
 from modes.modes import PrecipDemoMode, SetupPortalMode, TempDemoMode, WeatherMode
 from services.ntp_rtc_service import NTPRTCService
-from utils.utils import trigger_safe_mode
+from utils.utils import mark_startup_time, trigger_safe_mode
+
+mark_startup_time()
 
 # Configure logging from settings
 log_level = os.getenv("LOG_LEVEL", "INFO")
@@ -38,6 +40,13 @@ print("\n" + "=" * 60)
 print("BOOT LOG")
 print("=" * 60)
 APP_LOG.info("Displaying boot log")
+try:
+    # Older half of a rotated boot log, if the log hit its size cap
+    with open("/boot_log.txt.1") as f:
+        print(f.read())
+    os.remove("/boot_log.txt.1")
+except OSError:
+    pass
 try:
     with open("/boot_log.txt") as f:
         print(f.read())
@@ -83,6 +92,8 @@ async def _startup_sequence() -> None:
 
     except Exception as e:
         APP_LOG.critical(f"Fatal error: {e}", exc_info=True)
+        # Get any buffered log lines onto flash before the crash log is written
+        flush_logs()
         try:
             import traceback
 
@@ -3,12 +3,28 @@ Logging Helper - Simple custom logger for WICID.
 
 Provides a straightforward logging solution optimized for CircuitPython.
 Clean, explicit, and easy to extend without fighting library limitations.
+
+File output is buffered per path (see _FileSink) so flash is written and synced
+in batches instead of once per line. Nothing flushes the buffer on a timer: file
+logging runs during boot, before the scheduler exists, so buffered lines are only
+written by the next log call, an ERROR, or flush_logs(). Call flush_logs() before
+a reset, before long blocking work, and when handling a crash, or up to
+LOG_FLUSH_LINES - 1 lines can be lost to a hang or brownout.
+
+Messages accept %-style arguments that are only formatted when the level is
+enabled, so suppressed calls in hot paths cost a comparison instead of building
+a string:
+
+    log.debug("Extracted %s (%d bytes)", name, size)  # no formatting below DEBUG
 """
 
 import os
 import sys
+import time
 import traceback
 
+from core.app_typing import Any
+
 # Global log level
 _log_level = 20  # INFO
 
@@ -25,6 +41,112 @@ _LEVEL_NAMES = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITIC
 # File write error suppression (global to prevent spam across all loggers)
 _LOGGED_FILE_ERROR = False
 
+# File sink tuning
+LOG_FLUSH_LINES = 16  # Flush after this many buffered lines
+LOG_FLUSH_INTERVAL = 2.0  # A write this many seconds after the last flush also flushes (no timer)
+LOG_BUFFER_LINES = 64  # Keep at most this many unflushed lines (oldest dropped if writes keep failing)
+LOG_MAX_BYTES = 32768  # Rotate <file> to <file>.1 when a flush would grow it past this size
+
+# One sink per file path, shared by every logger writing to that file
+_file_sinks: dict = {}
+
+# Logger instances returned by logger(), keyed by (name, log_file)
+_loggers: dict = {}
+
+
+class _FileSink:
+    """
+    Buffered, append-only writer for a single log file.
+
+    Lines are collected in memory and written with a single open/write/sync when
+    LOG_FLUSH_LINES lines are pending, when a write arrives LOG_FLUSH_INTERVAL or more
+    after the last flush, or immediately for ERROR and above. The interval is only
+    checked on write, so the last lines before a long silence stay buffered until
+    flush_logs() is called. Before a flush would push the file past LOG_MAX_BYTES the
+    file is rotated to "<path>.1" (one backup kept).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._pending: list[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, line: str, level: int) -> None:
+        """
+        Buffer a formatted line and flush if any flush condition is met.
+
+        Raises:
+            OSError: If a triggered flush fails (lines stay buffered for the next attempt)
+        """
+        pending = self._pending
+        pending.append(line)
+        if len(pending) > LOG_BUFFER_LINES:
+            del pending[: len(pending) - LOG_BUFFER_LINES]
+
+        if (
+            level >= ERROR
+            or len(pending) >= LOG_FLUSH_LINES
+            or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append all buffered lines to the file and sync.
+
+        Raises:
+            OSError: If the filesystem is read-only or the write fails
+        """
+        if not self._pending:
+            return
+        self._last_flush = time.monotonic()
+        data = "\n".join(self._pending) + "\n"
+        self._rotate_if_needed(len(data))
+        with open(self.path, "a") as f:
+            f.write(data)
+        self._pending = []
+        os.sync()
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        """Move the file to "<path>.1" if appending incoming bytes would exceed LOG_MAX_BYTES."""
+        try:
+            size = os.stat(self.path)[6]
+        except OSError:
+            return  # File does not exist yet
+        if size == 0 or size + incoming <= LOG_MAX_BYTES:
+            return
+
+        backup = self.path + ".1"
+        # Can't use utils.suppress here - utils imports this module
+        try:  # noqa: SIM105
+            os.remove(backup)
+        except OSError:
+            pass  # No previous backup
+        os.rename(self.path, backup)
+
+
+def _get_file_sink(path: str) -> _FileSink:
+    """Return the shared sink for path, creating it on first use."""
+    sink = _file_sinks.get(path)
+    if sink is None:
+        sink = _FileSink(path)
+        _file_sinks[path] = sink
+    return sink
+
+
+def flush_logs() -> None:
+    """
+    Flush every buffered log file.
+
+    Call before microcontroller.reset(), at the end of boot, and from crash
+    handlers. Errors are swallowed so this is always safe to call.
+    """
+    for sink in _file_sinks.values():
+        try:
+            sink.flush()
+        except Exception as e:
+            print(f"! Log flush failed for {sink.path}: {e}")
+
 
 class WicidLogger:
     """
@@ -37,7 +159,8 @@ class WicidLogger:
 
     Example:
         log = logger('wicid.wifi')
-        logger.info("Connected")  # Output: [INFO: Wifi] Connected
+        log.info("Connected")  # Output: [INFO: Wifi] Connected
+        log.debug("RSSI %d on channel %d", rssi, channel)  # Formatted only if DEBUG is enabled
     """
 
     def __init__(self, name: str, log_file: str | None = None) -> None:
@@ -67,39 +190,52 @@ class WicidLogger:
             mod = parts[0]
             self.module = mod[0].upper() + mod[1:] if mod else "Unknown"
 
-    def critical(self, msg: str, exc_info: bool = False) -> None:
+    def critical(self, msg: str, *args: Any, exc_info: bool = False) -> None:
         """Log critical message."""
-        self._log(CRITICAL, msg, exc_info=exc_info)
+        if _log_level <= CRITICAL:
+            self._log(CRITICAL, msg, args, exc_info)
 
-    def debug(self, msg: str, exc_info: bool = False) -> None:
+    def debug(self, msg: str, *args: Any, exc_info: bool = False) -> None:
         """Log a debug message."""
-        self._log(DEBUG, msg, exc_info=exc_info)
+        if _log_level <= DEBUG:
+            self._log(DEBUG, msg, args, exc_info)
 
-    def error(self, msg: str, exc_info: bool = False) -> None:
+    def error(self, msg: str, *args: Any, exc_info: bool = False) -> None:
         """Log error message."""
-        self._log(ERROR, msg, exc_info=exc_info)
+        if _log_level <= ERROR:
+            self._log(ERROR, msg, args, exc_info)
 
-    def info(self, msg: str, exc_info: bool = False) -> None:
+    def info(self, msg: str, *args: Any, exc_info: bool = False) -> None:
         """Log info message."""
-        self._log(INFO, msg, exc_info=exc_info)
+        if _log_level <= INFO:
+            self._log(INFO, msg, args, exc_info)
 
-    def testing(self, msg: str) -> None:
+    def testing(self, msg: str, *args: Any) -> None:
         """
         Log test message at TESTING level.
 
         When global log level is set to TESTING, only testing() messages
         will be displayed, suppressing all other log output (INFO, WARNING, etc.).
         """
-        self._log(TESTING, msg)
+        self._log(TESTING, msg, args)
 
-    def warning(self, msg: str, exc_info: bool = False) -> None:
+    def warning(self, msg: str, *args: Any, exc_info: bool = False) -> None:
         """Log warning message."""
-        self._log(WARNING, msg, exc_info=exc_info)
+        if _log_level <= WARNING:
+            self._log(WARNING, msg, args, exc_info)
 
-    def _log(self, level: int, msg: str, exc_info: bool = False) -> None:
+    def _log(self, level: int, msg: str, args: tuple = (), exc_info: bool = False) -> None:
         """Internal logging method."""
         global _log_level, _LOGGED_FILE_ERROR
         if level >= _log_level:
+            # Apply deferred %-style arguments
+            if args:
+                try:
+                    msg = msg % args
+                except (TypeError, ValueError):
+                    # Mismatched format string - still show everything rather than lose the message
+                    msg = f"{msg} {args}"
+
             # Format message
             if level == TESTING:
                 formatted_msg = msg
@@ -110,12 +246,10 @@ class WicidLogger:
             # Always print to stdout
             print(formatted_msg)
 
-            # Write to file if log_file is set
+            # Buffer for the log file if log_file is set (flushed in batches)
             if self._log_file is not None:
                 try:
-                    with open(self._log_file, "a") as f:
-                        f.write(formatted_msg + "\n")
-                    os.sync()  # Ensure file write is persisted to filesystem
+                    _get_file_sink(self._log_file).write(formatted_msg, level)
                     _LOGGED_FILE_ERROR = False  # Reset on success
                 except OSError as e:
                     # Only print filesystem errors once to avoid spam
@@ -169,7 +303,10 @@ def configure_logging(log_level_str: str = "INFO") -> None:
 
 def logger(name: str = "wicid", log_file: str | None = None) -> WicidLogger:
     """
-    Get a logger instance for the given name.
+    Get the logger instance for the given name.
+
+    Instances are cached, so repeated calls with the same name and log_file
+    return the same object instead of allocating a new logger each time.
 
     Args:
         name: Hierarchical logger name (e.g., 'wicid.wifi')
@@ -182,4 +319,9 @@ def logger(name: str = "wicid", log_file: str | None = None) -> WicidLogger:
         logger("wicid.wifi").info("Connected")
         logger("wicid.boot", log_file="/boot_log.txt").info("Boot message")
     """
-    return WicidLogger(name, log_file=log_file)
+    key = (name, log_file)
+    instance = _loggers.get(key)
+    if instance is None:
+        instance = WicidLogger(name, log_file=log_file)
+        _loggers[key] = instance
+    return instance
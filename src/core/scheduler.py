@@ -1,7 +1,7 @@
 """
 Scheduler subsystem for WICID firmware.
 
-Provides cooperative multitasking with priority-based scheduling, starvation prevention,
+Provides cooperative multitasking with priority-based scheduling, starvation detection,
 and complete asyncio isolation. Only this module imports asyncio.
 
 Architecture: See docs/SCHEDULER_ARCHITECTURE.md
@@ -17,66 +17,172 @@ from core.logging_helper import logger
 
 # Simple min-heap for CircuitPython (lacks heapq module)
 class _MinHeap:
-    """Minimal binary heap for priority queue operations."""
+    """Minimal binary heap for priority queue operations.
+
+    Items must have a ``sort_key`` attribute (compared directly, skipping a
+    Python-level __lt__ call) and a writable ``heap_index`` attribute. The heap
+    keeps heap_index set to the item's current position (-1 once the item leaves
+    the heap), which lets remove() find an item in O(1) and restore order in
+    O(log n).
+    """
 
     def __init__(self) -> None:
         self.heap: list[Any] = []
 
     def push(self, item: Any) -> None:
         """Add item and maintain heap property."""
+        item.heap_index = len(self.heap)
         self.heap.append(item)
-        self._sift_up(len(self.heap) - 1)
+        self._sift_up(item.heap_index)
 
     def pop(self) -> Any:
         """Remove and return smallest item."""
         if not self.heap:
             raise IndexError("pop from empty heap")
-        self.heap[0], self.heap[-1] = self.heap[-1], self.heap[0]
-        item = self.heap.pop()
-        if self.heap:
-            self._sift_down(0)
-        return item
+        return self._remove_at(0)
 
-    def heapify(self) -> None:
-        """Rebuild heap after modifications."""
-        n = len(self.heap)
-        for i in range(n // 2 - 1, -1, -1):
-            self._sift_down(i)
+    def remove(self, item: Any) -> bool:
+        """Remove item from anywhere in the heap.
+
+        Returns:
+            True if the item was in the heap, False otherwise
+        """
+        idx = item.heap_index
+        if idx < 0 or idx >= len(self.heap) or self.heap[idx] is not item:
+            return False
+        self._remove_at(idx)
+        return True
 
     def __len__(self) -> int:
         """Return number of items in heap."""
         return len(self.heap)
 
+    def _remove_at(self, idx: int) -> Any:
+        heap = self.heap
+        item = heap[idx]
+        last = heap.pop()
+        if last is not item:
+            # Fill the hole with the last item, then move it whichever way it belongs
+            heap[idx] = last
+            last.heap_index = idx
+            self._sift_up(idx)
+            self._sift_down(last.heap_index)
+        item.heap_index = -1
+        return item
+
     def _sift_up(self, idx: int) -> None:
+        heap = self.heap
+        item = heap[idx]
+        key = item.sort_key
         while idx > 0:
             parent = (idx - 1) // 2
-            if self.heap[idx] < self.heap[parent]:
-                self.heap[idx], self.heap[parent] = self.heap[parent], self.heap[idx]
+            if key < heap[parent].sort_key:
+                heap[idx] = heap[parent]
+                heap[idx].heap_index = idx
                 idx = parent
             else:
                 break
+        heap[idx] = item
+        item.heap_index = idx
 
     def _sift_down(self, idx: int) -> None:
-        n = len(self.heap)
+        heap = self.heap
+        n = len(heap)
+        item = heap[idx]
         while True:
             smallest = idx
+            smallest_item = item
             left = 2 * idx + 1
-            right = 2 * idx + 2
-            if left < n and self.heap[left] < self.heap[smallest]:
+            right = left + 1
+            if left < n and heap[left].sort_key < smallest_item.sort_key:
                 smallest = left
-            if right < n and self.heap[right] < self.heap[smallest]:
+                smallest_item = heap[left]
+            if right < n and heap[right].sort_key < smallest_item.sort_key:
                 smallest = right
-            if smallest != idx:
-                self.heap[idx], self.heap[smallest] = self.heap[smallest], self.heap[idx]
-                idx = smallest
-            else:
+                smallest_item = heap[right]
+            if smallest == idx:
                 break
+            heap[idx] = smallest_item
+            smallest_item.heap_index = idx
+            idx = smallest
+        heap[idx] = item
+        item.heap_index = idx
+
+
+class _Histogram:
+    """Fixed-bucket histogram of timings in milliseconds.
+
+    Buckets are allocated once per instance; record() only updates counters in
+    place so it can run on every task execution without building lists or dicts.
+    Percentiles are estimated as the upper bound of the bucket that contains them.
+    """
+
+    # Upper bound (ms, inclusive) of each bucket; a final overflow bucket holds anything larger
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+    __slots__ = ("counts", "count", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one sample (negative values are clamped to zero)."""
+        ms = seconds * 1000 if seconds > 0 else 0.0
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self.count += 1
+
+        bounds = self.BOUNDS_MS
+        n = len(bounds)
+        i = 0
+        while i < n and ms > bounds[i]:
+            i += 1
+        self.counts[i] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate the given percentile (0.0-1.0) in milliseconds."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        bounds = self.BOUNDS_MS
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                if i < len(bounds):
+                    return min(float(bounds[i]), self.max_ms)
+                break
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any]:
+        """Return counts plus max/p95/p99 estimates."""
+        return {
+            "count": self.count,
+            "max_ms": self.max_ms,
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": list(self.counts),
+        }
+
+    def compact(self) -> list[Any]:
+        """Return [count, max_ms, p95_ms, p99_ms, buckets] with times rounded to 0.1ms."""
+        return [
+            self.count,
+            round(self.max_ms, 1),
+            round(self.percentile(0.95), 1),
+            round(self.percentile(0.99), 1),
+            list(self.counts),
+        ]
 
 
 # Simple enum for CircuitPython (lacks enum module)
 class _EnumMember:
     """Simple enum member for CircuitPython compatibility."""
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: Any) -> None:
         self.name = name
         self.value = value
@@ -129,12 +235,37 @@ class TaskFatalError(Exception):
     pass
 
 
+# Small-int task kinds stored on Task (compared on every run, so ints rather than names)
+_PERIODIC = 1
+_ONE_SHOT = 2
+_RECURRING = 3
+
+_KIND_NAMES = {_PERIODIC: "PERIODIC", _ONE_SHOT: "ONE_SHOT", _RECURRING: "RECURRING"}
+_KINDS_BY_NAME = {name: kind for kind, name in _KIND_NAMES.items()}
+
+# Sort-key stand-in for next_run_time=None (unscheduled tasks sort first)
+_UNSCHEDULED = float("-inf")
+
+
 class TaskType:
     """Task scheduling type (CircuitPython-compatible)."""
 
-    PERIODIC = _EnumMember("PERIODIC", 1)  # Fixed-rate: next_run = last_scheduled + period
-    ONE_SHOT = _EnumMember("ONE_SHOT", 2)  # Run once after delay
-    RECURRING = _EnumMember("RECURRING", 3)  # Interval starts after task completes
+    PERIODIC = _EnumMember("PERIODIC", _PERIODIC)  # Fixed-rate: next_run = last_scheduled + period
+    ONE_SHOT = _EnumMember("ONE_SHOT", _ONE_SHOT)  # Run once after delay
+    RECURRING = _EnumMember("RECURRING", _RECURRING)  # Interval starts after task completes
+
+
+class OverrunPolicy:
+    """What a periodic task does after a run overruns its next due time (CircuitPython-compatible)."""
+
+    DRIFT = _EnumMember("DRIFT", 1)  # Run once immediately, then continue the period from now
+    SKIP = _EnumMember("SKIP", 2)  # Drop missed periods; resume on the original time grid
+    CATCH_UP = _EnumMember("CATCH_UP", 3)  # Run every missed period back to back
+
+
+_DRIFT = OverrunPolicy.DRIFT.value
+_SKIP = OverrunPolicy.SKIP.value
+_CATCH_UP = OverrunPolicy.CATCH_UP.value
 
 
 class TaskHandle:
@@ -144,6 +275,8 @@ class TaskHandle:
     Do not construct directly.
     """
 
+    __slots__ = ("task_id",)
+
     _next_id = 0
 
     def __init__(self, task_id: int) -> None:
@@ -160,8 +293,78 @@ class TaskHandle:
         return task_id
 
 
+class Signal:
+    """Flag a coroutine can sleep on and another task or callback can set to wake it early.
+
+    Lets code outside this module wait "until a deadline or until something
+    happens" without polling and without touching asyncio directly. Create it
+    from code running inside the event loop.
+    """
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    def set(self) -> None:
+        """Wake any waiter; wait() returns immediately until clear() is called."""
+        self._event.set()
+
+    def clear(self) -> None:
+        """Reset the flag so the next wait() sleeps again."""
+        self._event.clear()
+
+    def is_set(self) -> bool:
+        """Return True if set() was called since the last clear()."""
+        return self._event.is_set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds.
+
+        Returns:
+            bool: True if set() ended the wait, False if the timeout elapsed
+        """
+        if self._event.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:  # noqa: UP041 - CircuitPython's asyncio defines its own TimeoutError
+            return False
+
+
 class Task:
-    """Task abstraction encapsulating scheduling metadata and execution state."""
+    """Task abstraction encapsulating scheduling metadata and execution state.
+
+    Uses __slots__ to keep per-task memory small. The heap ordering key
+    (next_run_time, priority, task_id) is kept precomputed in sort_key and
+    refreshed whenever next_run_time is set. priority is fixed at creation:
+    waiting tasks are no longer boosted, since the due time already orders them.
+    """
+
+    __slots__ = (
+        "task_id",
+        "name",
+        "priority",
+        "coroutine_factory",
+        "kind",
+        "timing_param",
+        "_next_run_time",
+        "sort_key",
+        "last_run_time",
+        "last_scheduled_time",
+        "execution_count",
+        "total_runtime",
+        "cancelled",
+        "resident",
+        "overrun",
+        "deadline",
+        "missed_deadlines",
+        "skipped_runs",
+        "heap_index",
+        "lateness",
+        "duration",
+    )
 
     def __init__(
         self,
@@ -184,30 +387,46 @@ class Task:
         self.name = name
         self.priority = priority
         self.coroutine_factory = coroutine_factory
-        self.task_type = task_type.name if hasattr(task_type, "name") else str(task_type)
+        self.kind = task_type.value if hasattr(task_type, "value") else _KINDS_BY_NAME[str(task_type)]
         self.timing_param = timing_param
 
         # Runtime state
-        self.next_run_time: float | None = None  # Monotonic timestamp
-        self.ready_since: float | None = None  # For starvation prevention
-        self.effective_priority = priority
+        self._next_run_time: float | None = None  # Monotonic timestamp
+        self.sort_key = (_UNSCHEDULED, priority, self.task_id)
         self.last_run_time: float | None = None
         self.last_scheduled_time: float | None = None  # For fixed-rate periodic tasks
         self.execution_count = 0
         self.total_runtime = 0.0
         self.cancelled = False
+        self.resident = False  # Periodic task driven by one long-lived coroutine (see schedule_periodic)
+        self.overrun = _DRIFT  # OverrunPolicy value (periodic tasks)
+        self.deadline: float | None = None  # Max seconds from due time to completion (None = not tracked)
+        self.missed_deadlines = 0
+        self.skipped_runs = 0  # Periods dropped by OverrunPolicy.SKIP
+        self.heap_index = -1  # Position in the scheduler's ready queue (-1 while not queued)
+
+        # Timing histograms (allocated once, updated in place on every run)
+        self.lateness = _Histogram()  # Actual start minus next_run_time
+        self.duration = _Histogram()  # Wall time from start to completion
+
+    @property
+    def task_type(self) -> str:
+        """Task type name ("PERIODIC", "ONE_SHOT" or "RECURRING")."""
+        return _KIND_NAMES[self.kind]
+
+    @property
+    def next_run_time(self) -> float | None:
+        """Monotonic time the task is next due (None until scheduled)."""
+        return self._next_run_time
+
+    @next_run_time.setter
+    def next_run_time(self, value: float | None) -> None:
+        self._next_run_time = value
+        self.sort_key = (_UNSCHEDULED if value is None else value, self.priority, self.task_id)
 
     def __lt__(self, other: "Task") -> bool:
-        """Comparison for heap ordering: (next_run_time, effective_priority, task_id)."""
-        if self.next_run_time != other.next_run_time:
-            if self.next_run_time is None:
-                return True  # None sorts before any value
-            if other.next_run_time is None:
-                return False  # Any value sorts after None
-            return self.next_run_time < other.next_run_time
-        if self.effective_priority != other.effective_priority:
-            return self.effective_priority < other.effective_priority
-        return self.task_id < other.task_id
+        """Comparison for heap ordering: (next_run_time, priority, task_id)."""
+        return self.sort_key < other.sort_key
 
     def __repr__(self) -> str:
         return f"Task(id={self.task_id}, name='{self.name}', pri={self.priority}, type={self.task_type})"
@@ -217,18 +436,25 @@ class Scheduler:
     """Cooperative multitasking scheduler with priority-based scheduling.
 
     Singleton facade over asyncio. Provides unified task scheduling API
-    with starvation prevention and error handling.
+    with starvation detection and error handling.
+
+    Fairness comes from the heap order: tasks are keyed by due time first, so a
+    task that has been waiting sorts ahead of everything that became due after
+    it, whatever its priority. Priority only orders tasks due at the same
+    instant, and those have always waited equally long, so aging them would not
+    change the order. Instead, each task's wait is checked once when it is
+    popped, and waits over MAX_STARVATION_TIME are counted and logged.
     """
 
     _instance = None
 
     # Configuration
-    MAX_STARVATION_TIME = 60.0  # seconds
-    STARVATION_PRIORITY_BOOST = 30  # priority points
+    MAX_STARVATION_TIME = 60.0  # seconds; longer waits past the due time are reported as starvation
     TASK_WARNING_THRESHOLD_MS = 100  # milliseconds
     FALL_BEHIND_DEBUG_THRESHOLD = 30.0  # seconds
     FALL_BEHIND_INFO_THRESHOLD = 120.0  # seconds
     FALL_BEHIND_WARNING_THRESHOLD = 180.0  # seconds
+    WAKEABLE_IDLE_MIN = 0.02  # seconds; shorter idle waits use a plain sleep (cheaper than an event wait)
 
     def __new__(cls) -> "Scheduler":
         if cls._instance is None:
@@ -273,10 +499,16 @@ class Scheduler:
         self.total_tasks_scheduled = 0
         self.total_tasks_executed = 0
         self.total_tasks_failed = 0
+        self.total_tasks_starved = 0
+
+        self.total_idle_waits = 0
 
         # Event loop (set after run_forever starts)
         self._active_asyncio_tasks: set[Any] = set()
         self._fatal_error: Any = None
+        self._wake_event: Any = None  # asyncio.Event, created inside the running loop
+        self._idle = False  # True while the event loop is waiting for the next deadline
+        self._idle_until: float | None = None  # Deadline of the current idle wait (None = no deadline)
         self._initialized: bool = True
         self.logger.info("Scheduler initialized")
 
@@ -304,18 +536,48 @@ class Scheduler:
         return factory
 
     def schedule_periodic(
-        self, coroutine: Any, period: float, priority: int = 50, name: str = "Unnamed Task"
+        self,
+        coroutine: Any,
+        period: float,
+        priority: int = 50,
+        name: str = "Unnamed Task",
+        resident: bool = False,
+        overrun: Any = None,
+        deadline: float | None = None,
     ) -> TaskHandle:
         """Schedule a task to run every N seconds at fixed rate.
 
         Uses fixed-rate scheduling: next run = last_scheduled_time + period.
         Prevents drift for timing-sensitive tasks like LED animations.
 
+        By default every run is dispatched through the ready queue as a new
+        asyncio task. With resident=True the first run is dispatched normally and
+        then a single long-lived coroutine keeps calling the task, sleeping until
+        each deadline itself. That saves the per-run asyncio task, wrapper
+        coroutines and heap push/pop, which matters for high-rate tasks (button
+        sampling, LED animation). Timing stats, error handling and cancel()
+        behave the same; a cancelled resident task stops at its next deadline.
+
+        A run that finishes more than deadline seconds after its due time
+        (default: one period) counts as a missed deadline. If the next due time
+        has already passed when a run finishes, the overrun policy decides what
+        happens:
+        - OverrunPolicy.DRIFT (default): run once immediately and continue the
+          period from now.
+        - OverrunPolicy.SKIP: drop the missed periods (counted in skipped_runs)
+          and resume on the original time grid. Suited to frame-like work
+          (animation, input polling) where a late frame is worthless.
+        - OverrunPolicy.CATCH_UP: run every missed period back to back. A long
+          stall produces a burst of runs.
+
         Args:
             coroutine: Async callable to execute (pass the async function without calling it)
             period: Seconds between executions (fixed-rate)
             priority: Task priority (0-90, lower = higher priority)
             name: Human-readable task identifier
+            resident: Keep one coroutine looping instead of dispatching each run
+            overrun: OverrunPolicy member (default OverrunPolicy.DRIFT)
+            deadline: Seconds from due time to completion before a run counts as missed
 
         Returns:
             TaskHandle for cancellation/management
@@ -331,6 +593,9 @@ class Scheduler:
         """
         factory = self._make_coroutine_factory(coroutine)
         task = Task(name, priority, factory, TaskType.PERIODIC, period)
+        task.resident = resident
+        task.overrun = (overrun or OverrunPolicy.DRIFT).value
+        task.deadline = deadline if deadline is not None else period
         task.next_run_time = time.monotonic()  # Run immediately
         task.last_scheduled_time = task.next_run_time
 
@@ -408,7 +673,11 @@ class Scheduler:
         task = self.task_registry.get(handle.task_id)
         if task and not task.cancelled:
             task.cancelled = True
-            self.logger.info(f"Cancelled task '{task.name}' (id={task.task_id})")
+            if self.ready_queue.remove(task):
+                # Queued: drop it now. A running task is dropped when it would be rescheduled.
+                del self.task_registry[task.task_id]
+            self.logger.info("Cancelled task '%s' (id=%d)", task.name, task.task_id)
+            self._wake()
             return True
         return False
 
@@ -449,80 +718,110 @@ class Scheduler:
         self.task_registry[task.task_id] = task
         self.ready_queue.push(task)
         self.total_tasks_scheduled += 1
+        self._wake(task.next_run_time)
 
         self.logger.info(
-            f"Registered task '{task.name}' "
-            f"(id={task.task_id}, priority={task.priority}, "
-            f"type={task.task_type}, param={task.timing_param}s)"
+            "Registered task '%s' (id=%d, priority=%d, type=%s, param=%ss)",
+            task.name,
+            task.task_id,
+            task.priority,
+            task.task_type,
+            task.timing_param,
         )
 
     def _reschedule_task(self, task: Task) -> None:
         """Reschedule a task based on its type."""
+        if task.cancelled:
+            # Cancelled while running - retire it instead of re-queueing
+            self.task_registry.pop(task.task_id, None)
+            return
+
         now = time.monotonic()
 
-        if task.task_type == TaskType.PERIODIC.name:
+        kind = task.kind
+        if kind == _PERIODIC:
             # Fixed-rate: next run = last_scheduled + period
             if task.last_scheduled_time is None:
                 task.last_scheduled_time = time.monotonic()
             task.last_scheduled_time += task.timing_param
             task.next_run_time = task.last_scheduled_time
 
-            # If we fell behind, catch up (run immediately)
+            # If we fell behind, apply the task's overrun policy
             if task.next_run_time < now:
                 delay = now - task.next_run_time
                 if delay >= self.FALL_BEHIND_WARNING_THRESHOLD:
-                    self.logger.warning(f"Task '{task.name}' fell behind schedule (behind by {delay:.3f}s)")
+                    self.logger.warning("Task '%s' fell behind schedule (behind by %.3fs)", task.name, delay)
                 elif delay >= self.FALL_BEHIND_INFO_THRESHOLD:
-                    self.logger.info(f"Task '{task.name}' fell behind schedule (behind by {delay:.3f}s)")
+                    self.logger.info("Task '%s' fell behind schedule (behind by %.3fs)", task.name, delay)
                 elif delay >= self.FALL_BEHIND_DEBUG_THRESHOLD:
-                    self.logger.debug(f"Task '{task.name}' fell behind schedule (behind by {delay:.3f}s)")
-                task.next_run_time = now
-                task.last_scheduled_time = now
-
-        elif task.task_type == TaskType.RECURRING.name:
+                    self.logger.debug("Task '%s' fell behind schedule (behind by %.3fs)", task.name, delay)
+
+                period = task.timing_param
+                if task.overrun == _SKIP and period > 0:
+                    # Jump to the first grid point after now
+                    skipped = int(delay // period) + 1
+                    task.skipped_runs += skipped
+                    task.last_scheduled_time += skipped * period
+                    task.next_run_time = task.last_scheduled_time
+                elif task.overrun != _CATCH_UP:
+                    # Drift: run immediately and restart the period from now
+                    task.next_run_time = now
+                    task.last_scheduled_time = now
+
+            if task.resident:
+                return  # Its resident loop sleeps until next_run_time itself
+
+        elif kind == _RECURRING:
             # Interval starts after completion
             task.next_run_time = now + task.timing_param
 
-        elif task.task_type == TaskType.ONE_SHOT.name:
-            # Don't reschedule one-shot tasks
+        elif kind == _ONE_SHOT:
+            # Finished - retire it like a cancelled task
+            self.task_registry.pop(task.task_id, None)
             return
 
-        # Reset starvation tracking
-        task.ready_since = None
-        task.effective_priority = task.priority
-
         # Re-add to queue
         self.ready_queue.push(task)
+        self._wake(task.next_run_time)
 
-    def _apply_starvation_prevention(self) -> None:
-        """Check for starved tasks and boost their priority."""
-        now = time.monotonic()
-
-        for task in self.ready_queue.heap:
-            if task.cancelled:
-                continue
-
-            # Track when task became ready
-            if task.ready_since is None and task.next_run_time <= now:
-                task.ready_since = now
+    def _wake(self, deadline: float | None = None) -> None:
+        """Wake the idle event loop if work is due before its planned wake-up.
 
-            # Check for starvation
-            if task.ready_since is not None:
-                waiting_time = now - task.ready_since
-
-                if waiting_time > self.MAX_STARVATION_TIME:
-                    # Boost priority
-                    old_priority = task.effective_priority
-                    task.effective_priority = max(0, task.priority - self.STARVATION_PRIORITY_BOOST)
+        Args:
+            deadline: Monotonic time new work becomes due (None always wakes)
+        """
+        if not self._idle or self._wake_event is None:
+            return  # Loop is running and will see the heap change itself
+        if deadline is None or self._idle_until is None or deadline < self._idle_until:
+            self._wake_event.set()
 
-                    if old_priority != task.effective_priority:
-                        self.logger.info(
-                            f"Task '{task.name}' starved for {waiting_time:.1f}s, "
-                            f"boosted priority {old_priority} → {task.effective_priority}"
-                        )
+    async def _wait_until(self, deadline: float | None) -> None:
+        """Idle until deadline or until _wake() signals new work.
 
-        # Re-heapify to apply priority changes
-        self.ready_queue.heapify()
+        Args:
+            deadline: Monotonic time to wake up at (None waits for a wake signal only)
+        """
+        self.total_idle_waits += 1
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= self.WAKEABLE_IDLE_MIN:
+                # Too short to be worth an event wait; new work is at most this late
+                await asyncio.sleep(max(0.0, timeout))
+                return
+
+        event = self._wake_event
+        event.clear()
+        self._idle = True
+        self._idle_until = deadline
+        try:
+            if deadline is None:
+                await event.wait()
+            else:
+                await asyncio.wait_for(event.wait(), deadline - time.monotonic())
+        except asyncio.TimeoutError:  # noqa: UP041 - CircuitPython's asyncio defines its own TimeoutError
+            pass
+        finally:
+            self._idle = False
 
     # -------------------------------------------------------------------------
     # Internal: Task Execution
@@ -531,6 +830,9 @@ class Scheduler:
     async def _run_task(self, task: Task) -> None:
         """Execute a single task with error handling."""
         start_time = time.monotonic()
+        due = task.next_run_time
+        if due is not None:
+            task.lateness.record(start_time - due)
 
         try:
             # Disable debug logging for tasks to reduce noise
@@ -551,8 +853,10 @@ class Scheduler:
             runtime_ms = runtime * 1000
             if runtime_ms > self.TASK_WARNING_THRESHOLD_MS:
                 self.logger.debug(
-                    f"Task '{task.name}' exceeded {self.TASK_WARNING_THRESHOLD_MS}ms "
-                    f"CPU time (actual={runtime_ms:.1f}ms)"
+                    "Task '%s' exceeded %sms CPU time (actual=%.1fms)",
+                    task.name,
+                    self.TASK_WARNING_THRESHOLD_MS,
+                    runtime_ms,
                 )
 
             # Disable debug logging for task completion to reduce noise
@@ -560,41 +864,67 @@ class Scheduler:
             #     f"Task '{task.name}' completed in {runtime_ms:.1f}ms (total executions: {task.execution_count})"
             # )
 
-            # Reschedule if periodic/recurring
-            if task.task_type in (TaskType.PERIODIC.name, TaskType.RECURRING.name):
-                self._reschedule_task(task)
+            # Reschedule if periodic/recurring, retire if one-shot
+            self._reschedule_task(task)
 
         except TaskNonFatalError as e:
             # Task failed, but system continues
-            self.logger.error(f"Task '{task.name}' failed (non-fatal): {e}")
+            self.logger.error("Task '%s' failed (non-fatal): %s", task.name, e)
             self.total_tasks_failed += 1
 
-            # Reschedule periodic/recurring tasks
-            if task.task_type in (TaskType.PERIODIC.name, TaskType.RECURRING.name):
-                self._reschedule_task(task)
+            # Reschedule periodic/recurring tasks, retire one-shots
+            self._reschedule_task(task)
 
         except TaskFatalError as e:
             # System integrity compromised
-            self.logger.critical(f"FATAL error in task '{task.name}': {e}")
+            self.logger.critical("FATAL error in task '%s': %s", task.name, e)
             self.logger.critical("System stability compromised - propagating to main loop")
             raise  # Re-raise to enclosing wrapper
 
         except Exception as e:
             # Unknown exception - treat as non-fatal by default
-            self.logger.error(f"Task '{task.name}' raised unexpected exception: {e}", exc_info=True)
+            self.logger.error("Task '%s' raised unexpected exception: %s", task.name, e, exc_info=True)
             self.total_tasks_failed += 1
 
-            # Reschedule periodic/recurring tasks
-            if task.task_type in (TaskType.PERIODIC.name, TaskType.RECURRING.name):
-                self._reschedule_task(task)
+            # Reschedule periodic/recurring tasks, retire one-shots
+            self._reschedule_task(task)
+
+        finally:
+            end_time = time.monotonic()
+            task.duration.record(end_time - start_time)
+            if task.deadline is not None and due is not None and end_time - due > task.deadline:
+                task.missed_deadlines += 1
+
+    async def _run_resident(self, task: Task) -> None:
+        """Run a resident periodic task until it is cancelled.
+
+        Reuses _run_task for each run (stats, error handling, next_run_time via
+        _reschedule_task, which also retires the task once cancelled) and sleeps
+        until the next deadline in between instead of going back through the queue.
+        """
+        while True:
+            await self._run_task(task)
+            if task.cancelled:
+                return
+            next_run = task.next_run_time
+            delay = next_run - time.monotonic() if next_run is not None else 0.0
+            await asyncio.sleep(delay if delay > 0 else 0)
+            if task.cancelled:
+                # Cancelled between runs - retire without running again
+                self.task_registry.pop(task.task_id, None)
+                return
 
     async def _task_wrapper(self, task: Task) -> None:
         """Wrapper around _run_task that tracks asyncio task lifecycle."""
         try:
-            await self._run_task(task)
+            if task.resident:
+                await self._run_resident(task)
+            else:
+                await self._run_task(task)
         except TaskFatalError as fatal_error:
             # Capture fatal error so main loop can exit cleanly
             self._fatal_error = fatal_error
+            self._wake()
         finally:
             # Remove from active task set
             current = asyncio.current_task()
@@ -605,45 +935,45 @@ class Scheduler:
         """Main scheduler event loop."""
         self.logger.info("Scheduler event loop started")
 
-        last_starvation_check = time.monotonic()
+        self._wake_event = asyncio.Event()
+        dispatched = False  # Tasks were started since the last idle wait
 
         while True:
             if self._fatal_error is not None:
                 raise self._fatal_error
 
-            # Periodic starvation prevention check (every 10 seconds)
-            now = time.monotonic()
-            if now - last_starvation_check > 10.0:
-                self._apply_starvation_prevention()
-                last_starvation_check = now
-
             # Get next ready task
             if not self.ready_queue.heap:
-                # No tasks scheduled - wait briefly
-                await asyncio.sleep(0.1)
+                # No tasks scheduled - idle until something is scheduled
+                await self._wait_until(None)
                 continue
 
             # Peek at next task
             next_task = self.ready_queue.heap[0]
 
-            # Skip cancelled tasks
-            if next_task.cancelled:
-                self.ready_queue.pop()
-                del self.task_registry[next_task.task_id]
-                continue
-
             # Check if task is ready to run
             now = time.monotonic()
             if next_task.next_run_time > now:
-                # Sleep until next task is ready
-                sleep_time = min(next_task.next_run_time - now, 0.1)
-                await asyncio.sleep(sleep_time)
+                if dispatched:
+                    # Let just-started tasks run (and reschedule) before picking a deadline
+                    dispatched = False
+                    await asyncio.sleep(0)
+                    continue
+                # Tickless idle: sleep until the next deadline (woken early by new work)
+                await self._wait_until(next_task.next_run_time)
                 continue
 
+            # Starvation check: how long the task waited past its due time
+            waited = now - next_task.next_run_time
+            if waited > self.MAX_STARVATION_TIME:
+                self.total_tasks_starved += 1
+                self.logger.warning("Task '%s' starved for %.1fs past its due time", next_task.name, waited)
+
             # Remove task from queue and execute asynchronously
             task = self.ready_queue.pop()
             asyncio_task = asyncio.create_task(self._task_wrapper(task))
             self._active_asyncio_tasks.add(asyncio_task)
+            dispatched = True
 
     # -------------------------------------------------------------------------
     # Public API: Scheduler Lifecycle
@@ -661,9 +991,9 @@ class Scheduler:
         """
         self.logger.debug("Starting scheduler event loop...")
         self.logger.debug(
-            f"Configuration: MAX_STARVATION_TIME={self.MAX_STARVATION_TIME}s, "
-            f"STARVATION_PRIORITY_BOOST={self.STARVATION_PRIORITY_BOOST}, "
-            f"TASK_WARNING_THRESHOLD_MS={self.TASK_WARNING_THRESHOLD_MS}ms"
+            "Configuration: MAX_STARVATION_TIME=%ss, TASK_WARNING_THRESHOLD_MS=%sms",
+            self.MAX_STARVATION_TIME,
+            self.TASK_WARNING_THRESHOLD_MS,
         )
 
         try:
@@ -673,7 +1003,7 @@ class Scheduler:
             # Re-raise fatal errors to caller
             raise
         except Exception as e:
-            self.logger.critical(f"Scheduler event loop crashed: {e}", exc_info=True)
+            self.logger.critical("Scheduler event loop crashed: %s", e, exc_info=True)
             raise
 
     # -------------------------------------------------------------------------
@@ -684,33 +1014,66 @@ class Scheduler:
         """Return lightweight snapshot of scheduler state for debugging.
 
         Returns:
-            dict: Scheduler statistics and queued task information
+            dict: Scheduler statistics, queued tasks, and resident tasks (which
+            run outside the queue), each with the same per-task fields
         """
-        snapshot = []
         now = time.monotonic()
-
-        for task in self.ready_queue.heap:
-            snapshot.append(
-                {
-                    "id": task.task_id,
-                    "name": task.name,
-                    "priority": task.priority,
-                    "next_in": task.next_run_time - now,
-                    "effective_priority": task.effective_priority,
-                    "ready_since": task.ready_since,
-                    "execution_count": task.execution_count,
-                    "last_run": task.last_run_time,
-                    "total_runtime": task.total_runtime,
-                }
-            )
+        snapshot = [self._snapshot_task(task, now) for task in self.ready_queue.heap]
+        resident = [
+            self._snapshot_task(task, now)
+            for task in self.task_registry.values()
+            if task.resident and task.heap_index < 0 and not task.cancelled
+        ]
 
         return {
             "tasks_scheduled": self.total_tasks_scheduled,
             "tasks_executed": self.total_tasks_executed,
             "tasks_failed": self.total_tasks_failed,
+            "tasks_starved": self.total_tasks_starved,
+            "idle_waits": self.total_idle_waits,
             "queued_tasks": snapshot,
+            "resident_tasks": resident,
         }
 
+    @staticmethod
+    def _snapshot_task(task: Task, now: float) -> dict[str, Any]:
+        """Return the dump_state() entry for one task."""
+        next_run_time = task.next_run_time if task.next_run_time is not None else now
+        return {
+            "id": task.task_id,
+            "name": task.name,
+            "priority": task.priority,
+            "next_in": next_run_time - now,
+            "ready_since": next_run_time if next_run_time <= now else None,
+            "execution_count": task.execution_count,
+            "last_run": task.last_run_time,
+            "total_runtime": task.total_runtime,
+            "missed_deadlines": task.missed_deadlines,
+            "skipped_runs": task.skipped_runs,
+            "lateness": task.lateness.summary(),
+            "duration": task.duration.summary(),
+        }
+
+    def export_metrics(self) -> dict[str, Any]:
+        """Return compact, JSON-serializable timing histograms for all live tasks.
+
+        Intended for remote fetching (setup portal, serial console), so it uses
+        positional lists instead of verbose per-field keys.
+
+        Returns:
+            dict: {"bounds_ms": [...], "tasks": [[id, name, runs, lateness, duration], ...]}
+            where lateness/duration are [count, max_ms, p95_ms, p99_ms, buckets]
+            and buckets has one more entry than bounds_ms (overflow).
+        """
+        tasks = []
+        for task in self.task_registry.values():
+            if task.cancelled:
+                continue
+            tasks.append(
+                [task.task_id, task.name, task.execution_count, task.lateness.compact(), task.duration.compact()]
+            )
+        return {"bounds_ms": list(_Histogram.BOUNDS_MS), "tasks": tasks}
+
     def describe(self) -> str:
         """Return human-readable snapshot useful for REPL debugging.
 
@@ -728,14 +1091,15 @@ class Scheduler:
             lines.append("  Queued Tasks:")
             for task in state["queued_tasks"]:
                 lines.append(
-                    "    - {name} (id={task_id}, pri={priority}, effective={effective}, next_in={next_in:.3f}s)".format(
+                    "    - {name} (id={task_id}, pri={priority}, next_in={next_in:.3f}s)".format(
                         name=task["name"],
                         task_id=task["id"],
                         priority=task["priority"],
-                        effective=task["effective_priority"],
                         next_in=task["next_in"],
                     )
                 )
+        if state["resident_tasks"]:
+            lines.append("  Resident Tasks: " + ", ".join(task["name"] for task in state["resident_tasks"]))
         return "\n".join(lines)
 
     def __str__(self) -> str:
@@ -375,6 +375,19 @@ class PortalRoutes:
                 request, "Could not connect to network.", field="password", code=500, text="Internal Server Error"
             )
 
+    def handle_scheduler_stats(self, request: Request) -> Response:
+        """Return scheduler timing histograms (lateness and duration per task)."""
+        try:
+            from core.scheduler import Scheduler
+
+            return self.config._json_ok(request, Scheduler.instance().export_metrics())
+
+        except Exception as e:
+            self.logger.error(f"Error in /scheduler-stats: {e}")
+            return self.config._json_error(
+                request, "Could not read scheduler statistics.", code=500, text="Internal Server Error"
+            )
+
     def register_routes(self, server: Any) -> None:
         """
         Register all route handlers with the HTTP server.
@@ -393,6 +406,7 @@ class PortalRoutes:
         server.route("/activate", "POST")(self.handle_activate)
         server.route("/update-now", "POST")(self.handle_update_now)
         server.route("/update-status", "GET")(self.handle_update_status)
+        server.route("/scheduler-stats", "GET")(self.handle_scheduler_stats)
 
         # Consolidated captive portal detection endpoints
         for path in self.CAPTIVE_PORTAL_PATHS:
@@ -17,6 +17,7 @@ from managers.configuration.states import PendingCredentials, PortalState, Updat
 from managers.connection_manager import ConnectionManager
 from managers.manager_base import ManagerBase
 from services.dns_interceptor_service import DNSInterceptorService as DNSInterceptor
+from services.weather_service import WeatherService
 from utils.utils import suppress
 
 
@@ -558,6 +559,9 @@ class ConfigurationManager(ManagerBase):
                 json.dump(secrets, f)
             os.sync()
 
+            # Drop the persisted geocode if the ZIP changed
+            WeatherService.invalidate_location_cache(zip_code)
+
             # Clear ConnectionManager's credentials cache to force reload on next access
             if self.connection_manager:
                 self.connection_manager.clear_credentials_cache()
@@ -1,11 +1,12 @@
 """
-InputManager - Event-driven button handling using ButtonController polling.
+InputManager - Event-driven button handling on top of a ButtonController backend.
 
 Responsibilities:
 - Single press detection
 - Long press detection (3s for setup, 10s for safe mode)
 - Callback registration for button events
-- Integration with scheduler for async monitoring
+- Integration with scheduler for async monitoring (draining keypad events at a low
+  rate, or sampling the pin at 100Hz when only the polling backend is available)
 
 Only this module (and `button_controller.py`) should interact with the physical button
 hardware. Other components register callbacks for button events via InputManager.
@@ -15,10 +16,10 @@ Architecture: See docs/SCHEDULER_ARCHITECTURE.md
 
 import time
 
-from controllers.button_controller import ButtonController
+from controllers.button_controller import create_button_controller
 from core.app_typing import Any, Callable
 from core.logging_helper import logger
-from core.scheduler import Scheduler
+from core.scheduler import OverrunPolicy, Scheduler
 from managers.manager_base import ManagerBase
 from utils.utils import suppress
 
@@ -47,18 +48,20 @@ class InputManager(ManagerBase):
     """
     Singleton manager for button input handling.
 
-    Uses ButtonController for event detection and integrates with
+    Uses a ButtonController backend for event detection and integrates with
     the scheduler for non-blocking button monitoring.
     """
 
     _instance = None
-    BUTTON_MONITOR_PERIOD = 0.01
+    BUTTON_MONITOR_PERIOD = 0.01  # Sampling period for polling backends
+    BUTTON_EVENT_PERIOD = 0.05  # Drain period for event-driven backends (events carry their own timestamps)
+    MAX_EVENTS_PER_DRAIN = 16
 
     # Button hold durations (seconds)
     SETUP_MODE_DURATION = 3.0
     SAFE_MODE_DURATION = 10.0
 
-    _default_controller_factory = ButtonController
+    _default_controller_factory = staticmethod(create_button_controller)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "InputManager":
         """
@@ -171,18 +174,26 @@ class InputManager(ManagerBase):
         self._click_count = 0
         self._queued_hold_event: Any = None
 
+        # Event-driven backends queue timestamped events, so a slow drain loses no precision
+        self._event_driven = getattr(self._controller, "EVENT_DRIVEN", False) is True
+
         scheduler = Scheduler.instance()
         self._task_handle = self._track_task_handle(
             scheduler.schedule_periodic(
-                coroutine=self._monitor_button,
-                period=self.BUTTON_MONITOR_PERIOD,
+                coroutine=self._drain_button_events if self._event_driven else self._monitor_button,
+                period=self.BUTTON_EVENT_PERIOD if self._event_driven else self.BUTTON_MONITOR_PERIOD,
                 priority=0,
                 name="Button Monitor",
+                resident=True,  # High rate - avoid a new asyncio task per run
+                overrun=OverrunPolicy.SKIP,  # Missed runs are stale; resume on the grid
             )
         )
 
         self._initialized = True
-        self.logger.info("InputManager initialized with scheduled monitoring task")
+        self.logger.info(
+            "InputManager initialized with scheduled monitoring task (%s)",
+            "keypad events" if self._event_driven else "polling",
+        )
 
     def _is_compatible_with(self, button_pin: Any = None) -> bool:
         """
@@ -228,6 +239,18 @@ class InputManager(ManagerBase):
         self._callbacks[event_type].append(callback)
         self.logger.debug(f"Registered callback for {event_type}")
 
+    def unregister_callback(self, event_type: Any, callback: Callable[[Any], None]) -> None:
+        """
+        Remove a callback added with register_callback(). Unknown callbacks are ignored.
+
+        Args:
+            event_type: ButtonEvent type the callback was registered for
+            callback: The callable that was registered
+        """
+        callbacks = self._callbacks.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
     def _fire_event(self, event_type: Any) -> None:
         """
         Fire callbacks for an event type.
@@ -254,7 +277,7 @@ class InputManager(ManagerBase):
         """
         Poll button state and fire events.
 
-        Runs at 100Hz via scheduler. Tracks hold durations for setup/safe mode
+        Runs at 100Hz via scheduler (polling backend). Tracks hold durations for setup/safe mode
         and generates click events for short presses.
 
         Args:
@@ -271,6 +294,50 @@ class InputManager(ManagerBase):
         if now is None:
             now = time.monotonic()
 
+        self._update_button_state(pressed, now)
+
+    async def _drain_button_events(self) -> None:
+        """Async wrapper that delegates to synchronous event-draining helper."""
+        self._drain_button_events_tick()
+
+    def _drain_button_events_tick(self, now: float | None = None) -> None:
+        """
+        Process queued press/release events from an event-driven backend.
+
+        Runs at BUTTON_EVENT_PERIOD via scheduler. Each event is applied at the time
+        it happened, after first advancing hold/click timers to that moment, so click
+        grouping and press durations match what 100Hz polling would have seen. Hold
+        thresholds are then checked against the current time.
+
+        Args:
+            now: Optional timestamp (monotonic seconds). Tests can inject
+                deterministic values; production defaults to time.monotonic().
+        """
+        if now is None:
+            now = time.monotonic()
+
+        for _ in range(self.MAX_EVENTS_PER_DRAIN):
+            try:
+                event = self._controller.read_event(now)
+            except Exception as exc:
+                self.logger.error(f"Button read failed: {exc}")
+                return
+            if event is None:
+                break
+            pressed, at = event
+            self._update_button_state(self._is_pressed, at)
+            self._update_button_state(pressed, at)
+
+        self._update_button_state(self._is_pressed, now)
+
+    def _update_button_state(self, pressed: bool, now: float) -> None:
+        """
+        Advance the press/click state machine to a button level observed at now.
+
+        Args:
+            pressed: Whether the button is down at now
+            now: Time of the observation (monotonic seconds)
+        """
         if pressed and not self._is_pressed:
             self._is_pressed = True
             self._press_start_time = now
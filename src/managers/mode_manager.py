@@ -8,9 +8,10 @@ Handles:
 """
 
 from controllers.pixel_controller import PixelController
+from core.app_typing import Any
 from core.logging_helper import logger
 from core.scheduler import Scheduler
-from managers.input_manager import InputManager
+from managers.input_manager import ButtonEvent, InputManager
 from managers.manager_base import ManagerBase
 from modes.mode_interface import Mode
 from modes.modes import SetupPortalMode
@@ -47,6 +48,8 @@ class ModeManager(ManagerBase):
         self.logger = logger("wicid.mode_mgr")
         self.input_mgr = InputManager.instance()
         self.button_router = ButtonActionRouterService.instance()
+        # Bound once so the same object can be unregistered after each mode run
+        self._press_callback = self._on_button_press
         self._initialized = True
 
     def register_modes(self, mode_classes: list[type[Mode]]) -> None:
@@ -129,7 +132,9 @@ class ModeManager(ManagerBase):
 
             self.logger.info(f"{mode.name} initialized")
 
-            # Run mode
+            # Run mode. A press stops any LED keyframe sequence at once, so modes
+            # blinking a pattern don't have to poll the button while it plays.
+            self.input_mgr.register_callback(ButtonEvent.PRESS, self._press_callback)
             try:
                 await mode.run()
             except KeyboardInterrupt:
@@ -139,6 +144,7 @@ class ModeManager(ManagerBase):
                 await self.pixel.blink_error()
                 await Scheduler.sleep(1)
             finally:
+                self.input_mgr.unregister_callback(ButtonEvent.PRESS, self._press_callback)
                 # Cleanup mode
                 try:
                     mode.cleanup()
@@ -149,6 +155,10 @@ class ModeManager(ManagerBase):
             await self._process_pending_actions()
             await Scheduler.sleep(0.1)
 
+    def _on_button_press(self, _event: Any) -> None:
+        """Button callback: end the LED pattern the running mode is playing."""
+        self.pixel.stop()
+
     def _next_mode(self) -> None:
         """Advance to next mode (wraps around to first mode)."""
         self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
@@ -44,7 +44,7 @@ from core.app_typing import Any, Callable, List
 from core.logging_helper import logger
 from core.scheduler import Scheduler
 from managers.manager_base import ManagerBase
-from utils.recovery import CRITICAL_FILES, validate_files
+from utils.recovery import CRITICAL_FILES
 from utils.update_install import remove_directory_recursive
 from utils.utils import (
     check_release_compatibility,
@@ -63,6 +63,7 @@ class UpdateManager(ManagerBase):
     pixel_controller: Any = None  # PixelController | None, but Any to avoid circular import
 
     MIN_FREE_SPACE_BYTES = 200000  # ~200KB buffer for operations
+    DOWNLOAD_JOURNAL_INTERVAL = 32768  # Checkpoint the resume offset every 32KB downloaded
 
     def _init(
         self,
@@ -133,20 +134,138 @@ class UpdateManager(ManagerBase):
         """
         remove_directory_recursive(path)
 
-    def _cleanup_pending_update(self) -> None:
+    def _cleanup_pending_update(self, keep_partial_download: bool = False) -> None:
         """
         Remove the entire /pending_update directory tree.
 
         Cleans up all staging artifacts including .staging, root, .ready marker,
         and any leftover ZIP files. Called on failures to ensure clean state
         for next update attempt.
+
+        Args:
+            keep_partial_download: Keep update.zip and its resume journal so an
+                interrupted download can continue where it stopped
         """
+        if keep_partial_download:
+            keep = {path.rsplit("/", 1)[-1] for path in self._package_paths()}
+            try:
+                entries = os.listdir(update_install.PENDING_UPDATE_DIR)
+            except OSError:
+                return
+            for name in entries:
+                if name in keep:
+                    continue
+                path = f"{update_install.PENDING_UPDATE_DIR}/{name}"
+                try:
+                    remove_directory_recursive(path)
+                except Exception as e:
+                    self.logger.warning(f"Error cleaning up {path}: {e}")
+            self.logger.debug("Cleaned pending_update (kept partial download)")
+            return
+
         try:
             remove_directory_recursive(update_install.PENDING_UPDATE_DIR)
             self.logger.debug("Removed pending_update directory")
         except Exception as e:
             self.logger.warning(f"Error cleaning up pending_update: {e}")
 
+    @staticmethod
+    def _package_paths() -> tuple[str, str]:
+        """
+        Return the download paths for the update package.
+
+        Returns:
+            tuple: (zip_path, journal_path) - package file and its resume journal
+        """
+        zip_path = f"{update_install.PENDING_UPDATE_DIR}/update.zip"
+        return zip_path, f"{zip_path}.journal"
+
+    def _write_download_journal(self, journal_path: str, journal: dict[str, Any], offset: int) -> None:
+        """
+        Record how much of the package is safely on flash.
+
+        Callers flush and sync the package before writing the journal, so the
+        recorded offset never runs ahead of the bytes that survive a reset.
+
+        Args:
+            journal_path: Path of the journal file
+            journal: Package identity (URL, checksum, ETag, Last-Modified, length)
+            offset: Number of package bytes written so far
+        """
+        record = dict(journal)
+        record["offset"] = offset
+        try:
+            with open(journal_path, "w") as f:
+                json.dump(record, f)
+            os.sync()
+        except OSError as e:
+            self.logger.warning(f"Failed to write download journal: {e}")
+
+    def _load_resume_offset(self, zip_path: str, journal_path: str, journal: dict[str, Any]) -> int:
+        """
+        Return how many bytes of a previous partial download can be reused.
+
+        The saved journal must describe the same package (URL, checksum, server
+        validators and length), and at least one of the checksum, ETag or
+        Last-Modified must be known, so a file that changed on the server is never
+        stitched onto stale bytes.
+
+        Args:
+            zip_path: Path of the partial package
+            journal_path: Path of the journal written by the interrupted download
+            journal: Identity of the package about to be downloaded
+
+        Returns:
+            int: Byte offset to resume from, or 0 to start over
+        """
+        try:
+            with open(journal_path) as f:
+                saved = json.load(f)
+            size = os.stat(zip_path)[6]  # st_size
+        except (OSError, ValueError):
+            return 0
+
+        if not isinstance(saved, dict):
+            return 0
+        for key, value in journal.items():
+            if saved.get(key) != value:
+                self.logger.debug(f"Partial download is stale ({key} changed)")
+                return 0
+        if not (journal.get("sha256") or journal.get("etag") or journal.get("last_modified")):
+            return 0
+
+        offset = saved.get("offset")
+        if not isinstance(offset, int) or offset <= 0:
+            return 0
+        # A reset can leave more bytes on flash than were journaled; they are rewritten
+        offset = min(offset, size)
+        length = journal.get("length")
+        if length is not None and offset >= length:
+            return 0
+        return offset
+
+    async def _hash_file_prefix(self, f: Any, length: int, sha256: Any, chunk_size: int = 2048) -> None:
+        """
+        Feed the first length bytes of an open file into a running hash.
+
+        Re-hashing the partial package from flash on resume stands in for saving
+        the hash state, which adafruit_hashlib cannot serialize.
+
+        Args:
+            f: File object opened for reading, positioned at the start
+            length: Number of bytes to hash
+            sha256: Hash object to update
+            chunk_size: Bytes to read per iteration
+        """
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                raise OSError("Partial download is shorter than its journal")
+            sha256.update(chunk)
+            remaining -= len(chunk)
+            await Scheduler.yield_control()
+
     def _write_ready_marker(self, manifest_hash: str) -> None:
         """
         Write the .ready marker file with manifest hash.
@@ -197,108 +316,21 @@ class UpdateManager(ManagerBase):
         except Exception as e:
             self.logger.warning(f"Could not record failed update {version_to_block}: {e}")
 
-    async def calculate_sha256(
-        self,
-        file_path: str,
-        chunk_size: int = 2048,
-        progress_callback: Callable[[str, str, float | None], None] | None = None,
-        service_callback: Callable[[], None] | None = None,
-    ) -> str | None:
-        """
-        Calculate SHA-256 checksum of a file using adafruit_hashlib.
-
-        Uses 2KB chunks to balance verification speed with LED animation responsiveness.
-        This size ensures yielding occurs frequently enough (~10-20ms) to keep the
-        scheduler's 25Hz LED animation task from being starved.
-
-        Args:
-            file_path: Path to file to checksum
-            chunk_size: Bytes to read per iteration (default: 2KB for speed/responsiveness balance)
-            progress_callback: Optional callback for progress reporting
-            service_callback: Optional callback to service background tasks
-
-        Returns:
-            str | None: Hexadecimal SHA-256 checksum, or None on error
-        """
-        try:
-            # Get file size for progress indication
-            file_size = os.stat(file_path)[6]  # st_size
-            self.logger.debug(f"File size: {file_size / 1024:.1f} KB")
-
-            start_time = time.monotonic()
-            sha256 = hashlib.sha256()  # type: ignore[attr-defined]
-            bytes_processed = 0
-            tick_count = 0
-            with open(file_path, "rb") as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    sha256.update(chunk)
-                    bytes_processed += len(chunk)
-                    tick_count += 1
-
-                    # Yield control to scheduler so other tasks can run
-                    if service_callback:
-                        try:
-                            service_callback()
-                        except Exception as e:
-                            self.logger.debug(f"Service callback error: {e}")
-                    await Scheduler.yield_control()
-
-                    if progress_callback:
-                        progress_pct = int((bytes_processed / file_size) * 100)
-                        progress_pct = max(0, min(progress_pct, 100))
-                        try:
-                            progress_callback("verifying", "Verifying download integrity...", progress_pct)
-                        except Exception as e:
-                            self.logger.warning(f"Progress callback error: {e}")
-
-            elapsed = time.monotonic() - start_time
-            self.logger.debug(f"Checksum calculated in {elapsed:.1f} seconds")
-            self.logger.debug(f"Total tick() calls during checksum: {tick_count}")
-            if tick_count:
-                self.logger.debug(f"Average time per chunk: {elapsed / tick_count:.2f} seconds")
-
-            return sha256.hexdigest()
-        except Exception as e:
-            self.logger.error(f"Error calculating checksum: {e}")
-            traceback.print_exception(e)
-            return None
-
-    async def verify_checksum(
-        self,
-        file_path: str,
-        expected_checksum: str,
-        progress_callback: Callable[[str, str, float | None], None] | None = None,
-        service_callback: Callable[[], None] | None = None,
-    ) -> tuple[bool, str]:
+    @staticmethod
+    def _compare_checksums(actual_checksum: str, expected_checksum: str) -> tuple[bool, str]:
         """
-        Verify file matches expected SHA-256 checksum using adafruit_hashlib.
+        Compare a computed SHA-256 hex digest against the expected value.
 
         Args:
-            file_path: Path to file to verify
-            expected_checksum: Expected SHA-256 hex string
-            progress_callback: Optional callback for progress reporting
-            service_callback: Optional callback to service background tasks
+            actual_checksum: SHA-256 hex digest computed from the downloaded bytes
+            expected_checksum: Expected SHA-256 hex string from the release manifest
 
         Returns:
             tuple: (bool, str) - (matches, message)
         """
-        if not expected_checksum:
-            return (False, "No checksum provided - update manifest may be from older version")
-
-        actual_checksum = await self.calculate_sha256(
-            file_path, progress_callback=progress_callback, service_callback=service_callback
-        )
-
-        if actual_checksum is None:
-            return (False, "Failed to calculate checksum")
-
         if actual_checksum.lower() == expected_checksum.lower():
             return (True, f"Checksum verified: {actual_checksum[:16]}...")
-        else:
-            return (False, f"Checksum mismatch: expected {expected_checksum[:16]}..., got {actual_checksum[:16]}...")
+        return (False, f"Checksum mismatch: expected {expected_checksum[:16]}..., got {actual_checksum[:16]}...")
 
     def _determine_release_channel(self) -> str:
         """
@@ -364,14 +396,33 @@ class UpdateManager(ManagerBase):
                 newest = release
 
         self.logger.info(f"Update available from archive: {current_version} -> {newest['version']}")
-        return {
-            "version": newest["version"],
-            "zip_url": newest.get("zip_url"),
-            "sha256": newest.get("sha256"),
-            "release_notes": newest.get("release_notes", ""),
+        return self._build_update_info(newest, release_entry)
+
+    @staticmethod
+    def _build_update_info(release_info: dict[str, Any], release_entry: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the update info dict cached for download_update().
+
+        Args:
+            release_info: Selected release from releases.json
+            release_entry: Platform entry containing the release
+
+        Returns:
+            dict: Update info, including delta package details when the release has one
+        """
+        update_info = {
+            "version": release_info["version"],
+            "zip_url": release_info.get("zip_url"),
+            "sha256": release_info.get("sha256"),
+            "release_notes": release_info.get("release_notes", ""),
             "target_machine_types": release_entry.get("target_machine_types", []),
             "target_operating_systems": release_entry.get("target_operating_systems", []),
         }
+        if release_info.get("delta_from") and release_info.get("delta_url"):
+            update_info["delta_from"] = release_info["delta_from"]
+            update_info["delta_url"] = release_info["delta_url"]
+            update_info["delta_sha256"] = release_info.get("delta_sha256")
+        return update_info
 
     def check_for_updates(self) -> dict[str, Any] | None:
         """
@@ -458,14 +509,7 @@ class UpdateManager(ManagerBase):
 
                     if is_compatible:
                         self.logger.info(f"Update available: {current_version} -> {release_info['version']}")
-                        update_info = {
-                            "version": release_info["version"],
-                            "zip_url": release_info.get("zip_url"),
-                            "sha256": release_info.get("sha256"),
-                            "release_notes": release_info.get("release_notes", ""),
-                            "target_machine_types": release_entry.get("target_machine_types", []),
-                            "target_operating_systems": release_entry.get("target_operating_systems", []),
-                        }
+                        update_info = self._build_update_info(release_info, release_entry)
                         self._cached_update_info = update_info  # Cache for download_update()
                         return update_info
                     else:
@@ -530,14 +574,7 @@ class UpdateManager(ManagerBase):
                         self.logger.info(
                             f"Update available: {current_version} -> {selected_info['version']} ({selected_channel})"
                         )
-                        update_info = {
-                            "version": selected_info["version"],
-                            "zip_url": selected_info.get("zip_url"),
-                            "sha256": selected_info.get("sha256"),
-                            "release_notes": selected_info.get("release_notes", ""),
-                            "target_machine_types": release_entry.get("target_machine_types", []),
-                            "target_operating_systems": release_entry.get("target_operating_systems", []),
-                        }
+                        update_info = self._build_update_info(selected_info, release_entry)
                         self._cached_update_info = update_info  # Cache for download_update()
                         return update_info
                     else:
@@ -573,14 +610,7 @@ class UpdateManager(ManagerBase):
                                 f"Update available: {current_version} -> {prod_info['version']} (production, same as development, preferring production)"
                             )
 
-                        update_info = {
-                            "version": selected_info["version"],
-                            "zip_url": selected_info.get("zip_url"),
-                            "sha256": selected_info.get("sha256"),
-                            "release_notes": selected_info.get("release_notes", ""),
-                            "target_machine_types": release_entry.get("target_machine_types", []),
-                            "target_operating_systems": release_entry.get("target_operating_systems", []),
-                        }
+                        update_info = self._build_update_info(selected_info, release_entry)
                         self._cached_update_info = update_info  # Cache for download_update()
                         return update_info
 
@@ -623,6 +653,55 @@ class UpdateManager(ManagerBase):
             headers["User-Agent"] = user_agent
         return headers
 
+    @staticmethod
+    def _get_header(headers: Any, name: str) -> Any:
+        """
+        Look up a response header by name, ignoring case.
+
+        Args:
+            headers: Response headers (dict-like), or None
+            name: Header name in canonical form (e.g. "Content-Length")
+
+        Returns:
+            Header value, or None if absent
+        """
+        if not headers:
+            return None
+        try:
+            for key in (name, name.lower()):
+                value = headers.get(key)
+                if value:
+                    return value
+        except AttributeError:
+            pass
+        try:
+            lowered = name.lower()
+            for key, value in headers.items():
+                if isinstance(key, str) and key.lower() == lowered:
+                    return value
+        except Exception:
+            pass
+        return None
+
+    @classmethod
+    def _parse_content_length(cls, headers: Any) -> int | None:
+        """
+        Parse the Content-Length header.
+
+        Args:
+            headers: Response headers (dict-like), or None
+
+        Returns:
+            int | None: Body length in bytes, or None if absent or malformed
+        """
+        value = cls._get_header(headers, "Content-Length")
+        if not value:
+            return None
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+
     async def download_update(
         self,
         zip_url: str | None = None,
@@ -636,6 +715,16 @@ class UpdateManager(ManagerBase):
         Uses cached update info from check_for_updates() if no explicit parameters provided.
         Cooperative yields ensure scheduler-driven tasks stay responsive during long operations.
 
+        Downloads are resumable: a journal beside update.zip records how many bytes are
+        on flash plus the package's ETag/Last-Modified. If the transfer drops, the next
+        call requests only the remaining bytes with an HTTP Range request, and starts
+        over when the server does not honor it or the package has changed.
+
+        When the release offers a delta package built against the installed version,
+        that is tried first: only changed files are downloaded and patched against the
+        installed ones. Any delta problem (base hash mismatch, bad patch) falls back
+        to the full package.
+
         Args:
             zip_url: Optional explicit URL (uses cached if None)
             expected_checksum: Optional explicit SHA-256 checksum (uses cached if None)
@@ -648,11 +737,16 @@ class UpdateManager(ManagerBase):
         Raises:
             ValueError: If no cached update info and no explicit parameters provided
         """
+        delta_url: str | None = None
+        delta_checksum: str | None = None
         if zip_url is None:
             if self._cached_update_info is None:
                 raise ValueError("No update info available. Call check_for_updates() first.")
             zip_url = self._cached_update_info.get("zip_url")
             expected_checksum = self._cached_update_info.get("sha256")
+            if self._cached_update_info.get("delta_from") == os.getenv("VERSION", "0.0.0"):
+                delta_url = self._cached_update_info.get("delta_url")
+                delta_checksum = self._cached_update_info.get("delta_sha256")
 
         session = self._get_session()
 
@@ -668,7 +762,18 @@ class UpdateManager(ManagerBase):
                 except Exception as e:
                     self.logger.debug(f"Service callback error: {e}")
 
-        async def _execute_download() -> tuple[bool, str]:
+        interrupted = False
+
+        async def _execute_download(
+            zip_url: str | None, expected_checksum: str | None, is_delta: bool = False
+        ) -> tuple[bool, str]:
+            nonlocal interrupted
+
+            def record_failure(reason: str, version: str | None = None) -> None:
+                # A failed delta falls back to the full package instead of blocking the release
+                if not is_delta:
+                    self._record_failed_update(reason, version=version)
+
             try:
                 space_ok, space_msg = self.check_disk_space(self.MIN_FREE_SPACE_BYTES)
                 self.logger.debug(f"Disk space check: {space_msg}")
@@ -676,12 +781,12 @@ class UpdateManager(ManagerBase):
                     self.logger.error("Insufficient disk space for update")
                     self.logger.error("Please free up space and try again")
                     self._cleanup_pending_update()
-                    self._record_failed_update("Insufficient disk space")
+                    record_failure("Insufficient disk space")
                     return False, "Insufficient disk space for update"
 
-                # Clean up any previous failed update artifacts before starting
-                # Use full cleanup to remove staging, root, and any leftover files
-                self._cleanup_pending_update()
+                # Clean up any previous failed update artifacts before starting, keeping
+                # a partial package so an interrupted download can be resumed
+                self._cleanup_pending_update(keep_partial_download=True)
 
                 # Create staging directory structure
                 with suppress(OSError):
@@ -689,97 +794,152 @@ class UpdateManager(ManagerBase):
                 with suppress(OSError):
                     os.mkdir(update_install.PENDING_STAGING_DIR)
 
-                zip_path = f"{update_install.PENDING_UPDATE_DIR}/update.zip"
+                zip_path, journal_path = self._package_paths()
                 self.logger.info(f"Downloading update: {zip_url}")
                 self.logger.debug(f"Saving to: {zip_path}")
 
                 notify("downloading", "Starting download...", 0)
 
-                def _get_content_length(headers: Any) -> int | None:
-                    if not headers:
-                        return None
-                    try:
-                        for key in ("Content-Length", "content-length"):
-                            value = headers.get(key)
-                            if value:
-                                return value
-                    except AttributeError:
-                        pass
-                    try:
-                        for key, value in headers.items():
-                            if isinstance(key, str) and key.lower() == "content-length":
-                                return value
-                    except Exception:
-                        pass
-                    return None
-
                 content_length = None
+                etag = None
+                last_modified = None
                 try:
                     head_response = session.head(zip_url, headers=self._build_request_headers())
                     if hasattr(head_response, "headers") and head_response.headers:
-                        content_length_str = _get_content_length(head_response.headers)
-                        if content_length_str:
-                            try:
-                                content_length = int(content_length_str)
-                                self.logger.debug(f"Content-Length from HEAD: {content_length} bytes")
-                            except (ValueError, TypeError):
-                                pass
+                        content_length = self._parse_content_length(head_response.headers)
+                        if content_length is not None:
+                            self.logger.debug(f"Content-Length from HEAD: {content_length} bytes")
+                        etag = self._get_header(head_response.headers, "ETag")
+                        last_modified = self._get_header(head_response.headers, "Last-Modified")
                     head_response.close()
                 except Exception as e:
                     self.logger.debug(f"HEAD request failed (non-critical): {e}")
 
-                response = session.get(zip_url, headers=self._build_request_headers())
+                # Identity of the package; a partial download is only reused if it matches
+                journal = {
+                    "url": zip_url,
+                    "sha256": expected_checksum,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "length": content_length,
+                }
+                offset = self._load_resume_offset(zip_path, journal_path, journal)
+                request_headers = self._build_request_headers()
+                if offset:
+                    request_headers["Range"] = f"bytes={offset}-"
+                    validator = etag or last_modified
+                    if validator:
+                        # Server answers 200 with the full body if the package changed
+                        request_headers["If-Range"] = str(validator)
+                else:
+                    with suppress(OSError):
+                        os.remove(journal_path)
+
+                download_chunk_size = 2048  # Smaller chunks keep LED/service callbacks responsive
+                # Hash chunks as they stream to flash so verification needs no second read pass
+                sha256 = hashlib.sha256() if expected_checksum else None  # type: ignore[attr-defined]
+                bytes_downloaded = 0
+                response = None
+                try:
+                    response = session.get(zip_url, headers=request_headers)
+                    if response.status_code not in (200, 206):
+                        # An error page is not the package: don't hash it or keep it for resume.
+                        # Not recorded as a failed update - the package itself is not at fault.
+                        status_code = response.status_code
+                        response.close()
+                        with suppress(OSError):
+                            os.remove(journal_path)
+                        if is_delta:
+                            self.logger.info(f"Delta package unavailable (HTTP {status_code})")
+                        else:
+                            self.logger.error(f"Update download failed: HTTP {status_code}")
+                            notify("error", f"Download failed: HTTP {status_code}", None)
+                        return False, f"HTTP {status_code}"
+                    response_headers = getattr(response, "headers", None)
+
+                    if offset:
+                        content_range = self._get_header(response_headers, "Content-Range")
+                        if response.status_code == 206 and str(content_range or "").startswith(f"bytes {offset}-"):
+                            self.logger.info(f"Resuming download at byte {offset}")
+                        else:
+                            self.logger.info(
+                                f"Server did not resume (HTTP {response.status_code}); restarting download"
+                            )
+                            offset = 0
 
-                if content_length is None and hasattr(response, "headers") and response.headers:
-                    content_length_str = _get_content_length(response.headers)
-                    if content_length_str:
-                        try:
-                            content_length = int(content_length_str)
+                    if content_length is None and response_headers:
+                        # A 206 body only covers the bytes after the offset
+                        body_length = self._parse_content_length(response_headers)
+                        if body_length is not None:
+                            content_length = body_length + offset
                             self.logger.debug(f"Content-Length from GET: {content_length} bytes")
-                        except (ValueError, TypeError):
-                            pass
 
-                bytes_downloaded = 0
-                download_chunk_size = 2048  # Smaller chunks keep LED/service callbacks responsive
-                with open(zip_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=download_chunk_size):
-                        if not chunk:
-                            continue
-                        f.write(chunk)
-                        bytes_downloaded += len(chunk)
-
-                        progress_pct: float | None = None
-                        if content_length and content_length > 0:
-                            progress_pct = float((bytes_downloaded / content_length) * 100)
-                            progress_pct = max(0.0, min(progress_pct, 99.0))
-                        notify("downloading", "Download...", progress_pct)
-                        await Scheduler.yield_control()
+                    bytes_downloaded = offset
+                    next_checkpoint = offset + self.DOWNLOAD_JOURNAL_INTERVAL
+                    with open(zip_path, "r+b" if offset else "wb") as f:
+                        if offset and sha256 is not None:
+                            await self._hash_file_prefix(f, offset, sha256)
+                        f.seek(offset)
+                        for chunk in response.iter_content(chunk_size=download_chunk_size):
+                            if not chunk:
+                                continue
+                            f.write(chunk)
+                            if sha256 is not None:
+                                sha256.update(chunk)
+                            bytes_downloaded += len(chunk)
+
+                            if bytes_downloaded >= next_checkpoint:
+                                # Bound how much a watchdog reset can cost the next attempt
+                                f.flush()
+                                os.sync()
+                                self._write_download_journal(journal_path, journal, bytes_downloaded)
+                                next_checkpoint = bytes_downloaded + self.DOWNLOAD_JOURNAL_INTERVAL
+
+                            progress_pct: float | None = None
+                            if content_length and content_length > 0:
+                                progress_pct = float((bytes_downloaded / content_length) * 100)
+                                progress_pct = max(0.0, min(progress_pct, 99.0))
+                            notify("downloading", "Download...", progress_pct)
+                            await Scheduler.yield_control()
+
+                    if content_length and bytes_downloaded < content_length:
+                        # Connection closed early without a socket error
+                        raise OSError(f"connection closed at {bytes_downloaded} of {content_length} bytes")
+                except (AttributeError, TypeError, NameError):
+                    raise
+                except Exception as e:
+                    # Transport failure (e.g. Wi-Fi drop): keep what arrived for the next attempt.
+                    # Not recorded as a failed update - the package itself is not at fault.
+                    if response is not None:
+                        with suppress(Exception):
+                            response.close()
+                    os.sync()
+                    if bytes_downloaded:
+                        self._write_download_journal(journal_path, journal, bytes_downloaded)
+                    interrupted = True
+                    self.logger.warning(f"Download interrupted after {bytes_downloaded} bytes: {e}")
+                    notify("error", f"Download interrupted: {e}", None)
+                    return False, f"Download interrupted: {e}"
 
                 response.close()
+                with suppress(OSError):
+                    os.remove(journal_path)
                 os.sync()
                 await Scheduler.yield_control()
 
                 self.logger.info("Download complete")
                 notify("downloading", "Download complete", 100)
 
-                if expected_checksum:
+                if expected_checksum and sha256 is not None:
                     self.logger.info("Verifying download integrity")
                     notify("verifying", "Verifying download integrity...", None)
+                    checksum_valid, checksum_msg = self._compare_checksums(sha256.hexdigest(), expected_checksum)
 
-                    async def _run_verification() -> tuple[bool, str]:
-                        return await self.verify_checksum(
-                            zip_path,
-                            expected_checksum,
-                            progress_callback=progress_callback,
-                            service_callback=service_callback,
-                        )
-
-                    if self.pixel_controller:
-                        async with self.pixel_controller.indicate_operation("verifying"):
-                            checksum_valid, checksum_msg = await _run_verification()
-                    else:
-                        checksum_valid, checksum_msg = await _run_verification()
-
+                    if not checksum_valid and is_delta:
+                        # The full package is downloaded and verified next
+                        self.logger.warning(f"Delta package failed verification: {checksum_msg}")
+                        self._cleanup_pending_update()
+                        return False, checksum_msg
                     if not checksum_valid:
                         self.logger.error(f"Checksum verification failed: {checksum_msg}")
                         notify("error", f"Verification failed: {checksum_msg}", None)
@@ -787,7 +947,7 @@ class UpdateManager(ManagerBase):
                             self.logger.critical("SECURITY WARNING: Downloaded file may be corrupted or tampered with")
                         # Full cleanup on checksum failure
                         self._cleanup_pending_update()
-                        self._record_failed_update(checksum_msg)
+                        record_failure(checksum_msg)
                         return False, checksum_msg
 
                     self.logger.info(checksum_msg)
@@ -840,9 +1000,27 @@ class UpdateManager(ManagerBase):
                             os.remove(zip_path)
                         self._cleanup_pending_update()
                         error_msg = f"Invalid manifest: {e}"
-                        self._record_failed_update(error_msg)
+                        record_failure(error_msg)
                         return False, error_msg
 
+                    if is_delta:
+                        notify("unpacking", "Applying delta update...", None)
+                        delta_index = update_install.load_delta_index(update_install.PENDING_STAGING_DIR)
+                        if delta_index is None or delta_index.get("delta_from") != manifest.get("delta_from"):
+                            delta_ok, delta_msg = False, "Delta package index missing or inconsistent"
+                        else:
+                            delta_ok, delta_msg = update_install.apply_delta(
+                                update_install.PENDING_STAGING_DIR, delta_index
+                            )
+                        await Scheduler.yield_control()
+                        if not delta_ok:
+                            self.logger.warning(f"Delta update unusable: {delta_msg}")
+                            with suppress(OSError):
+                                os.remove(zip_path)
+                            self._cleanup_pending_update()
+                            return False, delta_msg
+                        self.logger.info(delta_msg)
+
                     self.logger.debug("Validating extracted update contains all critical files")
                     notify("unpacking", "Validating update package...", None)
 
@@ -853,8 +1031,11 @@ class UpdateManager(ManagerBase):
                         all_present: bool = True
                         missing_files: List[str] = []
                     else:
-                        # Normal validation for full releases
-                        all_present, missing_files = validate_files(update_install.PENDING_STAGING_DIR, CRITICAL_FILES)
+                        # Normal validation for full releases (a delta relies on its unchanged files)
+                        missing_files = update_install.missing_package_files(
+                            update_install.PENDING_STAGING_DIR, CRITICAL_FILES
+                        )
+                        all_present = not missing_files
 
                     if not all_present:
                         self.logger.error("Update package is incomplete")
@@ -869,7 +1050,7 @@ class UpdateManager(ManagerBase):
                             os.remove(zip_path)
                         self._cleanup_pending_update()
                         error_msg = "Update package incomplete"
-                        self._record_failed_update(error_msg, version=manifest.get("version"))
+                        record_failure(error_msg, version=manifest.get("version"))
                         return False, error_msg
 
                     self.logger.info("All critical files present in update")
@@ -888,7 +1069,7 @@ class UpdateManager(ManagerBase):
                         self.logger.error(f"Failed to rename staging to root: {e}")
                         self._cleanup_pending_update()
                         error_msg = f"Staging rename failed: {e}"
-                        self._record_failed_update(error_msg, version=manifest.get("version"))
+                        record_failure(error_msg, version=manifest.get("version"))
                         return False, error_msg
 
                     # Write ready marker with manifest hash for boot verification
@@ -909,7 +1090,7 @@ class UpdateManager(ManagerBase):
                     # Full cleanup on extraction failure
                     self._cleanup_pending_update()
                     error_msg = f"Extraction error: {e}"
-                    self._record_failed_update(error_msg)
+                    record_failure(error_msg)
                     return False, error_msg
 
             except (AttributeError, TypeError, NameError) as e:
@@ -917,7 +1098,7 @@ class UpdateManager(ManagerBase):
                 traceback.print_exception(e)
                 notify("error", f"Download failed: {e}", None)
                 self._cleanup_pending_update()
-                self._record_failed_update(f"Programming error: {e}")
+                record_failure(f"Programming error: {e}")
                 raise RuntimeError(f"Unrecoverable error in update download: {e}") from e
             except Exception as e:
                 self.logger.error(f"Error downloading update: {e}")
@@ -926,15 +1107,24 @@ class UpdateManager(ManagerBase):
                 # Full cleanup on any failure
                 self._cleanup_pending_update()
                 error_msg = str(e)
-                self._record_failed_update(error_msg)
+                record_failure(error_msg)
                 return False, error_msg
 
+        async def _download_with_fallback() -> tuple[bool, str]:
+            if delta_url:
+                self.logger.info("Using delta package")
+                result = await _execute_download(delta_url, delta_checksum, is_delta=True)
+                if result[0] or interrupted:
+                    return result
+                self.logger.warning(f"Delta update failed ({result[1]}); downloading full package")
+            return await _execute_download(zip_url, expected_checksum)
+
         if self.pixel_controller:
             self.logger.debug("LED indicator: flashing blue/green during download and verification")
             async with self.pixel_controller.indicate_operation("downloading"):
-                return await _execute_download()
+                return await _download_with_fallback()
 
-        return await _execute_download()
+        return await _download_with_fallback()
 
     def schedule_next_update_check(
         self, interval_hours: float | None = None, delay_seconds: float | None = None
@@ -4,15 +4,22 @@ WeatherManager - Scheduled weather data fetching and caching.
 Wraps the WeatherService class with scheduler integration for periodic updates.
 Provides cached weather data accessible synchronously by other components.
 
+The last snapshot is persisted to flash so that after a reboot it can be shown
+immediately (stale-while-revalidate) while the first live refresh runs.
+
 Architecture: See docs/SCHEDULER_ARCHITECTURE.md
 """
 
+import os
+import time
+
 from core.app_typing import Any, Optional
 from core.logging_helper import logger
 from core.scheduler import Scheduler, TaskFatalError, TaskNonFatalError
 from managers.connection_manager import ConnectionManager
 from managers.manager_base import ManagerBase
 from services.weather_service import WeatherService
+from utils.utils import read_json, write_json_atomic
 
 
 class WeatherManager(ManagerBase):
@@ -28,6 +35,10 @@ class WeatherManager(ManagerBase):
     UPDATE_INTERVAL = 300.0  # 5 minutes
     PRECIP_FORECAST_WINDOW = 4  # hours
 
+    CACHE_FILE = "/weather_cache.json"  # Kept across updates (PRESERVED_FILES)
+    CACHE_WRITE_MIN_INTERVAL = 900.0  # seconds between cache writes (limits flash wear)
+    DEFAULT_CACHE_MAX_AGE = 3600  # seconds; overridden by WEATHER_CACHE_MAX_AGE
+
     @classmethod
     def instance(cls, session: Optional[Any] = None, weather_zip: Optional[str] = None) -> "WeatherManager":
         """
@@ -91,6 +102,11 @@ class WeatherManager(ManagerBase):
         # Weather service instance (lazy-initialized)
         self._weather: Optional[Any] = None
         self.connection_manager = ConnectionManager.instance()
+
+        # Persistent snapshot cache
+        self._from_cache = False  # True until the first live refresh replaces cached values
+        self._last_cache_write: Optional[float] = None
+        self._load_cached_snapshot(weather_zip)
         self._updates_scheduled = False
         self._schedule_weather_updates()
 
@@ -117,6 +133,89 @@ class WeatherManager(ManagerBase):
         zip_compat = (self._init_weather_zip is None and weather_zip is None) or (self._init_weather_zip == weather_zip)
         return zip_compat
 
+    def _get_cache_max_age(self) -> int:
+        """Return how old (seconds) a persisted snapshot may be and still be shown."""
+        try:
+            return int(os.getenv("WEATHER_CACHE_MAX_AGE", str(self.DEFAULT_CACHE_MAX_AGE)))
+        except (ValueError, TypeError):
+            return self.DEFAULT_CACHE_MAX_AGE
+
+    def _load_cached_snapshot(self, weather_zip: Optional[str] = None) -> None:
+        """
+        Seed cached values from the persisted snapshot if it is fresh enough.
+
+        Args:
+            weather_zip: ZIP the snapshot must match (read from credentials if None)
+        """
+        max_age = self._get_cache_max_age()
+        if max_age <= 0:
+            return
+
+        snapshot = read_json(self.CACHE_FILE)
+        if not isinstance(snapshot, dict):
+            return
+
+        if weather_zip is None:
+            try:
+                credentials = self.connection_manager.get_credentials()
+                weather_zip = credentials.get("weather_zip") if credentials else None
+            except Exception:
+                weather_zip = None
+        if not weather_zip or snapshot.get("zip") != weather_zip:
+            self.logger.debug("Ignoring weather cache for a different ZIP")
+            return
+
+        try:
+            age = time.time() - float(snapshot["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return
+        # Negative age means the RTC was reset (power loss) so the age is unknown
+        if age < 0 or age > max_age:
+            self.logger.debug(f"Weather cache not used (age {age:.0f}s, max {max_age}s)")
+            return
+
+        self._current_temp = snapshot.get("current_temp")
+        self._daily_high = snapshot.get("daily_high")
+        self._precip_chance = snapshot.get("precip_chance")
+        self._from_cache = True
+        self.logger.info(f"Serving cached weather from {age:.0f}s ago until first refresh")
+
+    def _persist_snapshot(self, weather_zip: str) -> None:
+        """
+        Persist the current values, at most once per CACHE_WRITE_MIN_INTERVAL.
+
+        Args:
+            weather_zip: ZIP code the values were fetched for
+        """
+        if self._get_cache_max_age() <= 0:
+            return
+        now = time.monotonic()
+        if self._last_cache_write is not None and now - self._last_cache_write < self.CACHE_WRITE_MIN_INTERVAL:
+            return
+
+        snapshot = {
+            "zip": weather_zip,
+            "timestamp": time.time(),
+            "current_temp": self._current_temp,
+            "daily_high": self._daily_high,
+            "precip_chance": self._precip_chance,
+        }
+        try:
+            write_json_atomic(self.CACHE_FILE, snapshot)
+            self._last_cache_write = now
+        except OSError as e:
+            # Read-only filesystem (USB dev mode) or flash error - cache is optional
+            self.logger.debug(f"Could not persist weather cache: {e}")
+
+    def is_from_cache(self) -> bool:
+        """
+        Check whether the cached values came from the persisted snapshot.
+
+        Returns:
+            bool: True until the first live refresh after boot completes
+        """
+        return self._from_cache
+
     def _schedule_weather_updates(self) -> None:
         """Register the recurring weather update task with the scheduler."""
         if getattr(self, "_updates_scheduled", False):
@@ -162,7 +261,7 @@ class WeatherManager(ManagerBase):
         Fetch weather data from API (called by scheduler every UPDATE_INTERVAL).
 
         This task runs periodically to update cached weather data.
-        Explicitly yields after each network call to ensure scheduler responsiveness.
+        All values come from a single combined API request per refresh.
         """
         if not self._ensure_weather_service():
             self.logger.warning("Weather service not initialized - skipping update")
@@ -173,11 +272,8 @@ class WeatherManager(ManagerBase):
         try:
             self.logger.debug("Fetching weather data...")
 
-            # Network calls are now async and non-blocking
             try:
-                temp = await self._weather.get_current_temperature()
-                high = await self._weather.get_daily_high()
-                precip = await self._weather.get_precip_chance_in_window(0, self.PRECIP_FORECAST_WINDOW)
+                temp, high, precip = await self._weather.fetch_snapshot(0, self.PRECIP_FORECAST_WINDOW)
             except Exception as fetch_error:
                 raise TaskNonFatalError(f"Weather API error: {fetch_error}") from fetch_error
 
@@ -185,6 +281,9 @@ class WeatherManager(ManagerBase):
             self._current_temp = temp
             self._daily_high = high
             self._precip_chance = precip
+            self._from_cache = False
+            if temp is not None and precip is not None:
+                self._persist_snapshot(self._weather.zip_code)
 
             temp_msg = f"{temp}°F" if temp is not None else "n/a"
             high_msg = f"{high}°F" if high is not None else "n/a"
@@ -215,15 +314,6 @@ class WeatherManager(ManagerBase):
         """
         return self._current_temp
 
-    def get_daily_high(self) -> float | None:
-        """
-        Get cached daily high temperature (synchronous).
-
-        Returns:
-            float: High temperature in °F, or None if no data available
-        """
-        return self._daily_high
-
     def get_precip_chance(self) -> int | None:
         """
         Get cached precipitation chance (synchronous).
@@ -253,6 +343,7 @@ class WeatherManager(ManagerBase):
         self._current_temp = None
         self._daily_high = None
         self._precip_chance = None
+        self._from_cache = False
         self._updates_scheduled = False
 
         self.logger.debug("WeatherManager shut down")
@@ -1,3 +1,4 @@
+from controllers.pixel_controller import Easing
 from core.app_typing import Any
 from core.scheduler import Scheduler
 from managers.configuration_manager import ConfigurationManager
@@ -5,15 +6,17 @@ from managers.system_manager import SystemManager
 from managers.weather_manager import WeatherManager
 from modes.mode_interface import Mode
 from services.button_action_router_service import ButtonActionRouterService
+from utils.utils import seconds_since_startup
 
 
-def temperature_color(temp_f: float | None) -> tuple[int, int, int]:
+def _interpolate_temperature_color(temp_f: float) -> tuple[int, int, int]:
     """
-    Returns an (R, G, B) color biased toward warmer hues,
-    clamped between 0°F and 100°F (white->purple->blue->green->yellow->orange->red).
+    Interpolate the temperature color steps with floats.
+
+    Used once at import to build _TEMPERATURE_RGB; call temperature_color() instead.
 
     Args:
-        temp_f: Temperature in Fahrenheit, or None for unknown
+        temp_f: Temperature in Fahrenheit
 
     Returns:
         tuple: RGB color tuple (0-255 per channel)
@@ -30,9 +33,6 @@ def temperature_color(temp_f: float | None) -> tuple[int, int, int]:
         (100, (235, 0, 0)),  # red
     ]
 
-    if temp_f is None:
-        return (128, 128, 128)  # neutral gray if unknown
-
     if temp_f <= color_steps[0][0]:
         return color_steps[0][1]
     if temp_f >= color_steps[-1][0]:
@@ -52,43 +52,62 @@ def temperature_color(temp_f: float | None) -> tuple[int, int, int]:
     return color_steps[-1][1]
 
 
-async def blink_for_precip(
-    pixel_controller: Any, color: tuple[int, int, int], precip_percent: int | None, is_pressed_fn: Any = None
-) -> bool:
+# Precomputed colors for 0..100°F, 3 bytes (R, G, B) per whole degree
+_TEMPERATURE_RGB = bytes(channel for temp in range(101) for channel in _interpolate_temperature_color(temp))
+
+
+def temperature_color(temp_f: float | None) -> tuple[int, int, int]:
     """
-    Blinks the NeoPixel according to the 'rounded to nearest 10%' precipitation probability.
-      - Example: 27% => 30% => 3 blinks, then hold color for a few seconds.
-      - If ``is_pressed_fn`` returns True, exit mid-cycle for immediate response.
+    Returns an (R, G, B) color biased toward warmer hues,
+    clamped between 0°F and 100°F (white->purple->blue->green->yellow->orange->red).
+
+    Whole degrees are read straight from a precomputed table; fractional
+    temperatures blend the two neighbouring entries with integer math
+    (within ±1 of float interpolation).
 
     Args:
-        pixel_controller: PixelController instance
-        color: RGB tuple for the blink color
-        precip_percent: Precipitation percentage (0-100), or None
-        is_pressed_fn: Optional callable that returns True if button pressed
+        temp_f: Temperature in Fahrenheit, or None for unknown
 
     Returns:
-        bool: True if completed normally, False if interrupted
+        tuple: RGB color tuple (0-255 per channel)
     """
-    fast_blink_on = 0.3
-    fast_blink_off = 0.2
-    post_blink_pause = 3.0
+    if temp_f is None:
+        return (128, 128, 128)  # neutral gray if unknown
 
-    def should_interrupt() -> bool:
-        if not is_pressed_fn:
-            return False
-        try:
-            return bool(is_pressed_fn())
-        except Exception:
-            return False
+    table = _TEMPERATURE_RGB
+    if temp_f <= 0:
+        return (table[0], table[1], table[2])
+    if temp_f >= 100:
+        return (table[300], table[301], table[302])
+
+    degree = int(temp_f)
+    i = degree * 3
+    weight = int((temp_f - degree) * 256)  # 0-255 share of the next degree
+    if weight == 0:
+        return (table[i], table[i + 1], table[i + 2])
+    return (
+        table[i] + (table[i + 3] - table[i]) * weight // 256,
+        table[i + 1] + (table[i + 4] - table[i + 1]) * weight // 256,
+        table[i + 2] + (table[i + 5] - table[i + 2]) * weight // 256,
+    )
+
+
+def _precip_keyframes(
+    color: tuple[int, int, int], precip_percent: int | None
+) -> list[tuple[tuple[int, int, int], int, int]]:
+    """
+    Build the keyframes for one precipitation cycle.
+
+    Args:
+        color: RGB tuple for the blink color
+        precip_percent: Precipitation percentage (0-100), or None
 
+    Returns:
+        list: (color, duration_ms, easing) keyframes for PixelController.play()
+    """
     if precip_percent is None:
         # No data: just hold color for a short time
-        pixel_controller.set_color(color)
-        for _ in range(int(1 / 0.05)):  # ~1 second, checking button
-            if should_interrupt():
-                return False
-            await Scheduler.sleep(0.05)
-        return True
+        return [(color, 1000, Easing.STEP)]
 
     blink_count = round(precip_percent / 10.0)
     if blink_count > 10:
@@ -96,28 +115,38 @@ async def blink_for_precip(
     if blink_count < 0:
         blink_count = 0
 
-    for _ in range(blink_count):
-        pixel_controller.set_color(color)
-        # Break the on/off into small increments, so we can detect button press
-        for _ in range(int(fast_blink_on / 0.05)):
-            if should_interrupt():
-                return False
-            await Scheduler.sleep(0.05)
+    blink = [(color, 300, Easing.STEP), ((0, 0, 0), 200, Easing.STEP)]
+    # After blinking, hold color
+    return blink * blink_count + [(color, 3000, Easing.STEP)]
 
-        pixel_controller.off()
-        for _ in range(int(fast_blink_off / 0.05)):
-            if should_interrupt():
-                return False
-            await Scheduler.sleep(0.05)
 
-    # After blinking, hold color
-    pixel_controller.set_color(color)
-    for _ in range(int(post_blink_pause / 0.05)):
-        if should_interrupt():
-            return False
-        await Scheduler.sleep(0.05)
+async def blink_for_precip(
+    pixel_controller: Any, color: tuple[int, int, int], precip_percent: int | None, is_pressed_fn: Any = None
+) -> bool:
+    """
+    Blinks the NeoPixel according to the 'rounded to nearest 10%' precipitation probability.
+      - Example: 27% => 30% => 3 blinks, then hold color for a few seconds.
+      - Played as one keyframe sequence. A button press stops it mid-cycle for immediate
+        response (Mode wires presses to PixelController.stop()); ``is_pressed_fn`` is
+        checked before starting.
 
-    return True
+    Args:
+        pixel_controller: PixelController instance
+        color: RGB tuple for the blink color
+        precip_percent: Precipitation percentage (0-100), or None
+        is_pressed_fn: Optional callable that returns True if button pressed
+
+    Returns:
+        bool: True if completed normally, False if interrupted
+    """
+    if is_pressed_fn:
+        try:
+            if is_pressed_fn():
+                return False
+        except Exception:
+            pass
+
+    return await pixel_controller.play(_precip_keyframes(color, precip_percent))
 
 
 # ============================================================================
@@ -141,6 +170,8 @@ class WeatherMode(Mode):
     requires_wifi = True
     order = 0  # Primary mode
 
+    _first_color_logged = False  # Time-to-first-color is reported once per boot
+
     def __init__(self) -> None:
         super().__init__()
         self.weather_manager: Any = None  # WeatherManager instance
@@ -194,6 +225,7 @@ class WeatherMode(Mode):
 
             # Display temperature color with precipitation blinks
             current_color = temperature_color(current_temp)
+            self._log_time_to_first_color()
 
             if not await blink_for_precip(self.pixel, current_color, precip_chance, self.is_button_pressed):
                 # Button pressed during blink
@@ -211,6 +243,17 @@ class WeatherMode(Mode):
 
         self.logger.debug("WeatherMode: Exiting")
 
+    def _log_time_to_first_color(self) -> None:
+        """Log how long after startup the first weather color was shown (once per boot)."""
+        if WeatherMode._first_color_logged:
+            return
+        WeatherMode._first_color_logged = True
+        elapsed = seconds_since_startup()
+        if elapsed is None:
+            return
+        source = "cached" if self.weather_manager.is_from_cache() else "live"
+        self.logger.info(f"Time to first color: {elapsed:.2f}s ({source} weather)")
+
     def cleanup(self) -> None:
         """Clean up weather mode resources."""
         super().cleanup()
@@ -70,7 +70,7 @@ class DNSInterceptorService:
         try:
             self.local_ip_bytes = self._ip_to_bytes(local_ip)
         except ValueError as e:
-            self.logger.error(f"DNS Interceptor initialization failed: {e}")
+            self.logger.error("DNS Interceptor initialization failed: %s", e)
             raise
 
     def _ip_to_bytes(self, ip_str: str) -> bytes:
@@ -130,7 +130,7 @@ class DNSInterceptorService:
 
             self.running = True
 
-            self.logger.info(f"DNS interceptor started successfully on port {self.DNS_PORT}")
+            self.logger.info("DNS interceptor started successfully on port %d", self.DNS_PORT)
 
             return True
 
@@ -152,13 +152,13 @@ class DNSInterceptorService:
             return False
 
         except AttributeError as e:
-            self.logger.warning(f"DNS interceptor failed: socketpool API not available: {e}")
+            self.logger.warning("DNS interceptor failed: socketpool API not available: %s", e)
             self.logger.info("Captive portal will use HTTP-only detection")
             self._cleanup_socket()
             return False
 
         except Exception as e:
-            self.logger.error(f"Unexpected error starting DNS interceptor: {e}")
+            self.logger.error("Unexpected error starting DNS interceptor: %s", e)
             self.logger.info("Captive portal will use HTTP-only detection")
             self._cleanup_socket()
             return False
@@ -178,7 +178,7 @@ class DNSInterceptorService:
             self.logger.debug("DNS interceptor stopped successfully")
 
         except Exception as e:
-            self.logger.warning(f"Error stopping DNS interceptor: {e}")
+            self.logger.warning("Error stopping DNS interceptor: %s", e)
             # Force cleanup even if there are errors
             with suppress(Exception):
                 self._cleanup_socket()
@@ -243,24 +243,26 @@ class DNSInterceptorService:
                     if errno in (11, 35, 116):  # EAGAIN, EWOULDBLOCK, or ETIMEDOUT
                         break
                     else:
-                        self._handle_dns_error(f"Socket error: {e}")
+                        self._handle_dns_error("Socket error", e)
                         break
                 except Exception as e:
-                    self._handle_dns_error(f"Error processing query: {e}")
+                    self._handle_dns_error("Error processing query", e)
                     continue
 
         except Exception as e:
-            self._handle_dns_error(f"Critical error in DNS poll: {e}")
+            self._handle_dns_error("Critical error in DNS poll", e)
 
         return queries_processed
 
-    def _handle_dns_error(self, error_msg: str) -> None:
+    def _handle_dns_error(self, error_msg: str, error: Optional[Exception] = None) -> None:
         """
         Handle DNS operation errors with backoff and logging.
 
         Args:
             error_msg (str): Error message to log
+            error (Exception): Optional exception, formatted only if DEBUG logging is enabled
         """
+        self.logger.debug("%s: %s", error_msg, error)
         self.error_count += 1
         self.last_error_time = time.time()
 
@@ -288,7 +290,7 @@ class DNSInterceptorService:
             # Check if processing took too long
             processing_time = time.time() - start_time
             if processing_time > 1.0:  # Warn if processing takes more than 1 second
-                self.logger.warning(f"DNS query processing took {processing_time:.2f}s")
+                self.logger.warning("DNS query processing took %.2fs", processing_time)
 
         except Exception as e:
             raise Exception(f"DNS query processing failed: {e}") from e
@@ -1,7 +1,10 @@
-from core.app_typing import Any
+import os
+
+from core.app_typing import Any, Optional
 from core.logging_helper import logger
 from core.scheduler import Scheduler
 from managers.connection_manager import ConnectionManager
+from utils.utils import read_json, suppress, write_json_atomic
 
 
 class WeatherService:
@@ -11,8 +14,13 @@ class WeatherService:
     Uses the HTTP session managed by ConnectionManager. The session lifecycle
     is handled by ConnectionManager, so this service does not need to manage
     socket resources.
+
+    Geocoding results are persisted to LOCATION_CACHE_FILE keyed by ZIP code, so
+    Nominatim is only queried when the ZIP changes or the cache is missing.
     """
 
+    LOCATION_CACHE_FILE = "/geocode_cache.json"  # Kept across updates, like /secrets.json (PRESERVED_FILES)
+
     def __init__(self, weather_zip: str, session: Any = None) -> None:
         """
         Initialize the WeatherService.
@@ -46,11 +54,61 @@ class WeatherService:
             return self._test_session
         return ConnectionManager.instance().get_session()
 
+    @classmethod
+    def invalidate_location_cache(cls, weather_zip: Optional[str] = None) -> None:
+        """
+        Remove the persisted geocode unless it belongs to weather_zip.
+
+        Args:
+            weather_zip: ZIP code whose cached location should be kept (None removes any cache)
+        """
+        cached = read_json(cls.LOCATION_CACHE_FILE)
+        if weather_zip is not None and isinstance(cached, dict) and cached.get("zip") == weather_zip:
+            return
+        for path in (cls.LOCATION_CACHE_FILE, cls.LOCATION_CACHE_FILE + ".tmp"):
+            with suppress(OSError):
+                os.remove(path)
+
+    def _load_cached_location(self) -> bool:
+        """
+        Restore coordinates and timezone from the persisted geocode.
+
+        Returns:
+            bool: True if a cached location for this ZIP code was applied
+        """
+        cached = read_json(self.LOCATION_CACHE_FILE)
+        if not isinstance(cached, dict) or cached.get("zip") != self.zip_code:
+            return False
+
+        try:
+            lat = float(cached["lat"])
+            lon = float(cached["lon"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        self.lat = lat
+        self.lon = lon
+        self.timezone = cached.get("timezone") or self.timezone
+        self.logger.debug(f"Using cached location for ZIP {self.zip_code}")
+        return True
+
+    def _persist_location(self) -> None:
+        """Persist the resolved coordinates and timezone for the current ZIP code."""
+        location = {"zip": self.zip_code, "lat": self.lat, "lon": self.lon, "timezone": self.timezone}
+        try:
+            write_json_atomic(self.LOCATION_CACHE_FILE, location)
+        except OSError as e:
+            # Read-only filesystem (USB dev mode) - geocode again next boot
+            self.logger.debug(f"Could not persist geocode cache: {e}")
+
     async def _ensure_location(self) -> bool:
-        """Ensure we have coordinates for the ZIP code."""
+        """Ensure we have coordinates for the ZIP code (from flash cache or Nominatim)."""
         if self.lat is not None and self.lon is not None:
             return True
 
+        if self._load_cached_location():
+            return True
+
         try:
             # NOTE: session.get() is blocking (CircuitPython limitation)
             # We yield control immediately after to allow scheduler to run other tasks
@@ -67,6 +125,7 @@ class WeatherService:
                 result = data[0]
                 self.lat = float(result["lat"])
                 self.lon = float(result["lon"])
+                self._persist_location()
                 return True
             else:
                 self.logger.warning(f"No location found for ZIP {self.zip_code}")
@@ -76,37 +135,30 @@ class WeatherService:
             self.logger.error(f"Geocoding failed: {e}")
             return False
 
-    async def get_current_temperature(self) -> float | None:
-        """
-        Returns the current temperature in degrees Fahrenheit.
-
-        Returns:
-            float: Current temperature in °F, or None if location data unavailable
+    async def fetch_snapshot(
+        self, start_time_offset: float, forecast_window_duration: float
+    ) -> tuple[float | None, float | None, int | None]:
         """
-        if not await self._ensure_location():
-            return None
+        Fetch current temperature, daily high and windowed precipitation chance in one request.
 
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={self.lat}&longitude={self.lon}&current_weather=true&temperature_unit=fahrenheit&timezone={self.timezone}&models=dmi_seamless"
-        session = self._get_session()
-        response = session.get(url)
-        await Scheduler.yield_control()
+        Combines the current, daily and hourly Open-Meteo blocks into a single GET so each
+        refresh pays for one TLS handshake and one JSON parse instead of three. The hourly
+        block is trimmed with forecast_hours to just the hours the window can reach.
 
-        data = response.json()
-        response.close()
-
-        return data["current_weather"]["temperature"]
-
-    async def get_daily_high(self) -> float | None:
-        """
-        Returns the forecasted high temperature (in °F) for the current day.
+        Args:
+            start_time_offset: Hours from 'current hour' to start the precipitation window
+            forecast_window_duration: Hours to include in the precipitation window
 
         Returns:
-            float: Daily high temperature in °F, or None if location data unavailable
+            tuple: (current temperature °F, daily high °F, max precipitation probability 0-100),
+                   or (None, None, None) if location data unavailable
         """
         if not await self._ensure_location():
-            return None
+            return None, None, None
 
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={self.lat}&longitude={self.lon}&daily=temperature_2m_max&forecast_days=1&temperature_unit=fahrenheit&timezone={self.timezone}&models=dmi_seamless"
+        # +1 hour so the window is still covered if the hour rolls over mid-request
+        forecast_hours = max(1, int(start_time_offset) + int(forecast_window_duration) + 1)
+        url = f"https://api.open-meteo.com/v1/forecast?latitude={self.lat}&longitude={self.lon}&current_weather=true&daily=temperature_2m_max&hourly=precipitation_probability&forecast_days=1&forecast_hours={forecast_hours}&temperature_unit=fahrenheit&timezone={self.timezone}&models=dmi_seamless"
         session = self._get_session()
         response = session.get(url)
         await Scheduler.yield_control()
@@ -114,35 +166,23 @@ class WeatherService:
         data = response.json()
         response.close()
 
-        return data["daily"]["temperature_2m_max"][0]
+        temperature = data["current_weather"]["temperature"]
+        daily_high = data["daily"]["temperature_2m_max"][0]
+        precip = self._max_precip_in_window(data, start_time_offset, forecast_window_duration)
+        return temperature, daily_high, precip
 
-    async def get_precip_chance_in_window(
-        self, start_time_offset: float, forecast_window_duration: float
-    ) -> int | None:
+    def _max_precip_in_window(self, data: dict, start_time_offset: float, forecast_window_duration: float) -> int:
         """
-        Returns the maximum precipitation probability (%) from the hourly data array,
-        by matching the hour in 'current_weather.time' to the hour entries in 'hourly.time'.
-        For example, if current_weather.time is '2025-02-06T14:15', it will look for
-        '2025-02-06T14:00' in hourly.time.
+        Return the maximum hourly precipitation probability within the requested window.
 
         Args:
+            data: Parsed Open-Meteo response containing 'current_weather' and 'hourly' blocks
             start_time_offset: Hours from 'current hour' to start
             forecast_window_duration: Hours to include
 
         Returns:
             int: Maximum precipitation probability in that window (0-100), or 0 if no data
         """
-        if not await self._ensure_location():
-            return None
-
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={self.lat}&longitude={self.lon}&current_weather=true&hourly=precipitation_probability&forecast_days=3&timezone={self.timezone}&models=dmi_seamless"
-        session = self._get_session()
-        response = session.get(url)
-        await Scheduler.yield_control()
-
-        data = response.json()
-        response.close()
-
         times = data["hourly"]["time"]  # e.g., ["2025-02-06T14:00", ...]
         probs = data["hourly"]["precipitation_probability"]
         current_time_str = data["current_weather"]["time"]  # e.g. "2025-02-06T14:15"
@@ -8,12 +8,21 @@ during firmware updates, and self-healing from catastrophic failures.
 import os
 import traceback
 
+try:
+    import adafruit_hashlib as hashlib  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
+except ImportError:
+    hashlib = None  # Recovery must work even if /lib is damaged; hash checks are skipped
+
 from core.app_typing import List
 from core.logging_helper import WicidLogger, logger
-from utils.utils import remove_directory_recursive, suppress
+from utils.utils import copy_file, remove_directory_recursive, suppress
 
 RECOVERY_DIR = "/recovery"
+# Hash manifest of the backup: one "<sha256> <path>" line per file (boot.py parses it too)
 RECOVERY_INTEGRITY_FILE = "/recovery/.integrity"
+# Hash index of the installed release (see update_install); stale once anything is restored
+INSTALLED_INDEX_FILE = "/installed_files.json"
+_COPY_BUFFER_SIZE = 2048
 
 # CRITICAL_FILES: Complete set for boot + OTA self-healing capability.
 # Missing any of these prevents the device from downloading/installing updates.
@@ -76,42 +85,76 @@ def check_and_restore_from_recovery(log_file: str | None = None) -> bool:
 
 def create_recovery_backup() -> tuple[bool, str]:
     """
-    Create a fresh recovery backup of critical system files.
+    Refresh the recovery backup of critical system files.
 
-    Clears any existing backup first to ensure no stale files remain,
-    then backs up only critical files needed for device to boot and perform updates.
-    Recovery backup is persistent and only updated on successful installations.
+    The backup is incremental: a critical file is only copied when its hash differs
+    from the one recorded in the backup's integrity manifest, or when the backup copy
+    no longer matches that hash. A backup without a manifest (or a build without
+    hashlib) is cleared and copied in full. Files that are not critical are removed
+    so no stale files remain. Recovery backup is persistent and only updated on
+    successful installations.
 
     Returns:
         tuple: (bool, str) - (success, message)
     """
     log = logger("wicid.recovery")
     try:
-        # Clear existing recovery directory to remove stale files
-        _clear_recovery_directory()
-        log.debug("Cleared existing recovery directory")
+        buffer = bytearray(_COPY_BUFFER_SIZE)
+        recorded = _read_integrity_manifest() if hashlib is not None else {}
+        if recorded:
+            _remove_stale_backup_files()
+        else:
+            # No manifest: nothing in the backup can be trusted, start fresh
+            _clear_recovery_directory()
+            log.debug("Cleared existing recovery directory")
 
-        # Create fresh recovery directory
+        # Create recovery directory (exists already for an incremental refresh)
         try:
             os.mkdir(RECOVERY_DIR)
             log.debug(f"Created recovery directory: {RECOVERY_DIR}")
         except OSError:
-            pass  # Directory already exists (shouldn't happen after clear)
+            pass
 
-        # Copy critical files to recovery
-        backed_up_count, failed_files = _copy_critical_files("", RECOVERY_DIR)
+        if hashlib is None:
+            backed_up_count, failed_files = _copy_critical_files("", RECOVERY_DIR, buffer=buffer)
+            copied_count = backed_up_count
+        else:
+            current = {}
+            for path in CRITICAL_FILES:
+                digest = file_sha256(path, buffer)
+                if digest is not None:
+                    current[path] = digest
+            changed = {
+                path
+                for path, digest in current.items()
+                if recorded.get(path) != digest or file_sha256(RECOVERY_DIR + path, buffer) != digest
+            }
+            # Backup copies of files missing from root are left as they are
+            hashes = {path: digest for path, digest in recorded.items() if path in CRITICAL_FILES}
+            hashes.update(current)
+
+            failed_files = []
+            if changed:
+                # Drop changed entries first so an interrupted copy is never trusted
+                _write_integrity_manifest({path: hashes[path] for path in hashes if path not in changed})
+                copied_count, failed_files = _copy_critical_files("", RECOVERY_DIR, changed, buffer)
+                if not failed_files:
+                    _write_integrity_manifest(hashes)
+            else:
+                copied_count = 0
+            backed_up_count = len(hashes)
 
         # Sync filesystem
         os.sync()
 
         if failed_files:
-            message = f"Partial backup: {backed_up_count} files backed up, {len(failed_files)} failed"
+            message = f"Partial backup: {copied_count} files backed up, {len(failed_files)} failed"
             log.error(message)
             for failure in failed_files:
                 log.error(f"  - {failure}")
             return (False, message)
         else:
-            message = f"Recovery backup complete: {backed_up_count} critical files backed up"
+            message = f"Recovery backup complete: {backed_up_count} critical files backed up ({copied_count} updated)"
             log.info(message)
             valid, integrity_msg = _validate_backup_integrity()
             if not valid:
@@ -127,6 +170,36 @@ def create_recovery_backup() -> tuple[bool, str]:
         return (False, message)
 
 
+def file_sha256(path: str, buffer: bytearray | None = None) -> str | None:
+    """
+    Hash a file in fixed-size chunks.
+
+    Args:
+        path: File to hash
+        buffer: Optional reusable read buffer
+
+    Returns:
+        str | None: Hex SHA-256 digest, or None if the file cannot be read or
+            hashlib is unavailable
+    """
+    if hashlib is None:
+        return None
+    if buffer is None:
+        buffer = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    sha256 = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                sha256.update(view[:n])
+    except OSError:
+        return None
+    return sha256.hexdigest()
+
+
 def validate_files(base_dir: str, files: set[str] | None = None) -> tuple[bool, List[str]]:
     """
     Validate that all specified files exist in a directory.
@@ -167,24 +240,31 @@ def _clear_recovery_directory() -> None:
     os.sync()
 
 
-def _copy_critical_files(src_base: str, dst_base: str) -> tuple[int, List[str]]:
+def _copy_critical_files(
+    src_base: str, dst_base: str, paths: set[str] | None = None, buffer: bytearray | None = None
+) -> tuple[int, List[str]]:
     """
-    Copy all critical files from src_base to dst_base.
+    Copy critical files from src_base to dst_base.
 
-    Handles directory creation, skipping directories, and error handling.
+    Handles directory creation, skipping directories, and error handling. Files are
+    streamed in chunks through one buffer, so memory use does not grow with file size.
     Used by both create_recovery_backup() and _restore_from_recovery().
 
     Args:
         src_base: Source base directory (empty string for root, "/recovery" for recovery)
         dst_base: Destination base directory (empty string for root, "/recovery" for recovery)
+        paths: Critical files to copy (default: all CRITICAL_FILES)
+        buffer: Optional reusable copy buffer
 
     Returns:
         tuple: (success_count, list of failure_messages)
     """
     copied_count = 0
     failed_files = []
+    if buffer is None:
+        buffer = bytearray(_COPY_BUFFER_SIZE)
 
-    for file_path in CRITICAL_FILES:
+    for file_path in CRITICAL_FILES if paths is None else paths:
         src_path = src_base + file_path if src_base else file_path
         dst_path = dst_base + file_path if dst_base else file_path
 
@@ -203,10 +283,6 @@ def _copy_critical_files(src_base: str, dst_base: str) -> tuple[int, List[str]]:
             except (OSError, NotImplementedError):
                 pass  # Not a directory, continue
 
-            # Read source file
-            with open(src_path, "rb") as src:
-                content = src.read()
-
             # Ensure parent directories exist in destination
             file_dir = "/".join(dst_path.split("/")[:-1])
             if file_dir and file_dir != "/":
@@ -219,10 +295,7 @@ def _copy_critical_files(src_base: str, dst_base: str) -> tuple[int, List[str]]:
                     with suppress(OSError):
                         os.mkdir(current_path)
 
-            # Write to destination
-            with open(dst_path, "wb") as dst:
-                dst.write(content)
-
+            copy_file(src_path, dst_path, buffer)
             copied_count += 1
 
         except Exception as e:
@@ -231,6 +304,53 @@ def _copy_critical_files(src_base: str, dst_base: str) -> tuple[int, List[str]]:
     return (copied_count, failed_files)
 
 
+def _corrupted_backup_files(expected: dict[str, str], buffer: bytearray | None = None) -> List[str]:
+    """
+    List critical files whose backup copy does not match the integrity manifest.
+
+    Args:
+        expected: Integrity manifest ({path: sha256})
+        buffer: Optional reusable read buffer
+
+    Returns:
+        list: Critical file paths that are unlisted, unreadable or differ (sorted)
+    """
+    return sorted(
+        path
+        for path in CRITICAL_FILES
+        if expected.get(path) is None or file_sha256(RECOVERY_DIR + path, buffer) != expected[path]
+    )
+
+
+def _read_integrity_manifest() -> dict[str, str]:
+    """
+    Read the backup's hash manifest.
+
+    Falls back to the temp file if power was lost while it was being replaced, and
+    renames it into place so it is neither removed as a stale file nor missed by
+    boot.py, which only reads RECOVERY_INTEGRITY_FILE.
+
+    Returns:
+        dict: {path: sha256}, empty if there is no readable manifest (legacy backup)
+    """
+    tmp_path = RECOVERY_INTEGRITY_FILE + ".tmp"
+    for candidate in (RECOVERY_INTEGRITY_FILE, tmp_path):
+        hashes = {}
+        try:
+            with open(candidate) as f:
+                for line in f:
+                    digest, _, path = line.strip().partition(" ")
+                    if path:
+                        hashes[path] = digest
+        except OSError:
+            continue
+        if candidate == tmp_path:
+            with suppress(OSError):  # Read-only filesystem: still usable from the temp file
+                os.rename(tmp_path, RECOVERY_INTEGRITY_FILE)
+        return hashes
+    return {}
+
+
 def _recovery_exists() -> bool:
     """
     Check if recovery backup directory exists and contains files.
@@ -245,6 +365,34 @@ def _recovery_exists() -> bool:
         return False
 
 
+def _remove_installed_index() -> None:
+    """Delete the installed file index so the next install hashes the root instead."""
+    for path in (INSTALLED_INDEX_FILE, INSTALLED_INDEX_FILE + ".tmp"):
+        with suppress(OSError):
+            os.remove(path)
+
+
+def _remove_stale_backup_files(rel_dir: str = "") -> None:
+    """
+    Delete files in the recovery directory that are not critical files.
+
+    Args:
+        rel_dir: Directory relative to RECOVERY_DIR (used for recursion)
+    """
+    for item in os.listdir(RECOVERY_DIR + rel_dir):
+        rel_path = f"{rel_dir}/{item}"
+        path = RECOVERY_DIR + rel_path
+        if rel_path in CRITICAL_FILES or path == RECOVERY_INTEGRITY_FILE:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            # Not a file: recurse, then drop the directory if it is now empty
+            with suppress(OSError):
+                _remove_stale_backup_files(rel_path)
+                os.rmdir(path)
+
+
 def _restore_from_recovery(log: WicidLogger) -> tuple[bool, str]:
     """
     Restore critical files from recovery backup to root.
@@ -289,8 +437,24 @@ def _restore_from_recovery(log: WicidLogger) -> tuple[bool, str]:
             log.critical("CRITICAL: Restoring from recovery backup")
             log.critical("=" * 50)
 
-            # Copy critical files from recovery to root
-            restored_count, failed_files = _copy_critical_files(RECOVERY_DIR, "")
+            # Copy critical files from recovery to root. With an integrity manifest, only
+            # verified backup copies are restored, and only where root differs from them.
+            buffer = bytearray(_COPY_BUFFER_SIZE)
+            expected = _read_integrity_manifest() if hashlib is not None else {}
+            paths = None
+            failed_files = []
+            if expected:
+                corrupted = _corrupted_backup_files(expected, buffer)
+                paths = {
+                    path
+                    for path in CRITICAL_FILES
+                    if path not in corrupted and file_sha256(path, buffer) != expected[path]
+                }
+                failed_files = [f"{path}: backup copy failed hash check" for path in corrupted if path in missing_files]
+            restored_count, copy_failures = _copy_critical_files(RECOVERY_DIR, "", paths, buffer)
+            failed_files += copy_failures
+            if restored_count:
+                _remove_installed_index()
 
             # Sync filesystem
             os.sync()
@@ -326,8 +490,8 @@ def _validate_backup_integrity() -> tuple[bool, str]:
     """
     Validate that recovery backup is intact and not corrupted.
 
-    Checks that the recovery directory exists and contains expected files.
-    Future enhancement: verify file hashes against stored integrity data.
+    Checks that the recovery directory contains every critical file and, when the
+    backup has an integrity manifest, that each file still matches its recorded hash.
 
     Returns:
         tuple: (bool, str) - (valid, message)
@@ -343,14 +507,41 @@ def _validate_backup_integrity() -> tuple[bool, str]:
         if not all_present:
             return (False, f"Recovery backup incomplete: {len(missing)} files missing")
 
-        # Check integrity file if it exists
-        try:
-            os.stat(RECOVERY_INTEGRITY_FILE)
-            log.debug("Integrity file found")
-        except OSError:
+        expected = _read_integrity_manifest()
+        if not expected:
             log.debug("No integrity file (legacy backup)")
+            return (True, f"Recovery backup valid: {len(CRITICAL_FILES)} files")
+        if hashlib is None:
+            log.debug("hashlib unavailable - integrity file not checked")
+            return (True, f"Recovery backup valid: {len(CRITICAL_FILES)} files")
+
+        corrupted = _corrupted_backup_files(expected)
+        if corrupted:
+            return (
+                False,
+                f"Recovery backup corrupted: {len(corrupted)} files fail hash check ({', '.join(corrupted)})",
+            )
 
-        return (True, f"Recovery backup valid: {len(CRITICAL_FILES)} files")
+        return (True, f"Recovery backup valid: {len(CRITICAL_FILES)} files verified")
 
     except Exception as e:
         return (False, f"Backup validation failed: {e}")
+
+
+def _write_integrity_manifest(hashes: dict[str, str]) -> None:
+    """
+    Replace the backup's hash manifest.
+
+    Written to a temp file and renamed into place (FAT cannot rename onto an
+    existing file, so the old manifest is removed just before the rename).
+
+    Args:
+        hashes: {path: sha256} of the files in the backup
+    """
+    tmp_path = RECOVERY_INTEGRITY_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        for path in sorted(hashes):
+            f.write(f"{hashes[path]} {path}\n")
+    with suppress(OSError):
+        os.remove(RECOVERY_INTEGRITY_FILE)
+    os.rename(tmp_path, RECOVERY_INTEGRITY_FILE)
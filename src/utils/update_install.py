@@ -3,7 +3,8 @@ Update installation utilities for WICID firmware.
 
 Handles the installation of pending firmware updates during boot.
 This module is separate from UpdateManager (which handles download/staging)
-and recovery.py (which handles backup/restore).
+and recovery.py (which handles backup/restore). UpdateManager also uses the delta
+helpers here (apply_delta, missing_package_files) while staging a delta package.
 
 Usage:
     from utils.update_install import process_pending_update
@@ -12,6 +13,7 @@ Usage:
 
 import json
 import os
+import struct
 import sys
 import time
 import traceback
@@ -19,13 +21,16 @@ import traceback
 import microcontroller
 
 from core.app_typing import Any, List
-from core.logging_helper import WicidLogger, logger
-from utils.recovery import CRITICAL_FILES, create_recovery_backup, validate_files
+from core.logging_helper import WicidLogger, flush_logs, logger
+from utils.recovery import CRITICAL_FILES, INSTALLED_INDEX_FILE, create_recovery_backup, file_sha256, validate_files
 from utils.utils import (
     check_release_compatibility,
+    copy_file,
     mark_incompatible_release,
+    read_json,
     remove_directory_recursive,
     suppress,
+    write_json_atomic,
 )
 
 # Path constants for pending update directory structure
@@ -35,15 +40,34 @@ PENDING_STAGING_DIR = "/pending_update/.staging"
 READY_MARKER_FILE = "/pending_update/.ready"
 INSTALL_SCRIPTS_DIR = "firmware_install_scripts"
 
+# INSTALLED_INDEX_FILE (defined in recovery, which deletes it after restoring files) caches
+# {"/path": [sha256, size, mtime]} for the last cleanly installed release, so identical files
+# are not rewritten; a file whose size or mtime changed since is hashed again
+
+# Delta packages (see builder.build_delta_package): delta.json lists what changed against
+# the installed release, and changed files may ship as copy/insert patches
+DELTA_INDEX_FILE = "delta.json"
+DELTA_PATCH_SUFFIX = ".wdelta"
+_PATCH_MAGIC = b"WDL1"
+_PATCH_COPY = 0  # <B I I>: copy length bytes from offset in the base file
+_PATCH_INSERT = 1  # <B I> + data: insert length literal bytes
+_COPY_BUFFER_SIZE = 2048
+
 # Files/directories that should NEVER be deleted during OTA updates
-# Only user-provided data that cannot be regenerated
+# User-provided data that cannot be regenerated, plus logs and caches the update must not cost
 PRESERVED_FILES = {
     "boot_log.txt",  # Boot log file
+    "boot_log.txt.1",  # Rotated boot log (older half, see logging_helper._FileSink)
+    "geocode_cache.json",  # ZIP geocoding result (WeatherService invalidates it when the ZIP changes)
     "secrets.json",  # WiFi credentials and API keys (user-provided)
+    "weather_cache.json",  # Last weather snapshot for the first color after boot (age-checked on load)
     "incompatible_releases.json",  # Failed update tracking (user data)
     "DEVELOPMENT",  # Development mode flag (user-set)
 }
 
+# Lowercased once for the case-insensitive (FAT32) checks done per staged file
+_PRESERVED_NAMES = {name.lower() for name in PRESERVED_FILES}
+
 # Directories that must be preserved during full firmware replacement
 PRESERVED_DIRS = {
     "recovery",  # Recovery backup for rollback
@@ -79,6 +103,9 @@ def process_pending_update() -> None:
             f"WICID Firmware Update: {current_version} → {update_version} (timestamp: {time.monotonic()})"
         )
 
+        # Taken before anything (including install scripts) can modify the root
+        installed_index = _pop_installed_index(current_version)
+
         # Execute pre-install script (runs before validation)
         if not _run_install_script_step(manifest, "pre_install", update_version, is_fatal=True):
             return
@@ -90,17 +117,35 @@ def process_pending_update() -> None:
         if not _verify_compatibility(manifest, current_version):
             return
 
+        if not _verify_delta_base(manifest, current_version):
+            return
+
         # Validate package integrity (full releases only)
         if not _validate_package_integrity(manifest):
             return
 
-        # Delete old firmware and install new files
-        _delete_all_except(_get_preserved_paths())
+        file_hashes = manifest.get("files")
+        unchanged = _unchanged_files(PENDING_ROOT_DIR, file_hashes, installed_index) if file_hashes else set()
+        if unchanged:
+            _boot_file_logger().info(f"{len(unchanged)} files already up to date - not rewriting them")
+
+        delta_index = load_delta_index(PENDING_ROOT_DIR) if manifest.get("delta_from") else None
+        if delta_index is not None:
+            # Delta package: keep installed files it does not replace
+            _remove_delta_files(delta_index)
+        elif file_hashes:
+            # Full reset, file by file: delete only what the new release does not contain
+            _remove_obsolete_files(set(file_hashes), _get_preserved_paths())
+        else:
+            # Delete old firmware and install new files
+            _delete_all_except(_get_preserved_paths())
         os.sync()
         _update_led()
 
-        _move_directory_contents(PENDING_ROOT_DIR, "/")
+        failures = _move_directory_contents(PENDING_ROOT_DIR, "/", unchanged)
         os.sync()
+        if file_hashes and failures == 0:
+            _save_installed_index(update_version, file_hashes)
 
         # Create recovery backup
         _create_recovery_backup()
@@ -117,6 +162,136 @@ def process_pending_update() -> None:
         _boot_file_logger().error(f"Error checking for updates: {e}\nTraceback: {traceback.format_exc()}")
 
 
+def load_delta_index(package_dir: str) -> dict[str, Any] | None:
+    """
+    Load delta.json from an extracted package.
+
+    Args:
+        package_dir: Directory the package was extracted to
+
+    Returns:
+        dict | None: Delta index, or None for a full package
+    """
+    try:
+        with open(f"{package_dir}/{DELTA_INDEX_FILE}") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def apply_delta(package_dir: str, delta_index: dict[str, Any], root_dir: str = "") -> tuple[bool, str]:
+    """
+    Rebuild patched files of an extracted delta package against the installed release.
+
+    Every unchanged and patched file must hash to the value recorded for the base
+    release before anything is patched; any mismatch fails the delta so the caller
+    can fall back to the full package. Patched files are written next to the patch
+    in package_dir and checked against their new hash.
+
+    Args:
+        package_dir: Directory the delta package was extracted to
+        delta_index: Parsed delta.json
+        root_dir: Root of the installed release ("" for the device root)
+
+    Returns:
+        tuple: (success, message)
+    """
+    buffer = bytearray(_COPY_BUFFER_SIZE)
+    patched = delta_index.get("patched", {})
+
+    for path, expected in delta_index.get("unchanged", {}).items():
+        if file_sha256(root_dir + path, buffer) != expected:
+            return False, f"Installed file differs from delta base: {path}"
+    for path, entry in patched.items():
+        if file_sha256(root_dir + path, buffer) != entry["base_sha256"]:
+            return False, f"Installed file differs from delta base: {path}"
+
+    for path, entry in patched.items():
+        patch_path = package_dir + path + DELTA_PATCH_SUFFIX
+        out_path = package_dir + path
+        try:
+            _apply_patch(root_dir + path, patch_path, out_path, buffer)
+            os.remove(patch_path)
+        except (OSError, ValueError) as e:
+            return False, f"Could not patch {path}: {e}"
+        if file_sha256(out_path, buffer) != entry["sha256"]:
+            return False, f"Patched file hash mismatch: {path}"
+
+    return True, (
+        f"Delta applied: {len(patched)} patched, {len(delta_index.get('replaced', {}))} replaced, "
+        f"{len(delta_index.get('removed', []))} removed"
+    )
+
+
+def missing_package_files(package_dir: str, files: set[str], root_dir: str = "") -> List[str]:
+    """
+    List required files an extracted package would not provide.
+
+    A delta package only carries changed files, so files it lists as unchanged are
+    satisfied by the installed release.
+
+    Args:
+        package_dir: Directory the package was extracted to
+        files: Required file paths (e.g. CRITICAL_FILES)
+        root_dir: Root of the installed release ("" for the device root)
+
+    Returns:
+        list: Missing file paths (empty if all present)
+    """
+    _, missing_files = validate_files(package_dir, files)
+    delta_index = load_delta_index(package_dir)
+    if delta_index is None or not missing_files:
+        return missing_files
+    unchanged = delta_index.get("unchanged", {})
+    kept = {path for path in missing_files if path in unchanged}
+    _, kept_missing = validate_files(root_dir, kept)
+    return [path for path in missing_files if path not in kept] + kept_missing
+
+
+def _apply_patch(base_path: str, patch_path: str, out_path: str, buffer: bytearray) -> None:
+    """
+    Write out_path by replaying a copy/insert patch against base_path.
+
+    Args:
+        base_path: Installed file the patch was made against
+        patch_path: Patch file from the delta package
+        out_path: File to write
+        buffer: Reusable copy buffer
+
+    Raises:
+        ValueError: If the patch is malformed or truncated
+    """
+    view = memoryview(buffer)
+    with open(patch_path, "rb") as patch, open(base_path, "rb") as base, open(out_path, "wb") as out:
+        if patch.read(len(_PATCH_MAGIC)) != _PATCH_MAGIC:
+            raise ValueError("not a delta patch")
+        while True:
+            op = patch.read(1)
+            if not op:
+                break
+            if op[0] == _PATCH_COPY:
+                fields = patch.read(8)
+                if len(fields) != 8:
+                    raise ValueError("truncated delta patch")
+                offset, remaining = struct.unpack("<II", fields)
+                base.seek(offset)
+                source = base
+            elif op[0] == _PATCH_INSERT:
+                fields = patch.read(4)
+                if len(fields) != 4:
+                    raise ValueError("truncated delta patch")
+                (remaining,) = struct.unpack("<I", fields)
+                source = patch
+            else:
+                raise ValueError(f"unknown patch op {op[0]}")
+            while remaining > 0:
+                n = source.readinto(view[: min(remaining, len(buffer))])
+                if not n:
+                    raise ValueError("truncated delta patch")
+                out.write(view[:n])
+                remaining -= n
+
+
 def _boot_file_logger() -> WicidLogger:
     """Get boot logger instance with file output."""
     global _boot_file_logger_instance
@@ -139,6 +314,7 @@ def _cleanup_and_reboot_system(current_version: str, update_version: str, is_scr
         f"{'=' * 50}\n{update_type} complete: {current_version} → {update_version}\nRebooting...\n{'=' * 50}"
     )
 
+    flush_logs()
     os.sync()
     microcontroller.reset()
 
@@ -419,19 +595,31 @@ def _load_pending_manifest() -> tuple[dict[str, Any] | None, str]:
         return None, ""
 
 
-def _move_directory_contents(src_dir: str, dest_dir: str) -> None:
+def _move_directory_contents(
+    src_dir: str, dest_dir: str, unchanged: set[str] | None = None, buffer: bytearray | None = None
+) -> int:
     """
     Move all files and directories from src to dest.
     Logs errors but continues to attempt moving remaining files.
 
+    Files are renamed into place; only if the rename fails (e.g. src and dest on
+    different filesystems) is the file copied in chunks through one reused buffer.
+
     CRITICAL: Never overwrites preserved files (secrets.json, etc.)
 
     Args:
         src_dir: Source directory path
         dest_dir: Destination directory path
+        unchanged: Source file paths whose destination already holds identical bytes
+            (see _unchanged_files); these are deleted from src instead of moved
+        buffer: Copy buffer shared by recursive calls (allocated on first use)
+
+    Returns:
+        int: Number of files or directories that could not be moved
     """
     _boot_file_logger().info(f"Moving files from {src_dir} to {dest_dir}...")
 
+    failures = 0
     items = os.listdir(src_dir)
 
     for item in items:
@@ -443,7 +631,7 @@ def _move_directory_contents(src_dir: str, dest_dir: str) -> None:
 
         # Skip preserved files - never overwrite them during OTA updates
         # Use case-insensitive comparison for FAT32 filesystem compatibility
-        if dest_dir == "/" and item.lower() in [f.lower() for f in PRESERVED_FILES]:
+        if dest_dir == "/" and item.lower() in _PRESERVED_NAMES:
             _boot_file_logger().info(f"  Skipping preserved file: {item}")
             # Remove from pending_update to avoid confusion
             with suppress(OSError):
@@ -463,42 +651,46 @@ def _move_directory_contents(src_dir: str, dest_dir: str) -> None:
                     os.mkdir(dest_path)  # Directory might already exist
 
                 # Recursively move contents
-                _move_directory_contents(src_path, dest_path)
+                failures += _move_directory_contents(src_path, dest_path, unchanged, buffer)
 
                 # Remove source directory
                 try:
                     os.rmdir(src_path)
                 except OSError as e:
                     _boot_file_logger().error(f"  Could not remove {src_path}: {e}")
+            elif unchanged and src_path in unchanged:
+                # Identical file already installed - skip the flash write
+                os.remove(src_path)
             else:
                 # Move file
                 try:
                     # Additional safety check: never overwrite preserved files
-                    # Extract filename from dest_path for checking
-                    dest_filename = dest_path.split("/")[-1]
-                    if dest_filename.lower() in [f.lower() for f in PRESERVED_FILES]:
-                        _boot_file_logger().critical(f"Attempted to overwrite preserved file: {dest_filename}")
+                    if item.lower() in _PRESERVED_NAMES:
+                        _boot_file_logger().critical(f"Attempted to overwrite preserved file: {item}")
                         _boot_file_logger().critical(f"  Source: {src_path}")
                         _boot_file_logger().critical(f"  Destination: {dest_path}")
-                        raise Exception(f"BUG: Move would overwrite preserved file {dest_filename}")
-
-                    # Read from source
-                    with open(src_path, "rb") as src_file:
-                        content = src_file.read()
-
-                    # Write to destination
-                    with open(dest_path, "wb") as dest_file:
-                        dest_file.write(content)
-
-                    # Remove source
-                    os.remove(src_path)
+                        raise Exception(f"BUG: Move would overwrite preserved file {item}")
+
+                    # FAT cannot rename onto an existing file
+                    with suppress(OSError):
+                        os.remove(dest_path)
+                    try:
+                        os.rename(src_path, dest_path)
+                    except OSError:
+                        if buffer is None:
+                            buffer = bytearray(_COPY_BUFFER_SIZE)
+                        copy_file(src_path, dest_path, buffer)
+                        os.remove(src_path)
                 except Exception as e:
+                    failures += 1
                     _boot_file_logger().error(f"  Could not move {src_path}: {e}")
 
         except Exception as e:
+            failures += 1
             _boot_file_logger().error(f"  Error processing {item}: {e}")
 
     _boot_file_logger().info("✓ File move complete")
+    return failures
 
 
 def _pending_update_exists() -> bool:
@@ -529,6 +721,99 @@ def _pending_update_exists() -> bool:
     return True
 
 
+def _pop_installed_index(current_version: str, index_path: str = INSTALLED_INDEX_FILE) -> dict[str, list] | None:
+    """
+    Load the cached hash index of the installed root, then delete it.
+
+    The index is deleted before the install modifies anything, so an interrupted
+    install cannot leave an index that no longer describes the files on flash; it
+    is rewritten by _save_installed_index() once the new files are all in place.
+
+    Args:
+        current_version: Installed firmware version (the index must be for it)
+        index_path: Index file path
+
+    Returns:
+        dict | None: {"/path": [sha256, size, mtime]} of installed files, or None if no usable index
+    """
+    index = read_json(index_path)
+    for path in (index_path, index_path + ".tmp"):
+        with suppress(OSError):
+            os.remove(path)
+    if not isinstance(index, dict) or index.get("version") != current_version:
+        return None
+    files = index.get("files")
+    return files if isinstance(files, dict) else None
+
+
+def _remove_delta_files(delta_index: dict[str, Any]) -> None:
+    """
+    Delete files a delta release removed, and the delta index itself.
+
+    Args:
+        delta_index: Parsed delta.json from the pending update
+    """
+    removed = delta_index.get("removed", [])
+    _boot_file_logger().info(f"Delta install from {delta_index.get('delta_from')}: removing {len(removed)} files")
+    preserved = {f"/{name}".lower() for name in PRESERVED_FILES}
+    for path in removed:
+        if path.lower() in preserved:
+            continue
+        with suppress(OSError):
+            os.remove(path)
+    with suppress(OSError):
+        os.remove(f"{PENDING_ROOT_DIR}/{DELTA_INDEX_FILE}")
+
+
+def _remove_obsolete_files(keep: set[str], preserve_paths: list[str], root_dir: str = "") -> None:
+    """
+    Delete installed files that are not part of the new release.
+
+    File-level counterpart of _delete_all_except() for packages whose manifest lists
+    every file: files that stay are left in place so identical ones need no rewrite.
+    Directories left empty are removed. Logs errors and continues.
+
+    Args:
+        keep: Paths the new release contains (e.g. {'/boot.py', '/core/scheduler.mpy'})
+        preserve_paths: Paths to preserve (e.g., ['/secrets.json', '/pending_update'])
+        root_dir: Root of the installed release ("" for the device root)
+    """
+    _boot_file_logger().info("Performing full reset (deleting files not in the new release)...")
+
+    # Case-insensitive comparison for FAT32 filesystem
+    keep_set = {path.lower() for path in keep}
+    preserve_set = {path.rstrip("/").lower() for path in preserve_paths}
+    removed = 0
+
+    def remove_under(rel_dir: str) -> None:
+        nonlocal removed
+        for item in os.listdir(root_dir + rel_dir or "/"):
+            rel_path = f"{rel_dir}/{item}"
+            if rel_path.lower() in preserve_set or rel_path.lower() in keep_set:
+                continue
+            if not rel_dir and item in [".Trashes", ".metadata_never_index", ".fseventsd", "System Volume Information"]:
+                continue
+
+            path = root_dir + rel_path
+            try:
+                os.remove(path)
+                removed += 1
+                continue
+            except OSError:
+                pass
+
+            try:
+                # Not a file: recurse, then drop the directory if nothing in it was kept
+                remove_under(rel_path)
+                with suppress(OSError):
+                    os.rmdir(path)
+            except Exception as e:
+                _boot_file_logger().error(f"  Error processing {path}: {e}")
+
+    remove_under("")
+    _boot_file_logger().info(f"✓ Full reset complete ({removed} obsolete files removed)")
+
+
 def _run_install_script_step(
     manifest: dict[str, Any],
     script_type: str,
@@ -575,6 +860,85 @@ def _run_install_script_step(
     return script_success
 
 
+def _save_installed_index(
+    version: str, file_hashes: dict[str, str], index_path: str = INSTALLED_INDEX_FILE, root_dir: str = ""
+) -> None:
+    """
+    Record the hash table of a cleanly installed release for the next install.
+
+    Each hash is stored with the installed file's size and mtime, so a file changed
+    afterwards (edited over USB, say) is recognised and hashed again.
+
+    Args:
+        version: Version that was installed
+        file_hashes: Manifest "files" table of that release
+        index_path: Index file path
+        root_dir: Root of the installed release ("" for the device root)
+    """
+    files = {}
+    for path, sha256 in file_hashes.items():
+        signature = _stat_signature(root_dir + path)
+        if signature is not None:
+            files[path] = [sha256] + signature
+    try:
+        write_json_atomic(index_path, {"version": version, "files": files})
+    except OSError as e:
+        _boot_file_logger().warning(f"Could not save installed file index: {e}")
+
+
+def _stat_signature(path: str) -> list[int] | None:
+    """
+    Size and mtime of a file, or None if it does not exist.
+
+    Args:
+        path: File path
+
+    Returns:
+        list | None: [size, mtime]
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st[6], int(st[8])]  # st_size, st_mtime
+
+
+def _unchanged_files(
+    staged_dir: str, file_hashes: dict[str, str], installed_index: dict[str, list] | None, root_dir: str = ""
+) -> set[str]:
+    """
+    Find staged files whose installed copy already has the same content.
+
+    An installed hash is taken from the cached index only while the file's size and
+    mtime still match what the index recorded; otherwise the file is hashed. Reads only.
+
+    Args:
+        staged_dir: Directory the package was extracted to
+        file_hashes: Manifest "files" table ({"/path": sha256}) of the new release
+        installed_index: Cached {"/path": [sha256, size, mtime]} of the installed root, or None
+        root_dir: Root of the installed release ("" for the device root)
+
+    Returns:
+        set: Staged file paths (staged_dir + path) that need not be written
+    """
+    buffer = bytearray(_COPY_BUFFER_SIZE)
+    unchanged = set()
+    for path, expected in file_hashes.items():
+        if _stat_signature(staged_dir + path) is None:
+            continue  # Not staged (delta package)
+        signature = _stat_signature(root_dir + path)
+        if signature is None:
+            continue  # Not installed
+        entry = installed_index.get(path) if installed_index else None
+        if isinstance(entry, list) and entry[1:] == signature:
+            current = entry[0]
+        else:
+            current = file_sha256(root_dir + path, buffer)
+        if current == expected:
+            unchanged.add(staged_dir + path)
+    return unchanged
+
+
 def _update_led(indicate_error: bool = False) -> None:
     """
     Update LED animation during update installation.
@@ -643,7 +1007,8 @@ def _validate_package_integrity(manifest: dict[str, Any]) -> bool:
         all_present: bool = True
         missing_files: List[str] = []
     else:
-        all_present, missing_files = validate_files(PENDING_ROOT_DIR, CRITICAL_FILES)
+        missing_files = missing_package_files(PENDING_ROOT_DIR, CRITICAL_FILES)
+        all_present = not missing_files
 
     if not all_present:
         files_summary = ", ".join(missing_files[:5])
@@ -681,6 +1046,30 @@ def _validate_ready_marker() -> bool:
         return False
 
 
+def _verify_delta_base(manifest: dict[str, Any], current_version: str) -> bool:
+    """
+    Verify a delta package was built against the installed release.
+
+    Returns:
+        bool: True for full packages and matching deltas, False otherwise
+    """
+    delta_from = manifest.get("delta_from")
+    if not delta_from:
+        return True
+
+    if delta_from != current_version:
+        _handle_update_error(
+            manifest.get("version", "unknown"), f"Delta built for {delta_from}, installed version is {current_version}"
+        )
+        return False
+    if load_delta_index(PENDING_ROOT_DIR) is None:
+        _handle_update_error(manifest.get("version", "unknown"), "Delta package is missing its index")
+        return False
+
+    _boot_file_logger().info(f"✓ Delta base verified ({delta_from})")
+    return True
+
+
 def _verify_compatibility(manifest: dict[str, Any], current_version: str) -> bool:
     """
     Verify update is compatible with current system.
@@ -13,7 +13,7 @@ import time
 import microcontroller  # pyright: ignore[reportMissingImports]  # CircuitPython-only module
 
 from core.app_typing import Any, Optional
-from core.logging_helper import logger
+from core.logging_helper import flush_logs, logger
 
 
 class suppress:
@@ -193,6 +193,67 @@ def compare_versions(version1: str, version2: str) -> int:
     return 0
 
 
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write JSON to path without ever exposing a partially written file.
+
+    Data is written to "<path>.tmp" first and then renamed into place. FAT cannot
+    rename onto an existing file, so the old file is removed just before the
+    rename; read_json() falls back to the temp file if power is lost in between.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the filesystem is read-only or the write fails
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    with suppress(OSError):
+        os.remove(path)
+    os.rename(tmp_path, path)
+    os.sync()
+
+
+def read_json(path: str) -> Any:
+    """
+    Read a JSON file written by write_json_atomic().
+
+    Args:
+        path: File path to read
+
+    Returns:
+        Parsed JSON data, or None if neither the file nor its temp copy is readable
+    """
+    for candidate in (path, path + ".tmp"):
+        try:
+            with open(candidate) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+_startup_time: float | None = None
+
+
+def mark_startup_time() -> None:
+    """Record the monotonic time at which the application started (called once from code_support)."""
+    global _startup_time
+    _startup_time = time.monotonic()
+
+
+def seconds_since_startup() -> float | None:
+    """
+    Return seconds elapsed since mark_startup_time(), or None if it was never called.
+    """
+    if _startup_time is None:
+        return None
+    return time.monotonic() - _startup_time
+
+
 def mark_incompatible_release(version: str, reason: str = "Unknown") -> None:
     """
     Mark a release version as incompatible to prevent retry loops.
@@ -348,9 +409,39 @@ def trigger_safe_mode() -> None:
     log.info("Triggering Safe Mode for development access")
     log.info("Device will reboot with USB enabled")
     microcontroller.on_next_reset(microcontroller.RunMode.SAFE_MODE)
+    flush_logs()
     microcontroller.reset()
 
 
+def copy_file(src_path: str, dst_path: str, buffer: bytearray | None = None) -> int:
+    """
+    Copy a file in fixed-size chunks, so memory use does not grow with file size.
+
+    Args:
+        src_path: File to copy
+        dst_path: Destination file (overwritten)
+        buffer: Optional reusable copy buffer; its size sets the chunk size
+
+    Returns:
+        int: Number of bytes copied
+
+    Raises:
+        OSError: If either file cannot be opened or the write fails
+    """
+    if buffer is None:
+        buffer = bytearray(2048)
+    view = memoryview(buffer)
+    copied = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            n = src.readinto(view)
+            if not n:
+                break
+            dst.write(view[:n])
+            copied += n
+    return copied
+
+
 def remove_directory_recursive(path: str) -> None:
     """
     Recursively remove a directory and all its contents.
@@ -3,15 +3,29 @@ Lightweight ZIP file extraction for CircuitPython.
 
 Implements basic ZIP file parsing and extraction using zlib for decompression.
 Supports stored (uncompressed) and deflated files.
+
+Members are streamed through a fixed-size buffer rather than loaded whole, so
+peak heap stays bounded by CHUNK_SIZE regardless of member size.
 """
 
+import io
 import struct
 import zlib
 
+try:
+    from binascii import crc32
+except ImportError:
+    from zlib import crc32
+
 from core.app_typing import Any, Dict, List
 from core.logging_helper import logger
 from utils.utils import suppress
 
+try:
+    import deflate  # pyright: ignore[reportMissingImports]  # CircuitPython 9+ streaming inflate
+except ImportError:
+    deflate = None
+
 
 class ZipFile:
     """Simple ZIP file reader for CircuitPython."""
@@ -25,6 +39,9 @@ class ZipFile:
     STORED = 0  # No compression
     DEFLATED = 8  # DEFLATE compression
 
+    # Bytes read/written per streaming step (bounds peak heap during extraction)
+    CHUNK_SIZE = 2048
+
     def __init__(self, filename: str) -> None:
         """
         Initialize ZIP file reader.
@@ -34,6 +51,7 @@ class ZipFile:
         """
         self.filename = filename
         self.file_list: List[Dict[str, Any]] = []
+        self._entries: Dict[str, Dict[str, Any]] | None = None  # filename -> entry, for O(1) lookup
         self.logger = logger("wicid.zipfile")
         self._find_central_directory()
 
@@ -95,6 +113,7 @@ class ZipFile:
                 # local_header_offset(4)
 
                 compression = struct.unpack("<H", cd_data[offset + 10 : offset + 12])[0]
+                crc = struct.unpack("<I", cd_data[offset + 16 : offset + 20])[0]
                 compressed_size = struct.unpack("<I", cd_data[offset + 20 : offset + 24])[0]
                 uncompressed_size = struct.unpack("<I", cd_data[offset + 24 : offset + 28])[0]
                 filename_len = struct.unpack("<H", cd_data[offset + 28 : offset + 30])[0]
@@ -109,6 +128,7 @@ class ZipFile:
                     {
                         "filename": filename,
                         "compression": compression,
+                        "crc32": crc,
                         "compressed_size": compressed_size,
                         "uncompressed_size": uncompressed_size,
                         "local_header_offset": local_header_offset,
@@ -118,29 +138,34 @@ class ZipFile:
                 # Move to next entry
                 offset += 46 + filename_len + extra_len + comment_len
 
+        self._entries = {entry["filename"]: entry for entry in self.file_list}
+
     def namelist(self) -> list[str]:
         """Return list of filenames in the ZIP."""
         return [f["filename"] for f in self.file_list]
 
+    def _get_entry(self, member: str) -> dict[str, Any]:
+        """Look up a member's central directory entry by name."""
+        if self._entries is None:
+            self._entries = {entry["filename"]: entry for entry in self.file_list}
+        file_info = self._entries.get(member)
+        if not file_info:
+            raise KeyError(f"File not found in ZIP: {member}")
+        return file_info
+
     def extract(self, member: str | dict[str, Any], path: str = "/") -> None:
         """
         Extract a member to the specified path.
 
+        Output is written incrementally, so neither the compressed nor the
+        uncompressed member is ever held in memory as a whole. A CRC-32
+        mismatch removes the partially written file and raises ValueError.
+
         Args:
             member: Filename or file info dict
             path: Destination directory (default: root)
         """
-        # Find file info
-        if isinstance(member, str):
-            file_info = None
-            for entry in self.file_list:
-                if entry["filename"] == member:
-                    file_info = entry
-                    break
-            if not file_info:
-                raise KeyError(f"File not found in ZIP: {member}")
-        else:
-            file_info = member
+        file_info = self._get_entry(member) if isinstance(member, str) else member
 
         filename = file_info["filename"]
 
@@ -148,38 +173,6 @@ class ZipFile:
         if filename.endswith("/"):
             return
 
-        # Read local file header and data
-        with open(self.filename, "rb") as f:
-            f.seek(file_info["local_header_offset"])
-
-            # Parse local file header
-            # signature(4) + version(2) + flags(2) + compression(2) +
-            # mod_time(2) + mod_date(2) + crc32(4) + compressed_size(4) +
-            # uncompressed_size(4) + filename_len(2) + extra_len(2)
-            header = f.read(30)
-
-            if header[:4] != self.LOCAL_FILE_HEADER_SIG:
-                raise ValueError("Invalid local file header")
-
-            filename_len = struct.unpack("<H", header[26:28])[0]
-            extra_len = struct.unpack("<H", header[28:30])[0]
-
-            # Skip filename and extra field
-            f.seek(filename_len + extra_len, 1)
-
-            # Read compressed data
-            compressed_data = f.read(file_info["compressed_size"])
-
-        # Decompress if needed
-        if file_info["compression"] == self.STORED:
-            data = compressed_data
-        elif file_info["compression"] == self.DEFLATED:
-            # Use raw DEFLATE decompression
-            data = zlib.decompress(compressed_data, -15)
-        else:
-            raise ValueError(f"Unsupported compression method: {file_info['compression']}")
-
-        # Write file
         dest_path = path.rstrip("/") + "/" + filename
 
         # Create parent directories if needed
@@ -190,10 +183,15 @@ class ZipFile:
             with suppress(OSError):
                 os.mkdir(dir_path)
 
-        with open(dest_path, "wb") as f:
-            f.write(data)
+        try:
+            with open(self.filename, "rb") as src, open(dest_path, "wb") as dest:
+                size = self._copy_member(src, file_info, dest)
+        except ValueError:
+            with suppress(OSError):
+                os.remove(dest_path)
+            raise
 
-        self.logger.debug(f"Extracted: {filename} ({len(data)} bytes)")
+        self.logger.debug("Extracted: %s (%d bytes)", filename, size)
 
     def read(self, member: str) -> bytes:
         """
@@ -205,33 +203,142 @@ class ZipFile:
         Returns:
             bytes: File contents
         """
-        # Find file info
-        file_info = None
-        for entry in self.file_list:
-            if entry["filename"] == member:
-                file_info = entry
-                break
+        file_info = self._get_entry(member)
 
-        if not file_info:
-            raise KeyError(f"File not found in ZIP: {member}")
-
-        # Read and decompress
+        out = io.BytesIO()
         with open(self.filename, "rb") as f:
-            f.seek(file_info["local_header_offset"])
-            header = f.read(30)
+            self._copy_member(f, file_info, out)
+        return out.getvalue()
+
+    def _seek_to_data(self, f: Any, file_info: dict[str, Any]) -> None:
+        """Position f at the start of a member's data, just past its local file header."""
+        f.seek(file_info["local_header_offset"])
+
+        # Parse local file header
+        # signature(4) + version(2) + flags(2) + compression(2) +
+        # mod_time(2) + mod_date(2) + crc32(4) + compressed_size(4) +
+        # uncompressed_size(4) + filename_len(2) + extra_len(2)
+        header = f.read(30)
+
+        if header[:4] != self.LOCAL_FILE_HEADER_SIG:
+            raise ValueError("Invalid local file header")
+
+        filename_len = struct.unpack("<H", header[26:28])[0]
+        extra_len = struct.unpack("<H", header[28:30])[0]
+
+        # Skip filename and extra field
+        f.seek(filename_len + extra_len, 1)
+
+    def _copy_member(self, f: Any, file_info: dict[str, Any], out: Any) -> int:
+        """
+        Stream a member's uncompressed bytes from f into out.
+
+        A running CRC-32 is computed over the output and checked against the
+        central directory value when the entry carries one.
 
-            if header[:4] != self.LOCAL_FILE_HEADER_SIG:
-                raise ValueError("Invalid local file header")
+        Args:
+            f: Open ZIP file (binary mode)
+            file_info: Central directory entry for the member
+            out: Writable binary stream receiving the uncompressed data
+
+        Returns:
+            int: Number of uncompressed bytes written
+        """
+        compression = file_info["compression"]
+        if compression not in (self.STORED, self.DEFLATED):
+            raise ValueError(f"Unsupported compression method: {compression}")
 
-            filename_len = struct.unpack("<H", header[26:28])[0]
-            extra_len = struct.unpack("<H", header[28:30])[0]
+        self._seek_to_data(f, file_info)
 
-            f.seek(filename_len + extra_len, 1)
-            compressed_data = f.read(file_info["compressed_size"])
+        buf = bytearray(self.CHUNK_SIZE)
+        view = memoryview(buf)
+        sink = _CrcWriter(out)
 
-        if file_info["compression"] == self.STORED:
-            return compressed_data
-        elif file_info["compression"] == self.DEFLATED:
-            return zlib.decompress(compressed_data, -15)
+        if compression == self.STORED:
+            size = self._copy_stored(f, file_info["compressed_size"], sink, view)
         else:
-            raise ValueError(f"Unsupported compression method: {file_info['compression']}")
+            size = self._copy_deflated(f, file_info["compressed_size"], sink, view)
+
+        expected_crc = file_info.get("crc32")
+        if expected_crc is not None and sink.crc != expected_crc:
+            raise ValueError(
+                f"CRC-32 mismatch for {file_info['filename']}: expected {expected_crc:08x}, got {sink.crc:08x}"
+            )
+        return size
+
+    def _copy_stored(self, f: Any, size: int, out: Any, view: memoryview) -> int:
+        """Copy an uncompressed member through the reusable buffer."""
+        remaining = size
+        while remaining > 0:
+            n = f.readinto(view[: min(remaining, len(view))])
+            if not n:
+                raise ValueError("Truncated ZIP member")
+            out.write(view[:n])
+            remaining -= n
+        return size
+
+    def _copy_deflated(self, f: Any, compressed_size: int, out: Any, view: memoryview) -> int:
+        """
+        Inflate a raw DEFLATE member in CHUNK_SIZE windows.
+
+        Uses deflate.DeflateIO (CircuitPython 9+) or zlib.DecompIO (older
+        CircuitPython/MicroPython) on device, and zlib.decompressobj on desktop.
+        Falls back to one-shot zlib.decompress only when no streaming API exists.
+        """
+        if hasattr(zlib, "decompressobj"):
+            return self._inflate_decompressobj(f, compressed_size, out)
+
+        if deflate is not None:
+            stream = deflate.DeflateIO(f, deflate.RAW)
+        elif hasattr(zlib, "DecompIO"):
+            stream = zlib.DecompIO(f, -15)
+        else:
+            data = zlib.decompress(f.read(compressed_size), -15)
+            out.write(data)
+            return len(data)
+
+        total = 0
+        while True:
+            n = stream.readinto(view)
+            if not n:
+                break
+            out.write(view[:n])
+            total += n
+        return total
+
+    def _inflate_decompressobj(self, f: Any, compressed_size: int, out: Any) -> int:
+        """Inflate with zlib.decompressobj, capping each output step at CHUNK_SIZE."""
+        decompressor = zlib.decompressobj(-15)
+        remaining = compressed_size
+        pending = b""
+        total = 0
+        while True:
+            if not pending:
+                if remaining <= 0:
+                    break
+                pending = f.read(min(remaining, self.CHUNK_SIZE))
+                if not pending:
+                    raise ValueError("Truncated ZIP member")
+                remaining -= len(pending)
+            data = decompressor.decompress(pending, self.CHUNK_SIZE)
+            pending = decompressor.unconsumed_tail
+            if data:
+                out.write(data)
+                total += len(data)
+        data = decompressor.flush()
+        if data:
+            out.write(data)
+            total += len(data)
+        return total
+
+
+class _CrcWriter:
+    """Write-through wrapper that keeps a running CRC-32 of everything written."""
+
+    def __init__(self, out: Any) -> None:
+        self.out = out
+        self.crc = 0
+
+    def write(self, data: Any) -> None:
+        self.out.write(data)
+        self.crc = crc32(data, self.crc) & 0xFFFFFFFF
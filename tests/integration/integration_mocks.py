@@ -556,6 +556,57 @@ class MockButtonController:
         self._pressed = False
 
 
+class MockKeypadEvent:
+    """Mock keypad.Event: a press or release of key 0 at a ticks_ms timestamp."""
+
+    def __init__(self, pressed: bool, timestamp: int) -> None:
+        self.key_number = 0
+        self.pressed = pressed
+        self.released = not pressed
+        self.timestamp = timestamp
+
+
+class MockEventQueue:
+    """Mock keypad.EventQueue backed by a list tests append MockKeypadEvent objects to."""
+
+    def __init__(self) -> None:
+        self.pending: list[MockKeypadEvent] = []
+        self.overflowed = False
+
+    def get(self) -> MockKeypadEvent | None:
+        """Pop the oldest event, or None if the queue is empty."""
+        return self.pending.pop(0) if self.pending else None
+
+    def clear(self) -> None:
+        """Drop all events and reset the overflow flag."""
+        self.pending.clear()
+        self.overflowed = False
+
+
+class MockKeys:
+    """
+    Mock keypad.Keys for testing the event-driven button backend.
+
+    Tests script the event queue directly via ``events.pending``.
+    """
+
+    def __init__(self, pins: tuple[Any, ...], value_when_pressed: bool, pull: bool = False) -> None:
+        self.pins = pins
+        self.value_when_pressed = value_when_pressed
+        self.pull = pull
+        self.events = MockEventQueue()
+        self.reset_count = 0
+        self.deinitialized = False
+
+    def reset(self) -> None:
+        """Record a scanner reset (real hardware re-reports held keys as presses)."""
+        self.reset_count += 1
+
+    def deinit(self) -> None:
+        """Release the (mock) pins."""
+        self.deinitialized = True
+
+
 class MockRadio:
     """
     Mock for circuitpython wifi.radio object.
@@ -138,6 +138,14 @@ class TestRecoveryBackup(TestCase):
         valid, message = _validate_backup_integrity()
         self.assertTrue(valid, f"Integrity check failed: {message}")
 
+    def test_refresh_without_changes_copies_nothing(self) -> None:
+        """Refreshing an up-to-date backup verifies hashes and rewrites no files."""
+        from utils.recovery import create_recovery_backup
+
+        success, message = create_recovery_backup()
+        self.assertTrue(success, f"Backup refresh failed: {message}")
+        self.assertIn("(0 updated)", message)
+
 
 class TestRecoveryValidation(TestCase):
     """Test critical file validation."""
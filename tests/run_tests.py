@@ -83,6 +83,7 @@ def mock_circuitpython_modules() -> None:
         "adafruit_requests",
         "board",
         "digitalio",
+        "keypad",
         "microcontroller",
         "neopixel",
         "rtc",
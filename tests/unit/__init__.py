@@ -53,6 +53,7 @@ def _mock_circuitpython_modules() -> None:
         "adafruit_requests",
         "board",
         "digitalio",
+        "keypad",
         "microcontroller",
         "neopixel",
         "rtc",
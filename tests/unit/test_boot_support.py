@@ -101,11 +101,12 @@ class TestBootLogging(TestCase):
 
         try:
             with patch("core.boot_support.BOOT_LOG_FILE", log_path):
-                from core.logging_helper import logger
+                from core.logging_helper import flush_logs, logger
 
                 log = logger("wicid.boot", log_file=log_path)
                 with patch("builtins.print"):
                     log.info("Test message")
+                flush_logs()
 
                 # Verify message was written
                 with open(log_path) as f:
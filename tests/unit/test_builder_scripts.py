@@ -5,23 +5,34 @@ Tests the discover_install_scripts function and manifest creation
 with script flags, including script-only releases.
 """
 
+import hashlib
+import io
+import json
 import os
+import random
 import shutil
 import sys
 import tempfile
+import zipfile
+from pathlib import Path
 from unittest.mock import patch
 
 sys.path.insert(0, ".")
 
 # Import the functions we're testing
 from builder import (
+    _create_zip_package,
+    build_delta_package,
     create_manifest,
     discover_install_scripts,
     is_script_only_release,
+    make_delta_patch,
     parse_version,
     update_releases_json,
 )
 
+import utils.recovery as recovery
+import utils.update_install as update_install
 from core.app_typing import Any, cast
 from tests.unit import TestCase
 
@@ -818,3 +829,210 @@ class TestUpdateReleasesJson(TestCase):
             "archive",
         ]
         self.assertEqual(keys[: len(expected_prefix)], expected_prefix)
+
+    def _update_with_delta(self) -> dict[str, Any]:
+        releases_data = {"schema_version": "1.0.0", "last_updated": "", "releases": []}
+        manifest = {"version": "1.1.0", "release_notes": "Patch", "release_date": "2025-01-02T00:00:00Z"}
+
+        update_releases_json(
+            releases_data,
+            manifest,
+            target_machines=["Test Machine"],
+            target_oses=["circuitpython_10_0"],
+            release_type="production",
+            version="1.1.0",
+            sha256_checksum="full",
+            delta={"delta_from": "1.0.0", "sha256": "delta"},
+        )
+        return cast(dict[str, Any], releases_data["releases"][0])["production"]
+
+    def test_delta_fields_added_to_release(self) -> None:
+        """A published delta package adds delta_from, delta_url and delta_sha256 to the release."""
+        assets_url = "https://github.com/wicid-ai/wicid_firmware/releases/download/v1.1.0"
+        with patch.dict(os.environ, {"WICID_RELEASE_ASSETS_URL": assets_url}):
+            release = self._update_with_delta()
+
+        self.assertEqual(release["delta_from"], "1.0.0")
+        self.assertEqual(release["delta_url"], f"{assets_url}/wicid_delta.zip")
+        self.assertEqual(release["delta_sha256"], "delta")
+
+    def test_delta_not_published_without_asset_url(self) -> None:
+        """Without an upload location, the release carries no delta fields."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("WICID_RELEASE_ASSETS_URL", None)
+            with patch("builtins.print"):
+                release = self._update_with_delta()
+
+        self.assertNotIn("delta_from", release)
+        self.assertNotIn("delta_url", release)
+        self.assertNotIn("delta_sha256", release)
+
+
+class TestPackageFileHashes(TestCase):
+    """Test the per-file hash table written into the packaged manifest.json."""
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.build_dir = self.test_dir / "build"
+        (self.build_dir / "core").mkdir(parents=True)
+        (self.build_dir / "boot.py").write_bytes(b"import core.boot_support\n")
+        (self.build_dir / "core" / "scheduler.mpy").write_bytes(b"M\x06scheduler")
+        (self.build_dir / ".DS_Store").write_bytes(b"hidden")
+        (self.build_dir / "manifest.json").write_text(json.dumps({"version": "1.2.0"}))
+        self.package_path = self.test_dir / "wicid_install.zip"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _packaged_manifest(self, record_file_hashes: bool) -> dict[str, Any]:
+        with patch("sys.stdout", io.StringIO()):
+            _create_zip_package(
+                self.build_dir, self.package_path, self.package_path.name, record_file_hashes=record_file_hashes
+            )
+        with zipfile.ZipFile(self.package_path) as zf:
+            return json.loads(zf.read("manifest.json"))
+
+    def test_manifest_lists_hash_of_every_other_packaged_file(self) -> None:
+        """Every packaged file except manifest.json itself is listed with its SHA-256."""
+        manifest = self._packaged_manifest(record_file_hashes=True)
+
+        self.assertEqual(manifest["version"], "1.2.0")
+        self.assertEqual(
+            manifest["files"],
+            {
+                "/boot.py": hashlib.sha256(b"import core.boot_support\n").hexdigest(),
+                "/core/scheduler.mpy": hashlib.sha256(b"M\x06scheduler").hexdigest(),
+            },
+        )
+
+    def test_manifest_unchanged_without_file_hashes(self) -> None:
+        """Script-only and other packages keep their manifest as-is."""
+        self.assertEqual(self._packaged_manifest(record_file_hashes=False), {"version": "1.2.0"})
+
+
+class TestDeltaPackages(TestCase):
+    """Host-side tests for delta packages built by builder.py and applied by update_install."""
+
+    MODULE_COUNT = 60
+
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+        self._hashlib_patch = patch.object(recovery, "hashlib", hashlib)
+        self._hashlib_patch.start()
+
+        rng = random.Random(22)
+        self.base_tree: dict[str, bytes] = {
+            "boot.py": b"import core.boot_support\n",
+            "code.py": b"import core.code_support\n",
+        }
+        for i in range(self.MODULE_COUNT):
+            self.base_tree[f"modules/module_{i:02d}.mpy"] = rng.randbytes(rng.randrange(1024, 6144))
+
+        # Typical one-module change: a few edited bytes plus a small insertion
+        self.new_tree = dict(self.base_tree)
+        module = bytearray(self.base_tree["modules/module_07.mpy"])
+        module[100:140] = rng.randbytes(40)
+        module[len(module) // 2 : len(module) // 2] = rng.randbytes(24)
+        self.new_tree["modules/module_07.mpy"] = bytes(module)
+
+        self.base_package = self._package("base", self.base_tree, "1.0.0")
+        self.new_package = self._package("new", self.new_tree, "1.1.0")
+        self.delta_package = self.test_dir / "wicid_delta.zip"
+
+    def tearDown(self) -> None:
+        self._hashlib_patch.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _package(self, name: str, tree: dict[str, bytes], version: str) -> Path:
+        build_dir = self.test_dir / f"build_{name}"
+        for path, data in {**tree, "manifest.json": json.dumps({"version": version}).encode()}.items():
+            (build_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (build_dir / path).write_bytes(data)
+        package_path = self.test_dir / f"{name}.zip"
+        with patch("sys.stdout", io.StringIO()):
+            _create_zip_package(build_dir, package_path, package_path.name)
+        return package_path
+
+    def _extract(self, package_path: Path, name: str) -> Path:
+        target = self.test_dir / name
+        with zipfile.ZipFile(package_path) as zf:
+            zf.extractall(target)
+        return target
+
+    def _build_delta(self) -> dict[str, Any]:
+        with patch("sys.stdout", io.StringIO()):
+            delta = build_delta_package(self.base_package, self.new_package, self.delta_package)
+        assert delta is not None
+        return delta
+
+    @staticmethod
+    def _tree(root: Path) -> dict[str, bytes]:
+        return {str(p.relative_to(root)): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+    def _install_delta(self, root: Path, staging: Path, delta_index: dict[str, Any]) -> int:
+        """Overlay staged files onto root like the boot-time delta install; return bytes written."""
+        bytes_written = 0
+        for path in delta_index["removed"]:
+            (root / path.lstrip("/")).unlink()
+        for staged in staging.rglob("*"):
+            if staged.is_file() and staged.name != update_install.DELTA_INDEX_FILE:
+                dest = root / staged.relative_to(staging)
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                bytes_written += dest.write_bytes(staged.read_bytes())
+        return bytes_written
+
+    def test_patch_round_trips_through_device_applier(self) -> None:
+        """Patches from make_delta_patch rebuild the new file with update_install's applier."""
+        rng = random.Random(7)
+        old = rng.randbytes(5000)
+        new = old[:1200] + rng.randbytes(50) + old[1300:4000] + old[:500] + old[4100:]
+        patch_bytes = make_delta_patch(old, new)
+        self.assertLess(len(patch_bytes), 200)
+
+        paths = {name: str(self.test_dir / name) for name in ("old", "patch", "out")}
+        Path(paths["old"]).write_bytes(old)
+        Path(paths["patch"]).write_bytes(patch_bytes)
+        update_install._apply_patch(paths["old"], paths["patch"], paths["out"], bytearray(256))
+        self.assertEqual(Path(paths["out"]).read_bytes(), new)
+
+    def test_one_module_change_reduces_package_size_and_install_writes(self) -> None:
+        """A one-module delta is a small fraction of the full package and of the bytes installed."""
+        delta = self._build_delta()
+        self.assertEqual(delta["delta_from"], "1.0.0")
+
+        root = self._extract(self.base_package, "device_root")
+        staging = self._extract(self.delta_package, "staging")
+        delta_index = update_install.load_delta_index(str(staging))
+        assert delta_index is not None
+        self.assertEqual(list(delta_index["patched"]), ["/modules/module_07.mpy"])
+        self.assertEqual(json.loads((staging / "manifest.json").read_text())["delta_from"], "1.0.0")
+
+        success, message = update_install.apply_delta(str(staging), delta_index, root_dir=str(root))
+        self.assertTrue(success, message)
+        delta_bytes = self._install_delta(root, staging, delta_index)
+
+        full_tree = self._tree(self._extract(self.new_package, "full"))
+        installed_tree = self._tree(root)
+        # Only the manifest differs from a full install (it records delta_from)
+        self.assertEqual(json.loads(installed_tree.pop("manifest.json"))["version"], "1.1.0")
+        self.assertEqual(installed_tree, {k: v for k, v in full_tree.items() if k != "manifest.json"})
+
+        full_package_size = self.new_package.stat().st_size
+        self.assertLess(self.delta_package.stat().st_size, full_package_size // 10)
+        # A full install rewrites every file of the release
+        self.assertLess(delta_bytes, sum(len(data) for data in full_tree.values()) // 10)
+
+    def test_base_mismatch_fails_before_patching(self) -> None:
+        """A locally modified base file fails the delta so the device can fall back to the full package."""
+        self._build_delta()
+        root = self._extract(self.base_package, "device_root")
+        (root / "modules/module_03.mpy").write_bytes(b"modified")
+        staging = self._extract(self.delta_package, "staging")
+        delta_index = update_install.load_delta_index(str(staging))
+        assert delta_index is not None
+
+        success, message = update_install.apply_delta(str(staging), delta_index, root_dir=str(root))
+
+        self.assertFalse(success)
+        self.assertIn("/modules/module_03.mpy", message)
+        self.assertTrue((staging / "modules/module_07.mpy.wdelta").exists())
@@ -8,9 +8,11 @@ See tests.unit for instructions on running tests.
 """
 
 # Import from unit package - path setup happens automatically
-from controllers.button_controller import ButtonController
+from unittest.mock import patch
+
+from controllers.button_controller import ButtonController, KeysButtonController, create_button_controller
 from core.logging_helper import logger
-from tests.integration.integration_mocks import MockDigitalInOut
+from tests.integration.integration_mocks import MockDigitalInOut, MockKeypadEvent, MockKeys
 from tests.test_helpers import create_mock_button_pin
 from tests.unit import TestCase
 
@@ -95,3 +97,68 @@ class TestButtonControllerBasic(TestCase):
         self.assertFalse(controller.is_pressed(), "Controller reports released state")
 
         controller.deinit()
+
+
+class TestKeysButtonController(TestCase):
+    """KeysButtonController event backend tests using a scripted keypad queue."""
+
+    def setUp(self) -> None:
+        self.logger = logger("test.button_controller")
+        self.mock_pin = create_mock_button_pin(pin_number=43)
+        self.ticks = [10_000]
+        self.controller = KeysButtonController(
+            self.logger, button_pin=self.mock_pin, keys_factory=MockKeys, ticks_ms=lambda: self.ticks[0]
+        )
+        self.keys = self.controller._keys
+
+    def test_configures_active_low_key_with_pull(self) -> None:
+        self.assertEqual(self.keys.pins, (self.mock_pin,))
+        self.assertFalse(self.keys.value_when_pressed)
+        self.assertTrue(self.keys.pull)
+        self.assertTrue(KeysButtonController.EVENT_DRIVEN)
+        self.assertFalse(ButtonController.EVENT_DRIVEN)
+
+    def test_read_event_converts_timestamps(self) -> None:
+        """Event times are the monotonic time the edge happened, not when it was read."""
+        self.keys.events.pending = [MockKeypadEvent(True, 9_700), MockKeypadEvent(False, 9_880)]
+
+        self.assertEqual(self.controller.read_event(now=50.0), (True, 49.7))
+        self.assertTrue(self.controller.is_pressed())
+        pressed, at = self.controller.read_event(now=50.0)  # type: ignore[misc]
+        self.assertFalse(pressed)
+        self.assertAlmostEqual(at, 49.88)
+        self.assertIsNone(self.controller.read_event(now=50.0))
+
+    def test_read_event_handles_tick_wraparound(self) -> None:
+        self.ticks[0] = 50  # Clock wrapped past 2**29 ms after the event
+        self.keys.events.pending = [MockKeypadEvent(True, (1 << 29) - 150)]
+
+        self.assertEqual(self.controller.read_event(now=20.0), (True, 19.8))
+
+    def test_overflow_resynchronizes(self) -> None:
+        """A lost-event overflow releases a believed-held button and rescans."""
+        self.keys.events.pending = [MockKeypadEvent(True, 10_000)]
+        self.controller.read_event(now=1.0)
+        self.keys.events.pending = [MockKeypadEvent(False, 10_000)] * 3
+        self.keys.events.overflowed = True
+
+        self.assertEqual(self.controller.read_event(now=2.0), (False, 2.0))
+        self.assertEqual(self.keys.reset_count, 1)
+        self.assertEqual(self.keys.events.pending, [])
+        self.assertIsNone(self.controller.read_event(now=2.0))
+
+    def test_deinit_releases_keys(self) -> None:
+        self.controller.deinit()
+        self.controller.deinit()  # Safe to call twice
+
+        self.assertTrue(self.keys.deinitialized)
+
+    def test_factory_falls_back_to_polling(self) -> None:
+        with (
+            patch("controllers.button_controller.keypad", None),
+            patch("controllers.button_controller.digitalio.DigitalInOut", side_effect=MockDigitalInOut),
+        ):
+            controller = create_button_controller(self.logger, self.mock_pin)
+
+        self.assertIsInstance(controller, ButtonController)
+        controller.deinit()
@@ -619,6 +619,20 @@ class TestSaveCredentials(TestCase):
         self.assertTrue(success)
         self.assertIsNone(error)
 
+    def test_save_credentials_invalidates_geocode_for_new_zip(self) -> None:
+        """save_credentials should drop the persisted geocode unless it matches the saved ZIP."""
+        m = mock_open()
+        with (
+            patch("builtins.open", m),
+            patch("json.dump"),
+            patch("os.sync"),
+            patch("managers.configuration_manager.WeatherService") as mock_weather_service,
+        ):
+            success, _ = self.config_mgr.save_credentials("ssid", "password123", "99999")
+
+        self.assertTrue(success)
+        mock_weather_service.invalidate_location_cache.assert_called_once_with("99999")
+
 
 class TestProgressHelpers(TestCase):
     """Test progress normalization and delta logic."""
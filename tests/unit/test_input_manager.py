@@ -14,9 +14,11 @@ See tests.unit for instructions on running tests.
 """
 
 # Import from unit package - path setup happens automatically
+from controllers.button_controller import KeysButtonController
 from core.app_typing import Any
+from core.scheduler import Scheduler
 from managers.input_manager import ButtonEvent, InputManager
-from tests.integration.integration_mocks import MockButtonController
+from tests.integration.integration_mocks import MockButtonController, MockKeypadEvent, MockKeys
 from tests.test_helpers import create_mock_button_pin
 from tests.unit import TestCase
 from utils.utils import suppress
@@ -166,6 +168,20 @@ class TestInputManagerCallbacks(TestCase):
         # Should have one more callback
         self.assertEqual(len(self.mgr._callbacks[ButtonEvent.PRESS]), initial_count + 1, "Callback added to registry")
 
+    def test_unregister_callback(self) -> None:
+        """Verify a registered callback can be removed, and unknown ones are ignored."""
+
+        def my_callback(event: Any) -> None:
+            pass
+
+        initial_count = len(self.mgr._callbacks[ButtonEvent.PRESS])
+        self.mgr.register_callback(ButtonEvent.PRESS, my_callback)
+
+        self.mgr.unregister_callback(ButtonEvent.PRESS, my_callback)
+        self.mgr.unregister_callback(ButtonEvent.PRESS, my_callback)  # Already removed
+
+        self.assertEqual(len(self.mgr._callbacks[ButtonEvent.PRESS]), initial_count)
+
     def test_register_unknown_event_type(self) -> None:
         """Verify registering unknown event type fails gracefully."""
 
@@ -423,6 +439,111 @@ class TestInputManagerHoldDetection(TestCase):
         self.assertEqual(len(events), 2, "Release should not emit additional hold events")
 
 
+# Press/release times (ms) covering every classification, with >0.5s between groups
+_SCRIPT = [
+    (1000, 1100),  # single
+    (3000, 3100),  # double
+    (3300, 3400),
+    (5000, 5080),  # triple
+    (5250, 5330),
+    (5500, 5580),
+    (7000, 9000),  # long press
+    (11000, 15000),  # setup hold
+    (17000, 28500),  # safe hold
+]
+_SCRIPT_END_MS = 30000
+_CLASSIFICATIONS = [
+    ButtonEvent.SINGLE_CLICK,
+    ButtonEvent.DOUBLE_CLICK,
+    ButtonEvent.TRIPLE_CLICK,
+    ButtonEvent.LONG_PRESS,
+    ButtonEvent.SETUP_MODE,
+    ButtonEvent.SAFE_MODE,
+]
+
+
+class TestInputManagerKeypadBackend(TestCase):
+    """The keypad event backend classifies presses exactly like 100Hz polling."""
+
+    def setUp(self) -> None:
+        if InputManager._instance is not None and getattr(InputManager._instance, "_initialized", False):
+            with suppress(Exception):
+                InputManager._instance.shutdown()
+        InputManager._instance = None
+        self.pin = create_mock_button_pin(pin_number=102)
+        self.ticks = [0]
+
+    def tearDown(self) -> None:
+        with suppress(Exception):
+            InputManager._instance.shutdown()  # type: ignore[union-attr]
+        InputManager._instance = None
+
+    def _keys_factory(self, logger: Any, button_pin: Any = None) -> KeysButtonController:
+        return KeysButtonController(logger, button_pin, keys_factory=MockKeys, ticks_ms=lambda: self.ticks[0])
+
+    def _record(self, mgr: InputManager) -> list[Any]:
+        fired: list[Any] = []
+        for event_type in _CLASSIFICATIONS + [ButtonEvent.PRESS, ButtonEvent.RELEASE]:
+            mgr.register_callback(event_type, fired.append)
+        return fired
+
+    def _run_polling(self) -> list[Any]:
+        mgr = InputManager.instance(button_pin=self.pin, controller_factory=MockButtonController)
+        fired = self._record(mgr)
+        controller: Any = mgr._controller
+        for t in range(0, _SCRIPT_END_MS, 10):
+            controller._pressed = any(down <= t < up for down, up in _SCRIPT)
+            mgr._monitor_button_tick(now=t / 1000)
+        mgr.shutdown()
+        InputManager._instance = None
+        return fired
+
+    def _run_keypad(self, drain_ms: int) -> list[Any]:
+        mgr = InputManager.instance(button_pin=self.pin, controller_factory=self._keys_factory)
+        self.assertTrue(mgr._event_driven)
+        fired = self._record(mgr)
+        queue = mgr._controller._keys.events  # type: ignore[union-attr]
+        edges = sorted([(down, True) for down, _ in _SCRIPT] + [(up, False) for _, up in _SCRIPT])
+        for t in range(0, _SCRIPT_END_MS, drain_ms):
+            while edges and edges[0][0] <= t:
+                at, pressed = edges.pop(0)
+                queue.pending.append(MockKeypadEvent(pressed, at))
+            self.ticks[0] = t
+            mgr._drain_button_events_tick(now=t / 1000)
+        return fired
+
+    def test_scripted_queue_matches_polling_classification(self) -> None:
+        polled = self._run_polling()
+        drained = self._run_keypad(drain_ms=int(InputManager.BUTTON_EVENT_PERIOD * 1000))
+
+        self.assertEqual(drained, polled)
+        self.assertEqual(
+            [event for event in drained if event in _CLASSIFICATIONS],
+            [
+                ButtonEvent.SINGLE_CLICK,
+                ButtonEvent.SINGLE_CLICK,
+                ButtonEvent.DOUBLE_CLICK,
+                ButtonEvent.SINGLE_CLICK,
+                ButtonEvent.DOUBLE_CLICK,
+                ButtonEvent.TRIPLE_CLICK,
+                ButtonEvent.LONG_PRESS,
+                ButtonEvent.SETUP_MODE,
+                ButtonEvent.SETUP_MODE,  # The safe hold passes the setup threshold first
+                ButtonEvent.SAFE_MODE,
+            ],
+        )
+
+    def test_classification_uses_event_timestamps_not_drain_time(self) -> None:
+        """Even a very late drain groups clicks by when they happened."""
+        self.assertEqual(self._run_keypad(drain_ms=250), self._run_polling())
+
+    def test_event_backend_schedules_low_rate_monitor(self) -> None:
+        mgr = InputManager.instance(button_pin=self.pin, controller_factory=self._keys_factory)
+
+        task = Scheduler.instance().task_registry[mgr._task_handle.task_id]
+        self.assertEqual(task.timing_param, InputManager.BUTTON_EVENT_PERIOD)
+
+
 # Entry point for running tests
 if __name__ == "__main__":
     import unittest
@@ -8,12 +8,16 @@ Tests verify:
 - File logging functionality
 """
 
+import contextlib
 import os
 import tempfile
+import time
+import tracemalloc
 from unittest.mock import patch
 
 # Store original log level to restore after tests
 import core.logging_helper as logging_module
+from core.app_typing import Callable
 from core.logging_helper import (
     CRITICAL,
     DEBUG,
@@ -23,6 +27,7 @@ from core.logging_helper import (
     WARNING,
     WicidLogger,
     configure_logging,
+    flush_logs,
     logger,
 )
 from tests.unit import TestCase
@@ -186,6 +191,7 @@ class TestFileLogging(TestCase):
 
             with patch("builtins.print"):
                 log.info("Test message")
+            flush_logs()
 
             # Verify message was written to file
             with open(log_path) as f:
@@ -207,6 +213,7 @@ class TestFileLogging(TestCase):
 
             # Verify it printed to stdout
             mock_print.assert_called_once()
+            flush_logs()
             # Verify it also wrote to file
             with open(log_path) as f:
                 content = f.read()
@@ -225,6 +232,7 @@ class TestFileLogging(TestCase):
 
             with patch("builtins.print"):
                 log.info("New message")
+            flush_logs()
 
             # Verify file contains both old and new content
             with open(log_path) as f:
@@ -268,3 +276,239 @@ class TestFileLogging(TestCase):
             self.assertEqual(log._log_file, log_path)
         finally:
             os.unlink(log_path)
+
+
+class TestBufferedFileSink(TestCase):
+    """Test batched writes, flush triggers and rotation of the file sink."""
+
+    def setUp(self) -> None:
+        self._original_level = logging_module._log_level
+        logging_module._log_level = INFO
+        self._tmpdir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self._tmpdir, "boot_log.txt")
+        self._print_patch = patch("builtins.print")
+        self._print_patch.start()
+
+    def tearDown(self) -> None:
+        self._print_patch.stop()
+        logging_module._log_level = self._original_level
+        logging_module._file_sinks.clear()
+        for name in os.listdir(self._tmpdir):
+            os.unlink(os.path.join(self._tmpdir, name))
+        os.rmdir(self._tmpdir)
+
+    def _read(self, path: str) -> str:
+        try:
+            with open(path) as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def test_info_lines_are_batched(self) -> None:
+        """INFO lines stay buffered until LOG_FLUSH_LINES are pending."""
+        log = logger("wicid.test", log_file=self.log_path)
+        with patch("os.sync") as mock_sync:
+            for i in range(logging_module.LOG_FLUSH_LINES - 1):
+                log.info(f"line {i}")
+            self.assertEqual(self._read(self.log_path), "")
+            mock_sync.assert_not_called()
+
+            log.info("last line")
+
+        self.assertEqual(mock_sync.call_count, 1)
+        self.assertEqual(self._read(self.log_path).count("\n"), logging_module.LOG_FLUSH_LINES)
+
+    def test_error_flushes_immediately(self) -> None:
+        """ERROR writes pending lines and itself right away."""
+        log = logger("wicid.test", log_file=self.log_path)
+        with patch("os.sync"):
+            log.info("context")
+            log.error("boom")
+
+        content = self._read(self.log_path)
+        self.assertIn("[INFO: Test] context", content)
+        self.assertIn("[ERROR: Test] boom", content)
+
+    def test_interval_flushes_on_next_write(self) -> None:
+        """A write after LOG_FLUSH_INTERVAL seconds flushes the buffer."""
+        log = logger("wicid.test", log_file=self.log_path)
+        now = [1000.0]
+        with patch.object(logging_module.time, "monotonic", side_effect=lambda: now[0]), patch("os.sync"):
+            log.info("first")
+            self.assertEqual(self._read(self.log_path), "")
+            now[0] += logging_module.LOG_FLUSH_INTERVAL
+            log.info("second")
+
+        self.assertIn("second", self._read(self.log_path))
+
+    def test_interval_is_not_a_timer(self) -> None:
+        """Without another write, only flush_logs() gets the buffered tail onto flash."""
+        log = logger("wicid.test", log_file=self.log_path)
+        now = [1000.0]
+        with patch.object(logging_module.time, "monotonic", side_effect=lambda: now[0]), patch("os.sync") as mock_sync:
+            log.info("last words")
+            now[0] += logging_module.LOG_FLUSH_INTERVAL * 10
+            self.assertEqual(self._read(self.log_path), "")
+
+            flush_logs()
+
+        self.assertEqual(mock_sync.call_count, 1)
+        self.assertIn("last words", self._read(self.log_path))
+
+    def test_loggers_share_one_sink_per_file(self) -> None:
+        """Different loggers writing to the same file are flushed together, in order."""
+        first = logger("wicid.boot_support", log_file=self.log_path)
+        second = logger("wicid.recovery", log_file=self.log_path)
+        with patch("os.sync"):
+            first.info("one")
+            second.info("two")
+            flush_logs()
+
+        content = self._read(self.log_path)
+        self.assertLess(content.index("one"), content.index("two"))
+
+    def test_rotates_at_size_cap(self) -> None:
+        """The file is moved to <file>.1 when a flush would exceed LOG_MAX_BYTES."""
+        log = logger("wicid.test", log_file=self.log_path)
+        with patch.object(logging_module, "LOG_MAX_BYTES", 200), patch("os.sync"):
+            for i in range(8):
+                log.error(f"message number {i:02d} padded to a fixed width")
+
+        backup = self._read(self.log_path + ".1")
+        current = self._read(self.log_path)
+        self.assertIn("message number", backup)
+        self.assertLessEqual(len(current), 200)
+        self.assertIn("message number 07", current)
+
+    def test_failed_flush_keeps_lines_and_is_bounded(self) -> None:
+        """Lines survive a failed flush, but at most LOG_BUFFER_LINES are kept."""
+        sink = logging_module._get_file_sink(self.log_path)
+        with patch("builtins.open", side_effect=OSError("read-only")):
+            for i in range(logging_module.LOG_BUFFER_LINES + 10):
+                with contextlib.suppress(OSError):
+                    sink.write(f"line {i}", INFO)
+            flush_logs()  # Must not raise
+
+        self.assertEqual(len(sink._pending), logging_module.LOG_BUFFER_LINES)
+        self.assertEqual(sink._pending[-1], f"line {logging_module.LOG_BUFFER_LINES + 9}")
+
+        with patch("os.sync"):
+            flush_logs()
+        self.assertIn("line 10\n", self._read(self.log_path))
+
+    def test_benchmark_1000_info_lines(self) -> None:
+        """Buffered sink issues far fewer syncs and runs faster than per-line writes."""
+        lines = [f"[INFO: Bench] message {i}" for i in range(1000)]
+        legacy_path = os.path.join(self._tmpdir, "legacy_log.txt")
+
+        with patch("os.sync") as legacy_sync:
+            start = time.perf_counter()
+            for line in lines:
+                # Previous sink: open, append and sync for every line
+                with open(legacy_path, "a") as f:
+                    f.write(line + "\n")
+                os.sync()
+            legacy_time = time.perf_counter() - start
+
+        log = logger("wicid.bench", log_file=self.log_path)
+        with patch("os.sync") as buffered_sync:
+            start = time.perf_counter()
+            for i in range(1000):
+                log.info(f"message {i}")
+            flush_logs()
+            buffered_time = time.perf_counter() - start
+
+        self.assertEqual(self._read(self.log_path).count("\n"), 1000)
+        self.assertEqual(legacy_sync.call_count, 1000)
+        self.assertLessEqual(buffered_sync.call_count, 1000 // logging_module.LOG_FLUSH_LINES + 1)
+        self.assertLess(buffered_time, legacy_time)
+
+
+class _FormatCounter:
+    """Value that records how often it is converted to text."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __str__(self) -> str:
+        self.count += 1
+        return "x" * 512
+
+    def __format__(self, spec: str) -> str:
+        return str(self)
+
+
+class TestDeferredFormatting(TestCase):
+    """Test level guards, %-style arguments and cached logger instances."""
+
+    def setUp(self) -> None:
+        self._original_level = logging_module._log_level
+        logging_module._log_level = INFO
+
+    def tearDown(self) -> None:
+        logging_module._log_level = self._original_level
+
+    def test_args_are_formatted_when_enabled(self) -> None:
+        """%-style args are applied to enabled messages."""
+        log = logger("wicid.test")
+        with patch("builtins.print") as mock_print:
+            log.info("Extracted %s (%d bytes)", "code.py", 1234)
+        mock_print.assert_called_once_with("[INFO: Test] Extracted code.py (1234 bytes)")
+
+    def test_suppressed_call_does_not_format_args(self) -> None:
+        """Args of a suppressed call are never converted to text."""
+        log = logger("wicid.test")
+        value = _FormatCounter()
+        with patch("builtins.print") as mock_print:
+            log.debug("value=%s", value)
+        mock_print.assert_not_called()
+        self.assertEqual(value.count, 0)
+
+    def test_message_without_args_is_not_formatted(self) -> None:
+        """A literal '%' in a message without args is left alone."""
+        log = logger("wicid.test")
+        with patch("builtins.print") as mock_print:
+            log.info("Starting demo (30% precip)")
+        mock_print.assert_called_once_with("[INFO: Test] Starting demo (30% precip)")
+
+    def test_mismatched_args_still_log(self) -> None:
+        """A bad format string does not raise or drop the message."""
+        log = logger("wicid.test")
+        with patch("builtins.print") as mock_print:
+            log.warning("count=%d", "not a number")
+        self.assertIn("count=%d", mock_print.call_args[0][0])
+        self.assertIn("not a number", mock_print.call_args[0][0])
+
+    def test_logger_instances_are_cached(self) -> None:
+        """logger() returns the same instance for the same name and log_file."""
+        self.assertIs(logger("wicid.cached"), logger("wicid.cached"))
+        self.assertIsNot(logger("wicid.cached"), logger("wicid.cached", log_file="/tmp/other.txt"))
+        self.assertIsNot(logger("wicid.cached"), logger("wicid.other"))
+
+    def test_benchmark_suppressed_call_allocations(self) -> None:
+        """Deferred args avoid the per-call string an eager f-string builds."""
+        log = logger("wicid.bench")
+        value = _FormatCounter()
+        calls = 1000
+
+        def peak_bytes(fn: Callable[[], None]) -> int:
+            tracemalloc.start()
+            try:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                for _ in range(calls):
+                    fn()
+                return tracemalloc.get_traced_memory()[1] - base
+            finally:
+                tracemalloc.stop()
+
+        eager_peak = peak_bytes(lambda: log.debug(f"value={value}"))
+        eager_formats = value.count
+        value.count = 0
+        lazy_peak = peak_bytes(lambda: log.debug("value=%s", value))
+
+        self.assertEqual(eager_formats, calls)
+        self.assertEqual(value.count, 0)
+        # Eager builds a >512 byte string per call; deferred only packs the args tuple
+        self.assertGreater(eager_peak, 512)
+        self.assertLess(lazy_peak, eager_peak // 4)
@@ -346,6 +346,36 @@ class TestRunLoop(unittest.TestCase):
 
         self.assertIn("No modes registered", str(ctx.exception))
 
+    def test_button_press_stops_led_playback_only_while_mode_runs(self) -> None:
+        """A press during mode.run() stops the pixel's keyframe sequence; the callback is removed afterwards."""
+        import asyncio
+
+        from managers.input_manager import ButtonEvent
+
+        async def run_mode() -> None:
+            event, callback = self.mock_input.register_callback.call_args.args
+            self.assertIs(event, ButtonEvent.PRESS)
+            self.mock_input.unregister_callback.assert_not_called()
+            callback(event)
+
+        mode = MagicMock()
+        mode.initialize.return_value = True
+        mode.run = AsyncMock(side_effect=run_mode)
+        mode_class = MagicMock(return_value=mode, order=0)
+        mode_class.name = "Primary"
+        self.mgr.modes = [mode_class]
+        self.mock_input.is_pressed.return_value = False
+        self.mgr._process_pending_actions = AsyncMock(side_effect=[None, RuntimeError("stop")])  # type: ignore[method-assign]
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.mgr.run())
+
+        self.mock_pixel.stop.assert_called_once()
+        self.mock_input.unregister_callback.assert_called_once_with(
+            ButtonEvent.PRESS, self.mock_input.register_callback.call_args.args[1]
+        )
+        mode.cleanup.assert_called_once()
+
     def test_shutdown_is_noop(self) -> None:
         """Verify shutdown() does nothing (ButtonActionRouter owns callbacks)."""
         # Should not raise
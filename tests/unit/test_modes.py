@@ -8,9 +8,11 @@ Tests cover:
 """
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from modes.modes import temperature_color
+from controllers.pixel_controller import Easing
+from modes.modes import _interpolate_temperature_color, temperature_color
 from tests.unit import TestCase
 from tests.unit.unit_mocks import MockConnectionManager, MockScheduler, reset_all_mocks
 
@@ -69,6 +71,45 @@ class TestTemperatureColor(TestCase):
         color = temperature_color(72)
         self.assertGreater(color[1], 100)
 
+    def test_table_matches_interpolation_within_one(self) -> None:
+        """Table lookup stays within ±1 per channel of float interpolation, exact on whole degrees."""
+        for tenth in range(-50, 1051):
+            temp = tenth / 10
+            expected = _interpolate_temperature_color(temp)
+            color = temperature_color(temp)
+            for channel, want in zip(color, expected, strict=True):
+                self.assertLessEqual(abs(channel - want), 1, f"{temp}°F: {color} vs {expected}")
+            if tenth % 10 == 0:
+                self.assertEqual(color, expected)
+
+    def test_table_lookup_faster_than_interpolation(self) -> None:
+        """10,000 conversions through the table beat re-interpolating each time."""
+        temps = [(i % 1100) / 10 - 5 for i in range(10000)]
+
+        start = time.perf_counter()
+        for temp in temps:
+            _interpolate_temperature_color(temp)
+        interpolated = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for temp in temps:
+            temperature_color(temp)
+        looked_up = time.perf_counter() - start
+
+        self.assertLess(looked_up, interpolated)
+
+
+def _keyframe_pixel() -> MagicMock:
+    """Pixel controller mock whose play() completes immediately."""
+    pixel = MagicMock()
+    pixel.play = AsyncMock(return_value=True)
+    return pixel
+
+
+def _blink_count(pixel: MagicMock) -> int:
+    """Number of off keyframes in the sequence passed to play()."""
+    return sum(1 for color, _, _ in pixel.play.await_args.args[0] if color == (0, 0, 0))
+
 
 class TestBlinkForPrecip(TestCase):
     """Test blink_for_precip function."""
@@ -76,54 +117,72 @@ class TestBlinkForPrecip(TestCase):
     def test_none_precip_holds_color(self) -> None:
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, None))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, None))
 
         self.assertTrue(result)
-        mock_pixel.set_color.assert_called_with(color)
+        self.assertEqual(mock_pixel.play.await_args.args[0], [(color, 1000, Easing.STEP)])
 
     def test_zero_precip_no_blinks(self) -> None:
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, 0))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, 0))
 
         self.assertTrue(result)
-        # Should not call off() for blinks (only holds color)
-        mock_pixel.off.assert_not_called()
+        # No blinks, only the held color
+        self.assertEqual(_blink_count(mock_pixel), 0)
 
     def test_precip_clamps_above_100(self) -> None:
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, 150))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, 150))
 
         self.assertTrue(result)
         # 150% should clamp to 10 blinks
-        self.assertEqual(mock_pixel.off.call_count, 10)
+        self.assertEqual(_blink_count(mock_pixel), 10)
 
     def test_interrupt_returns_false(self) -> None:
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
         def is_pressed() -> bool:
             return True
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, 50, is_pressed))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, 50, is_pressed))
 
         self.assertFalse(result)
+        mock_pixel.play.assert_not_awaited()
+
+    def test_stopped_playback_returns_false(self) -> None:
+        """A press that stops the sequence mid-cycle reports an interrupt."""
+        from modes.modes import blink_for_precip
+
+        mock_pixel = _keyframe_pixel()
+        mock_pixel.play.return_value = False
+
+        self.assertFalse(asyncio.run(blink_for_precip(mock_pixel, (255, 0, 0), 30)))
+
+    def test_thirty_percent_keyframes(self) -> None:
+        """30% plays 3 on/off blinks then holds the color, as one sequence."""
+        from modes.modes import blink_for_precip
+
+        mock_pixel = _keyframe_pixel()
+        color = (10, 220, 10)
+
+        asyncio.run(blink_for_precip(mock_pixel, color, 30))
+
+        blink = [(color, 300, Easing.STEP), ((0, 0, 0), 200, Easing.STEP)]
+        mock_pixel.play.assert_awaited_once_with(blink * 3 + [(color, 3000, Easing.STEP)])
 
 
 class TestWeatherModeClass(TestCase):
@@ -456,27 +515,25 @@ class TestBlinkForPrecipEdgeCases(TestCase):
         """Verify negative precipitation clamps to zero blinks."""
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, -10))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, -10))
 
         self.assertTrue(result)
-        mock_pixel.off.assert_not_called()
+        self.assertEqual(_blink_count(mock_pixel), 0)
 
     def test_interrupt_function_exception_handled(self) -> None:
         """Verify exception in is_pressed_fn is caught."""
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
         def bad_is_pressed() -> bool:
             raise RuntimeError("Test error")
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, 10, bad_is_pressed))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, 10, bad_is_pressed))
 
         # Should complete normally despite exception
         self.assertTrue(result)
@@ -485,11 +542,10 @@ class TestBlinkForPrecipEdgeCases(TestCase):
         """Verify 50% precipitation gives 5 blinks."""
         from modes.modes import blink_for_precip
 
-        mock_pixel = MagicMock()
+        mock_pixel = _keyframe_pixel()
         color = (255, 0, 0)
 
-        with patch("modes.modes.Scheduler.sleep", new=AsyncMock(return_value=None)):
-            result = asyncio.run(blink_for_precip(mock_pixel, color, 50))
+        result = asyncio.run(blink_for_precip(mock_pixel, color, 50))
 
         self.assertTrue(result)
-        self.assertEqual(mock_pixel.off.call_count, 5)
+        self.assertEqual(_blink_count(mock_pixel), 5)
@@ -1,7 +1,9 @@
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from controllers.pixel_controller import PixelController
+from controllers.pixel_controller import Easing, PixelController
+from core.scheduler import Scheduler, Signal
 from tests.unit import TestCase
 
 
@@ -14,6 +16,8 @@ class FakePixel:
         self.last_value: tuple[int, int, int] | None = None
 
     def __setitem__(self, idx: int, value: tuple[int, int, int]) -> None:
+        # Copy like the real pixel buffer does (callers may reuse a list)
+        value = (int(value[0]), int(value[1]), int(value[2]))
         self.writes.append((idx, value))
         self.last_value = value
 
@@ -50,14 +54,30 @@ class TestPixelController(TestCase):
     def _make_controller(self) -> PixelController:
         return PixelController.instance(pixel=self.fake_pixel)
 
+    def _virtual_playback(self) -> list[float]:
+        """Run keyframe playback in virtual time; returns the timeout of every wait."""
+        clock = _VirtualClock()
+        waits: list[float] = []
+
+        async def wait(signal: Signal, timeout: float) -> bool:
+            if signal.is_set():
+                return True
+            waits.append(timeout)
+            clock.now += timeout
+            return False
+
+        patch("controllers.pixel_controller.time", clock).start()
+        patch.object(Signal, "wait", wait).start()
+        return waits
+
     def test_instance_initializes_hardware_once(self) -> None:
         first = PixelController.instance()
         second = PixelController.instance()
 
         self.assertIs(first, second)
-        self.mock_neopixel_ctor.assert_called_once_with(self.mock_board.NEOPIXEL, 1, brightness=0.3, auto_write=True)
-        self.mock_scheduler_cls.instance.assert_called_once()
-        self.mock_scheduler.schedule_periodic.assert_called_once()
+        self.mock_neopixel_ctor.assert_called_once_with(self.mock_board.NEOPIXEL, 1, brightness=0.3, auto_write=False)
+        # Solid mode at boot: the animation task is only registered once an animation starts
+        self.mock_scheduler.schedule_periodic.assert_not_called()
 
     def test_set_color_casts_and_shows(self) -> None:
         controller = self._make_controller()
@@ -148,10 +168,11 @@ class TestPixelController(TestCase):
         controller = self._make_controller()
         controller._save_state = MagicMock(return_value={"mode": "saved"})  # type: ignore[assignment]
         controller._restore_state = MagicMock()  # type: ignore[assignment]
+        waits = self._virtual_playback()
 
         asyncio.run(controller.blink_success(times=2, restore_previous_state=True))
 
-        self.assertEqual(self.scheduler_sleep.await_count, 4)
+        self.assertEqual(waits, [0.5, 0.2, 0.5, 0.2])
         controller._restore_state.assert_called_once_with({"mode": "saved"})  # type: ignore[attr-defined]
         self.assertTrue(any(color == (0, 255, 0) for _, color in self.fake_pixel.writes))
 
@@ -159,9 +180,271 @@ class TestPixelController(TestCase):
         controller = self._make_controller()
         controller._save_state = MagicMock(return_value={"mode": "saved"})  # type: ignore[assignment]
         controller._restore_state = MagicMock()  # type: ignore[assignment]
+        waits = self._virtual_playback()
 
         asyncio.run(controller.blink_error(times=1, restore_previous_state=False))
 
-        self.assertEqual(self.scheduler_sleep.await_count, 2)
+        self.assertEqual(len(waits), 2)
+        self.assertEqual(self.fake_pixel.last_value, (0, 0, 0))
         controller._restore_state.assert_not_called()  # type: ignore[attr-defined]
         self.assertTrue(any(color == (255, 0, 0) for _, color in self.fake_pixel.writes))
+
+    def test_animation_task_runs_only_while_animating(self) -> None:
+        controller = self._make_controller()
+
+        controller.indicate_setup_mode()
+        controller._start_flashing()  # Switching animations keeps the existing task
+        self.mock_scheduler.schedule_periodic.assert_called_once()
+        self.assertEqual(self.mock_scheduler.schedule_periodic.call_args.kwargs["name"], "LED Animation")
+
+        controller.clear()
+        self.mock_scheduler.cancel.assert_called_once_with(self.mock_scheduler.schedule_periodic.return_value)
+
+        controller.clear()  # Already suspended
+        self.mock_scheduler.cancel.assert_called_once()
+
+    def test_blink_suspends_then_resumes_animation(self) -> None:
+        controller = self._make_controller()
+        controller.indicate_setup_mode()
+        self._virtual_playback()
+
+        asyncio.run(controller.blink_success(times=1))
+
+        self.mock_scheduler.cancel.assert_called_once()
+        self.assertEqual(self.mock_scheduler.schedule_periodic.call_count, 2)
+        self.assertEqual(controller._mode, controller._MODE_PULSING)
+
+    def test_set_color_skips_unchanged_value(self) -> None:
+        controller = self._make_controller()
+
+        controller.set_color((10, 20, 30))
+        controller.set_color((10.0, 20.0, 30.0))  # type: ignore[arg-type]  # Same color after int()
+        self.assertEqual(self.fake_pixel.show_call_count, 1)
+
+        controller.set_color((10, 20, 31))
+        self.assertEqual(self.fake_pixel.show_call_count, 2)
+
+        replacement = FakePixel()
+        PixelController.instance(pixel=replacement)
+        controller.set_color((10, 20, 31))  # New hardware must be written even if the color matches
+        self.assertEqual(replacement.last_value, (10, 20, 31))
+
+    def test_frames_reuse_one_color_buffer(self) -> None:
+        controller = self._make_controller()
+        written: list[int] = []
+        controller.pixels = MagicMock()
+        controller.pixels.__setitem__.side_effect = lambda _idx, value: written.append(id(value))
+        controller._shown = -1
+
+        controller.indicate_setup_mode()
+        for _ in range(10):
+            controller._advance_frame()
+
+        self.assertEqual(len(written), 11)
+        self.assertEqual(set(written), {id(controller._color_buf)})
+
+    def _shows_per_second(self, frames: int) -> float:
+        """Advance frames at 25Hz and return show() calls per second."""
+        controller = PixelController.instance()
+        base = self.fake_pixel.show_call_count
+        for _ in range(frames):
+            controller._advance_frame()
+        return (self.fake_pixel.show_call_count - base) / (frames * PixelController.ANIMATION_PERIOD)
+
+    def test_show_rate_flash_pattern(self) -> None:
+        """Flashing only shows on color changes (every 8 frames), not every frame."""
+        self._make_controller().indicate_downloading()
+        rate = self._shows_per_second(250)
+        self.assertLessEqual(rate, 25 / 8 + 0.2)  # Previously 25/s
+
+    def test_show_rate_pulse_pattern(self) -> None:
+        """Pulsing changes brightness every frame, so every frame is still shown."""
+        self._make_controller().indicate_setup_mode()
+        rate = self._shows_per_second(250)
+        self.assertAlmostEqual(rate, 25.0, delta=0.5)
+
+    @staticmethod
+    def _float_pulse(
+        color: tuple[int, int, int], min_b: float, max_b: float, start: float, frames: int
+    ) -> list[tuple[int, int, int]]:
+        """The per-frame float recurrence the pulse table replaced."""
+        brightness, direction = start, 1
+        out = []
+        for _ in range(frames):
+            brightness += 0.04 * direction
+            if brightness >= max_b:
+                brightness, direction = max_b, -1
+            elif brightness <= min_b:
+                brightness, direction = min_b, 1
+            br = max(0.0, min(1.0, brightness))
+            out.append((int(color[0] * br), int(color[1] * br), int(color[2] * br)))
+        return out
+
+    def test_pulse_table_matches_float_recurrence(self) -> None:
+        """Table frames are identical to recomputing brightness with floats every frame."""
+        controller = self._make_controller()
+        for color, min_b, max_b, start in [
+            ((255, 255, 255), 0.3, 1.0, 0.5),
+            ((0, 0, 255), 0.05, 0.8, 0.5),
+            ((200, 100, 50), 0.0, 1.0, 0.97),
+            ((10, 10, 10), 0.2, 0.8, 0.5),
+        ]:
+            controller._start_pulsing(color=color, min_b=min_b, max_b=max_b, start_brightness=start)
+            self.assertLessEqual(len(controller._pulse_states), 80)
+
+            frames = []
+            for _ in range(200):
+                controller._render_pulse_frame()
+                frames.append(self.fake_pixel.last_value)
+
+            self.assertEqual(frames, self._float_pulse(color, min_b, max_b, start, 200))
+
+    def test_pulse_table_frames_faster_than_float_math(self) -> None:
+        """10,000 pulse frames from the table beat the former per-frame float render."""
+        controller = self._make_controller()
+
+        def float_render() -> None:
+            controller._brightness += 0.04 * controller._direction
+            if controller._brightness >= controller._max_b:
+                controller._brightness = controller._max_b
+                controller._direction = -1
+            elif controller._brightness <= controller._min_b:
+                controller._brightness = controller._min_b
+                controller._direction = 1
+            r, g, b = controller._pulse_color
+            br = max(0.0, min(1.0, controller._brightness))
+            controller._write(int(r * br), int(g * br), int(b * br))
+
+        timings = []
+        for render in (float_render, controller._render_pulse_frame):
+            controller.indicate_setup_mode()
+            start = time.perf_counter()
+            for _ in range(10000):
+                render()
+            timings.append(time.perf_counter() - start)
+
+        self.assertLess(timings[1], timings[0])
+
+    def test_show_rate_weather_pattern(self) -> None:
+        """WeatherMode re-sends its color every cycle; only real changes reach the LED."""
+        from modes.modes import blink_for_precip
+
+        controller = self._make_controller()
+        waits = self._virtual_playback()
+
+        async def cycles(precip: int) -> None:
+            for _ in range(10):
+                await blink_for_precip(controller, (10, 220, 10), precip)
+
+        asyncio.run(cycles(0))
+        steady_shows = self.fake_pixel.show_call_count
+        asyncio.run(cycles(30))
+        seconds = sum(waits)
+
+        self.assertEqual(steady_shows, 1)  # Previously one per cycle
+        # 30%: 3 blinks then hold = 7 set_color calls per cycle; the first "on" repeats the held color
+        self.assertEqual(self.fake_pixel.show_call_count - steady_shows, 10 * 6)
+        self.assertLess(self.fake_pixel.show_call_count / seconds, 1.5)
+
+    def test_precip_cycle_wakes_once_per_keyframe(self) -> None:
+        """A 30% cycle sleeps once per segment instead of polling every 50ms."""
+        from modes.modes import blink_for_precip
+
+        controller = self._make_controller()
+        waits = self._virtual_playback()
+
+        self.assertTrue(asyncio.run(blink_for_precip(controller, (10, 220, 10), 30)))
+
+        self.assertEqual(len(waits), 7)  # Previously 90 sleep/poll iterations
+        self.assertAlmostEqual(sum(waits), 4.5)
+
+    def test_play_linear_fade(self) -> None:
+        """LINEAR keyframes fade toward the next color at the animation frame rate."""
+        controller = self._make_controller()
+        waits = self._virtual_playback()
+
+        keyframes = [((0, 0, 0), 400, Easing.LINEAR), ((200, 100, 40), 200, Easing.STEP)]
+        self.assertTrue(asyncio.run(controller.play(keyframes)))
+
+        self.assertEqual(len(waits), 11)  # 10 fade frames, then one wait for the held color
+        self.assertIn((0, (100, 50, 20)), self.fake_pixel.writes)  # Halfway through the fade
+        self.assertEqual(self.fake_pixel.last_value, (200, 100, 40))
+
+    def test_stop_ends_playback_immediately(self) -> None:
+        """stop() wakes the sequence without waiting for the current keyframe to end."""
+        controller = self._make_controller()
+
+        async def scenario() -> bool:
+            playing = asyncio.create_task(controller.play([((0, 0, 255), 5000, Easing.STEP)]))
+            await asyncio.sleep(0.01)
+            controller.stop()
+            return await playing
+
+        start = time.perf_counter()
+        self.assertFalse(asyncio.run(scenario()))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIsNone(controller._playback)
+        self.assertEqual(self.fake_pixel.last_value, (0, 0, 255))
+
+
+class _VirtualClock:
+    """Stand-in for the scheduler's time module, advanced by _run_virtual()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _run_virtual(scheduler: Scheduler, clock: _VirtualClock, seconds: float) -> None:
+    """Dispatch every due task in virtual time, as the event loop would, for the given duration."""
+    end = clock.now + seconds
+    queue = scheduler.ready_queue
+    while len(queue) and queue.heap[0].next_run_time <= end:
+        task = queue.pop()
+        clock.now = max(clock.now, task.next_run_time)
+        asyncio.run(scheduler._run_task(task))
+        if task.resident and not task.cancelled:
+            queue.push(task)  # The resident loop would sleep until next_run_time and run again
+    clock.now = end
+
+
+class TestPixelAnimationIdle(TestCase):
+    """Scheduler-level check that solid mode costs no animation wakeups."""
+
+    def setUp(self) -> None:
+        PixelController._instance = None
+        PixelController._initialized = False
+
+        self.scheduler = object.__new__(Scheduler)
+        self.scheduler._init()
+        self.clock = _VirtualClock()
+        patch.dict(Scheduler._run_task.__globals__, {"time": self.clock}).start()
+        patch("core.logging_helper._log_level", 60).start()
+        patch("controllers.pixel_controller.Scheduler.instance", return_value=self.scheduler).start()
+        self.controller = PixelController.instance(pixel=FakePixel())
+
+    def tearDown(self) -> None:
+        patch.stopall()
+        PixelController._instance = None
+        PixelController._initialized = False
+
+    def test_no_animation_runs_during_60s_solid_interval(self) -> None:
+        self.controller.indicate_setup_mode()
+        _run_virtual(self.scheduler, self.clock, 2.0)
+        pulsing_runs = self.scheduler.total_tasks_executed
+        self.assertGreaterEqual(pulsing_runs, 49)  # 25Hz for 2s
+
+        self.controller.set_color((0, 0, 255))
+        self.controller.clear()  # Solid mode, as WeatherMode shows
+        self.controller.set_color((255, 128, 0))
+        _run_virtual(self.scheduler, self.clock, 60.0)
+
+        self.assertEqual(self.scheduler.total_tasks_executed, pulsing_runs)
+        self.assertEqual(len(self.scheduler.ready_queue), 0)
+        self.assertEqual(self.scheduler.dump_state()["resident_tasks"], [])
+
+        self.controller.indicate_setup_mode()
+        _run_virtual(self.scheduler, self.clock, 1.0)
+        self.assertGreaterEqual(self.scheduler.total_tasks_executed - pulsing_runs, 24)
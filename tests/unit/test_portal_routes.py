@@ -293,6 +293,39 @@ class TestHandleUpdateStatus(unittest.TestCase):
         self.assertEqual(call_args["progress"], 75)
 
 
+class TestHandleSchedulerStats(unittest.TestCase):
+    """Test handle_scheduler_stats method."""
+
+    def test_returns_exported_metrics(self) -> None:
+        """Verify the scheduler's compact metrics are returned as JSON."""
+        from managers.configuration.portal_routes import PortalRoutes
+
+        mock_config = MagicMock()
+        routes = PortalRoutes(mock_config)
+        metrics = {"bounds_ms": [1, 2], "tasks": [[1, "LED Animation", 10, [10, 0.5, 1.0, 1.0, [10, 0, 0]], []]]}
+
+        mock_scheduler_module = MagicMock()
+        mock_scheduler_module.Scheduler.instance.return_value.export_metrics.return_value = metrics
+        with patch.dict(sys.modules, {"core.scheduler": mock_scheduler_module}):
+            routes.handle_scheduler_stats(MagicMock())
+
+        self.assertEqual(mock_config._json_ok.call_args[0][1], metrics)
+
+    def test_error_returns_500(self) -> None:
+        """Verify errors are reported as a JSON error."""
+        from managers.configuration.portal_routes import PortalRoutes
+
+        mock_config = MagicMock()
+        routes = PortalRoutes(mock_config)
+
+        mock_scheduler_module = MagicMock()
+        mock_scheduler_module.Scheduler.instance.side_effect = RuntimeError("boom")
+        with patch.dict(sys.modules, {"core.scheduler": mock_scheduler_module}):
+            routes.handle_scheduler_stats(MagicMock())
+
+        self.assertEqual(mock_config._json_error.call_args[1]["code"], 500)
+
+
 class TestHandleScan(unittest.TestCase):
     """Test handle_scan method."""
 
@@ -392,6 +425,7 @@ class TestRegisterRoutes(unittest.TestCase):
         mock_server.route.assert_any_call("/activate", "POST")
         mock_server.route.assert_any_call("/update-now", "POST")
         mock_server.route.assert_any_call("/update-status", "GET")
+        mock_server.route.assert_any_call("/scheduler-stats", "GET")
 
     def test_registers_captive_portal_paths(self) -> None:
         """Verify all captive portal paths are registered."""
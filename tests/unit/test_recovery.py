@@ -1,8 +1,103 @@
 """Unit tests for recovery utilities."""
 
+import builtins
+import hashlib
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+from core.app_typing import Any
+
+_real_open = builtins.open
+
+
+class _CountingFile:
+    """File wrapper that adds every write to a _WriteCounter."""
+
+    def __init__(self, f: Any, counter: "_WriteCounter") -> None:
+        self._f = f
+        self._counter = counter
+
+    def write(self, data: Any) -> int:
+        n = self._f.write(data)
+        self._counter.bytes_written += n
+        return n
+
+    def __enter__(self) -> "_CountingFile":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._f.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._f, name)
+
+
+class _WriteCounter:
+    """Stand-in for builtins.open that totals the bytes written to files."""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+
+    def __call__(self, path: str, mode: str = "r", *args: Any, **kwargs: Any) -> Any:
+        f = _real_open(path, mode, *args, **kwargs)
+        if any(flag in mode for flag in "wa+"):
+            return _CountingFile(f, self)
+        return f
+
+
+class _RecoveryTreeTestCase(unittest.TestCase):
+    """Base class: critical files and a recovery directory under a temp dir."""
+
+    def setUp(self) -> None:
+        from utils import recovery
+
+        self.test_dir = tempfile.mkdtemp()
+        self.recovery_dir = self.test_dir + "/recovery"
+        root = self.test_dir + "/root"
+        # Absolute critical paths under the temp dir, so "" still means "the root"
+        self.files = {
+            root + "/boot.py": b"import core.boot_support\n",
+            root + "/core/boot_support.mpy": bytes(range(256)) * 12,
+            root + "/lib/adafruit_hashlib/__init__.mpy": b"\x43\x06" + bytes(4000),
+        }
+        for path, data in self.files.items():
+            self._write(path, data)
+
+        self._patches: list[Any] = [
+            patch.object(recovery, "hashlib", hashlib),
+            patch.object(recovery, "CRITICAL_FILES", set(self.files)),
+            patch.object(recovery, "RECOVERY_DIR", self.recovery_dir),
+            patch.object(recovery, "RECOVERY_INTEGRITY_FILE", self.recovery_dir + "/.integrity"),
+            patch.object(recovery, "INSTALLED_INDEX_FILE", self.test_dir + "/installed_files.json"),
+            patch("utils.recovery.logger"),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        for p in self._patches:
+            p.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _flip_bit(self, path: str) -> None:
+        data = bytearray(self._read(path))
+        data[len(data) // 2] ^= 0x01
+        self._write(path, bytes(data))
+
 
 class TestValidateFiles(unittest.TestCase):
     """Test unified validate_files function."""
@@ -114,127 +209,76 @@ class TestRecoveryExists(unittest.TestCase):
             self.assertFalse(_recovery_exists())
 
 
-class TestCopyCriticalFiles(unittest.TestCase):
+class TestCopyCriticalFiles(_RecoveryTreeTestCase):
     """Test _copy_critical_files helper function."""
 
     def test_copies_all_critical_files(self) -> None:
         """_copy_critical_files copies all files from src to dst."""
-        mock_content = b"file content"
+        from utils.recovery import _copy_critical_files
 
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            mock_file = MagicMock()
-            if "rb" in mode:
-                mock_file.read.return_value = mock_content
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+        count, failures = _copy_critical_files("", self.recovery_dir)
 
-        with (
-            patch("os.listdir", side_effect=OSError),  # Not a directory
-            patch("os.stat", return_value=MagicMock()),
-            patch("os.mkdir"),
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.CRITICAL_FILES", {"/boot.py", "/code.py"}),
-        ):
-            from utils.recovery import _copy_critical_files
+        self.assertEqual(count, 3)
+        self.assertEqual(failures, [])
+        for path, data in self.files.items():
+            self.assertEqual(self._read(self.recovery_dir + path), data)
 
-            count, failures = _copy_critical_files("", "/recovery")
-            self.assertEqual(count, 2)
-            self.assertEqual(len(failures), 0)
+    def test_streams_through_small_buffer(self) -> None:
+        """Files larger than the copy buffer are copied whole."""
+        from utils.recovery import _copy_critical_files
 
-    def test_skips_directories(self) -> None:
-        """_copy_critical_files skips directory entries."""
-        mock_content = b"file content"
+        count, failures = _copy_critical_files("", self.recovery_dir, buffer=bytearray(100))
 
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            mock_file = MagicMock()
-            if "rb" in mode:
-                mock_file.read.return_value = mock_content
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+        self.assertEqual((count, failures), (3, []))
+        for path, data in self.files.items():
+            self.assertEqual(self._read(self.recovery_dir + path), data)
 
-        def mock_listdir(path: str) -> list[str]:
-            if path == "/lib":
-                return ["file1.mpy"]  # Directory exists
-            raise OSError("Not a directory")
+    def test_copies_only_requested_paths(self) -> None:
+        """A paths subset limits the copy to those files."""
+        from utils.recovery import _copy_critical_files
 
-        with (
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.stat", return_value=MagicMock()),
-            patch("os.mkdir"),
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.CRITICAL_FILES", {"/boot.py", "/lib"}),
-        ):
-            from utils.recovery import _copy_critical_files
+        boot_py = next(path for path in self.files if path.endswith("/boot.py"))
+        count, failures = _copy_critical_files("", self.recovery_dir, {boot_py})
+
+        self.assertEqual((count, failures), (1, []))
+        self.assertEqual(os.listdir(os.path.dirname(self.recovery_dir + boot_py)), ["boot.py"])
 
-            count, failures = _copy_critical_files("", "/recovery")
-            # Should skip /lib (directory) and copy /boot.py
-            self.assertEqual(count, 1)
-            self.assertEqual(len(failures), 0)
+    def test_skips_directories(self) -> None:
+        """_copy_critical_files skips directory entries."""
+        from utils import recovery
+
+        lib_dir = self.test_dir + "/root/lib"
+        with patch.object(recovery, "CRITICAL_FILES", set(self.files) | {lib_dir}):
+            count, failures = recovery._copy_critical_files("", self.recovery_dir)
+
+        self.assertEqual((count, failures), (3, []))
+        # lib only exists in the backup as the parent of the copied module
+        self.assertTrue(os.path.isdir(self.recovery_dir + lib_dir))
 
     def test_creates_parent_directories(self) -> None:
         """_copy_critical_files creates parent directories as needed."""
-        mock_content = b"file content"
-
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            mock_file = MagicMock()
-            if "rb" in mode:
-                mock_file.read.return_value = mock_content
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+        from utils.recovery import _copy_critical_files
 
-        with (
-            patch("os.listdir", side_effect=OSError),
-            patch("os.stat", return_value=MagicMock()),
-            patch("os.mkdir") as mock_mkdir,
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.CRITICAL_FILES", {"/core/boot_support.mpy"}),
-        ):
-            from utils.recovery import _copy_critical_files
+        _copy_critical_files("", self.recovery_dir)
 
-            count, failures = _copy_critical_files("", "/recovery")
-            # Should create /recovery/core directory
-            mock_mkdir.assert_any_call("/recovery/core")
-            self.assertEqual(count, 1)
-            self.assertEqual(len(failures), 0)
+        self.assertTrue(os.path.isdir(self.recovery_dir + self.test_dir + "/root/lib/adafruit_hashlib"))
 
     def test_handles_read_errors(self) -> None:
         """_copy_critical_files handles file read errors gracefully."""
+        from utils import recovery
 
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            if "rb" in mode and "boot.py" in path:
+        def failing_copy(src_path: str, dst_path: str, buffer: bytearray | None = None) -> int:
+            if src_path.endswith("/boot.py"):
                 raise OSError("Cannot read file")
-            mock_file = MagicMock()
-            if "rb" in mode:
-                mock_file.read.return_value = b"content"
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+            return copy_file(src_path, dst_path, buffer)
 
-        with (
-            patch("os.listdir", side_effect=OSError),
-            patch("os.stat", return_value=MagicMock()),
-            patch("os.mkdir"),
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.CRITICAL_FILES", {"/boot.py", "/code.py"}),
-        ):
-            from utils.recovery import _copy_critical_files
+        copy_file = recovery.copy_file
+        with patch.object(recovery, "copy_file", failing_copy):
+            count, failures = recovery._copy_critical_files("", self.recovery_dir)
 
-            count, failures = _copy_critical_files("", "/recovery")
-            # Should copy code.py successfully, fail on boot.py
-            self.assertEqual(count, 1)
-            self.assertEqual(len(failures), 1)
-            self.assertIn("/boot.py", failures[0])
+        self.assertEqual(count, 2)
+        self.assertEqual(len(failures), 1)
+        self.assertIn("/boot.py", failures[0])
 
 
 class TestRestoreFromRecovery(unittest.TestCase):
@@ -422,97 +466,171 @@ class TestCheckAndRestoreFromRecovery(unittest.TestCase):
             self.assertFalse(result)
 
 
-class TestCreateRecoveryBackup(unittest.TestCase):
+class TestCreateRecoveryBackup(_RecoveryTreeTestCase):
     """Test create_recovery_backup function."""
 
-    def test_clears_directory_before_backup(self) -> None:
-        """Recovery directory should be cleared before creating fresh backup."""
-        mock_file_content = b"test content"
-        mock_open_obj = MagicMock()
-        mock_open_obj.__enter__ = MagicMock(return_value=MagicMock(read=MagicMock(return_value=mock_file_content)))
-        mock_open_obj.__exit__ = MagicMock(return_value=False)
+    def _integrity_lines(self) -> list[str]:
+        with open(self.recovery_dir + "/.integrity") as f:
+            return f.read().splitlines()
 
-        with (
-            patch("os.mkdir"),
-            patch("os.listdir", side_effect=OSError),  # Not a directory
-            patch("os.sync"),
-            patch("builtins.open", return_value=mock_open_obj),
-            patch("utils.recovery.logger"),
-            patch("utils.recovery._clear_recovery_directory") as mock_clear,
-        ):
-            from utils.recovery import create_recovery_backup
+    def test_creates_backup_and_integrity_manifest(self) -> None:
+        """A first backup copies every critical file and records its hash."""
+        from utils.recovery import create_recovery_backup
 
-            create_recovery_backup()
-            mock_clear.assert_called_once()
+        success, message = create_recovery_backup()
+
+        self.assertTrue(success, message)
+        self.assertIn("complete", message.lower())
+        expected = sorted(f"{hashlib.sha256(data).hexdigest()} {path}" for path, data in self.files.items())
+        self.assertEqual(sorted(self._integrity_lines()), expected)
+        for path, data in self.files.items():
+            self.assertEqual(self._read(self.recovery_dir + path), data)
 
     def test_creates_recovery_directory(self) -> None:
-        mock_file_content = b"test content"
-        mock_open_obj = MagicMock()
-        mock_open_obj.__enter__ = MagicMock(return_value=MagicMock(read=MagicMock(return_value=mock_file_content)))
-        mock_open_obj.__exit__ = MagicMock(return_value=False)
+        """The recovery directory is created when there is no backup yet."""
+        from utils.recovery import create_recovery_backup
 
-        with (
-            patch("os.mkdir") as mock_mkdir,
-            patch("os.listdir", side_effect=OSError),  # Not a directory
-            patch("os.sync"),
-            patch("builtins.open", return_value=mock_open_obj),
-            patch("utils.recovery.logger"),
-        ):
-            from utils.recovery import create_recovery_backup
+        self.assertFalse(os.path.exists(self.recovery_dir))
+        create_recovery_backup()
 
-            success, message = create_recovery_backup()
-            # Should attempt to create recovery directory
-            mock_mkdir.assert_called()
+        self.assertTrue(os.path.isdir(self.recovery_dir))
 
     def test_backup_success_message(self) -> None:
-        mock_file = MagicMock()
-        mock_file.read.return_value = b"content"
+        """The message reports the files backed up and how many were copied."""
+        from utils.recovery import create_recovery_backup
 
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+        success, message = create_recovery_backup()
 
-        with (
-            patch("os.mkdir"),
-            patch("os.listdir", side_effect=OSError),
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.logger"),
-        ):
-            from utils.recovery import create_recovery_backup
+        self.assertTrue(success)
+        count = len(self.files)
+        self.assertEqual(message, f"Recovery backup complete: {count} critical files backed up ({count} updated)")
+
+    def test_clears_legacy_backup_without_manifest(self) -> None:
+        """A backup without an integrity manifest is cleared before copying."""
+        from utils import recovery
 
+        self._write(self.recovery_dir + "/stale.txt", b"stale")
+        with patch.object(
+            recovery, "_clear_recovery_directory", wraps=recovery._clear_recovery_directory
+        ) as mock_clear:
+            success, _ = recovery.create_recovery_backup()
+
+        self.assertTrue(success)
+        mock_clear.assert_called_once()
+        self.assertFalse(os.path.exists(self.recovery_dir + "/stale.txt"))
+
+    def test_no_change_refresh_writes_nothing(self) -> None:
+        """Refreshing an up-to-date backup only reads: zero bytes written."""
+        from utils.recovery import _validate_backup_integrity, create_recovery_backup
+
+        first_write = _WriteCounter()
+        with patch("builtins.open", first_write):
+            self.assertTrue(create_recovery_backup()[0])
+        refresh = _WriteCounter()
+        with patch("builtins.open", refresh):
             success, message = create_recovery_backup()
-            self.assertTrue(success)
-            self.assertIn("complete", message.lower())
+
+        self.assertTrue(success, message)
+        self.assertIn("(0 updated)", message)
+        self.assertGreaterEqual(first_write.bytes_written, sum(len(data) for data in self.files.values()))
+        self.assertEqual(refresh.bytes_written, 0)
+        self.assertTrue(_validate_backup_integrity()[0])
+
+    def test_refresh_keeps_manifest_left_in_temp_file(self) -> None:
+        """A manifest that only exists as the temp file is promoted, not removed as stale."""
+        from utils.recovery import _validate_backup_integrity, create_recovery_backup
+
+        create_recovery_backup()
+        integrity = self.recovery_dir + "/.integrity"
+        os.rename(integrity, integrity + ".tmp")  # Power lost between remove and rename
+
+        success, message = create_recovery_backup()
+
+        self.assertTrue(success, message)
+        self.assertIn("(0 updated)", message)
+        self.assertTrue(os.path.exists(integrity))
+        self.assertFalse(os.path.exists(integrity + ".tmp"))
+        self.assertTrue(_validate_backup_integrity()[0])
+
+    def test_refresh_copies_only_changed_files(self) -> None:
+        """Only the changed file (plus the manifest) is rewritten."""
+        from utils.recovery import _validate_backup_integrity, create_recovery_backup
+
+        create_recovery_backup()
+        boot_py = next(path for path in self.files if path.endswith("/boot.py"))
+        self._write(boot_py, b"import core.boot_support  # v2\n")
+
+        refresh = _WriteCounter()
+        with patch("builtins.open", refresh):
+            success, message = create_recovery_backup()
+
+        self.assertTrue(success, message)
+        self.assertIn("(1 updated)", message)
+        self.assertEqual(self._read(self.recovery_dir + boot_py), b"import core.boot_support  # v2\n")
+        manifest_bytes = len("\n".join(self._integrity_lines())) + 1
+        # Changed file, the manifest written without its entry, then the final manifest
+        self.assertLess(refresh.bytes_written, len(b"import core.boot_support  # v2\n") + 2 * manifest_bytes + 1)
+        self.assertTrue(_validate_backup_integrity()[0])
+
+    def test_refresh_repairs_bit_flipped_backup_copy(self) -> None:
+        """A backup copy that no longer matches its hash is recopied."""
+        from utils.recovery import _validate_backup_integrity, create_recovery_backup
+
+        create_recovery_backup()
+        module = next(path for path in self.files if path.endswith("boot_support.mpy"))
+        self._flip_bit(self.recovery_dir + module)
+
+        success, message = create_recovery_backup()
+
+        self.assertTrue(success, message)
+        self.assertIn("(1 updated)", message)
+        self.assertEqual(self._read(self.recovery_dir + module), self.files[module])
+        self.assertTrue(_validate_backup_integrity()[0])
+
+    def test_removes_stale_files_on_incremental_refresh(self) -> None:
+        """Files that are not critical are removed even when nothing is recopied."""
+        from utils.recovery import create_recovery_backup
+
+        create_recovery_backup()
+        self._write(self.recovery_dir + "/old/stale.mpy", b"stale")
+
+        self.assertTrue(create_recovery_backup()[0])
+
+        self.assertFalse(os.path.exists(self.recovery_dir + "/old"))
+        self.assertTrue(os.path.exists(self.recovery_dir + "/.integrity"))
 
     def test_backup_handles_read_errors(self) -> None:
-        def mock_open_func(path: str, mode: str = "r") -> MagicMock:
-            if "rb" in mode:
+        """Failed copies are not recorded in the manifest, so the next refresh retries them."""
+        from utils import recovery
+
+        def failing_copy(src_path: str, dst_path: str, buffer: bytearray | None = None) -> int:
+            if src_path.endswith("/boot.py"):
                 raise OSError("Cannot read file")
-            # Return mock for write operations
-            mock_file = MagicMock()
-            mock_ctx = MagicMock()
-            mock_ctx.__enter__ = MagicMock(return_value=mock_file)
-            mock_ctx.__exit__ = MagicMock(return_value=False)
-            return mock_ctx
+            return copy_file(src_path, dst_path, buffer)
 
-        with (
-            patch("os.mkdir"),
-            patch("os.listdir", side_effect=OSError),  # Not a directory
-            patch("os.stat", return_value=MagicMock()),  # File exists
-            patch("os.sync"),
-            patch("builtins.open", side_effect=mock_open_func),
-            patch("utils.recovery.logger"),
-            patch("utils.recovery.CRITICAL_FILES", {"/boot.py", "/code.py"}),
-        ):
-            from utils.recovery import create_recovery_backup
+        copy_file = recovery.copy_file
+        with patch.object(recovery, "copy_file", failing_copy):
+            success, message = recovery.create_recovery_backup()
 
-            success, message = create_recovery_backup()
-            # Should return partial success with failures
-            self.assertFalse(success)
-            self.assertIn("Partial", message)
+        self.assertFalse(success)
+        self.assertIn("Partial", message)
+        self.assertFalse(any(line.endswith("/boot.py") for line in self._integrity_lines()))
+
+        success, message = recovery.create_recovery_backup()
+        self.assertTrue(success, message)
+        self.assertIn("(3 updated)", message)
+
+    def test_without_hashlib_copies_everything(self) -> None:
+        """Builds without hashlib fall back to a full, unverified copy."""
+        from utils import recovery
+
+        with patch.object(recovery, "hashlib", None):
+            success, message = recovery.create_recovery_backup()
+            valid, _ = recovery._validate_backup_integrity()
+
+        self.assertTrue(success, message)
+        self.assertTrue(valid)
+        self.assertFalse(os.path.exists(self.recovery_dir + "/.integrity"))
 
 
 class TestValidateBackupIntegrity(unittest.TestCase):
@@ -561,6 +679,67 @@ class TestValidateBackupIntegrity(unittest.TestCase):
             self.assertEqual(len(result), 2)
 
 
+class TestBackupHashVerification(_RecoveryTreeTestCase):
+    """Test that corrupted backup copies are detected and never restored."""
+
+    def setUp(self) -> None:
+        from utils.recovery import create_recovery_backup
+
+        super().setUp()
+        self.assertTrue(create_recovery_backup()[0])
+        self.module = next(path for path in self.files if path.endswith("boot_support.mpy"))
+
+    def test_validate_detects_bit_flip(self) -> None:
+        """A backup copy that is present but bit-flipped fails validation."""
+        from utils.recovery import _validate_backup_integrity
+
+        self._flip_bit(self.recovery_dir + self.module)
+
+        valid, message = _validate_backup_integrity()
+
+        self.assertFalse(valid)
+        self.assertIn("corrupted", message)
+        self.assertIn(self.module, message)
+
+    def test_restore_replaces_only_missing_files(self) -> None:
+        """Restore copies verified backups over missing root files only."""
+        from utils.recovery import _restore_from_recovery
+
+        os.remove(self.module)
+        with patch("utils.recovery.os.sync"):
+            success, message = _restore_from_recovery(MagicMock())
+
+        self.assertTrue(success, message)
+        self.assertIn("1 critical files restored", message)
+        self.assertEqual(self._read(self.module), self.files[self.module])
+
+    def test_restore_drops_installed_index(self) -> None:
+        """Restored files are not described by the installed file index, so it is deleted."""
+        from utils.recovery import _restore_from_recovery
+
+        index_path = self.test_dir + "/installed_files.json"
+        self._write(index_path, b'{"version": "1.0.0", "files": {}}')
+        os.remove(self.module)
+        with patch("utils.recovery.os.sync"):
+            success, message = _restore_from_recovery(MagicMock())
+
+        self.assertTrue(success, message)
+        self.assertFalse(os.path.exists(index_path))
+
+    def test_restore_skips_corrupted_backup_copy(self) -> None:
+        """A corrupted backup copy is reported, not copied into root."""
+        from utils.recovery import _restore_from_recovery
+
+        os.remove(self.module)
+        self._flip_bit(self.recovery_dir + self.module)
+        with patch("utils.recovery.os.sync"):
+            success, message = _restore_from_recovery(MagicMock())
+
+        self.assertFalse(success)
+        self.assertIn("1 failed", message)
+        self.assertFalse(os.path.exists(self.module))
+
+
 class TestCriticalFilesConstant(unittest.TestCase):
     """Test CRITICAL_FILES constant."""
 
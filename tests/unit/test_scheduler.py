@@ -10,14 +10,23 @@ Tests cover:
 See tests.unit for instructions on running tests.
 """
 
+import asyncio
+import contextlib
+import json
+import time
+from unittest.mock import patch
+
 from core.app_typing import Any
 from core.scheduler import (
+    OverrunPolicy,
     Scheduler,
     Task,
     TaskFatalError,
     TaskHandle,
     TaskNonFatalError,
     TaskType,
+    _Histogram,
+    _MinHeap,
 )
 from tests.unit import TestCase
 
@@ -95,15 +104,12 @@ class TestSchedulerBasic(TestCase):
 
         task1 = Task("A", 50, dummy, TaskType.ONE_SHOT, 1.0)
         task1.next_run_time = 100.0
-        task1.effective_priority = 50
 
         task2 = Task("B", 0, dummy, TaskType.ONE_SHOT, 1.0)
         task2.next_run_time = 100.0
-        task2.effective_priority = 0
 
         task3 = Task("C", 50, dummy, TaskType.ONE_SHOT, 1.0)
         task3.next_run_time = 50.0
-        task3.effective_priority = 50
 
         # Earlier time wins
         self.assertTrue(task3 < task1, "Earlier next_run_time has priority")
@@ -135,11 +141,9 @@ class TestSchedulerBasic(TestCase):
 
         task1 = Task("A", 50, dummy, TaskType.ONE_SHOT, 1.0)
         task1.next_run_time = 100.0
-        task1.effective_priority = 50
 
         task2 = Task("B", 50, dummy, TaskType.ONE_SHOT, 1.0)
         task2.next_run_time = 100.0
-        task2.effective_priority = 50
 
         # Lower task_id wins (task1 created before task2)
         self.assertTrue(task1 < task2)
@@ -405,6 +409,721 @@ class TestSchedulerMakeCoroutineFactory(TestCase):
         self.assertTrue(callable(factory))
 
 
+class _FakeClock:
+    """Stand-in for the scheduler's time module; monotonic() only moves when advanced."""
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _patch_scheduler_clock(clock: _FakeClock) -> Any:
+    """Replace `time` in the scheduler module's globals.
+
+    Patched through the real module's globals because other test modules swap
+    sys.modules["core.scheduler"] for a stub.
+    """
+    return patch.dict(Scheduler._run_task.__globals__, {"time": clock})
+
+
+class TestHistogram(TestCase):
+    """Tests for the fixed-bucket timing histogram."""
+
+    def test_record_places_samples_in_buckets(self) -> None:
+        """Samples land in the first bucket whose bound is >= the value."""
+        hist = _Histogram()
+        for seconds in (0.0005, 0.001, 0.003, 0.015, 2.0, -0.01):
+            hist.record(seconds)
+
+        bounds = list(_Histogram.BOUNDS_MS)
+        self.assertEqual(hist.counts[bounds.index(1)], 3)  # 0.5ms, 1ms, negative clamped to 0
+        self.assertEqual(hist.counts[bounds.index(5)], 1)
+        self.assertEqual(hist.counts[bounds.index(20)], 1)
+        self.assertEqual(hist.counts[-1], 1)  # Overflow
+        self.assertEqual(hist.count, 6)
+        self.assertAlmostEqual(hist.max_ms, 2000.0)
+
+    def test_percentiles(self) -> None:
+        """p95/p99 come from the bucket containing that rank, capped at max."""
+        hist = _Histogram()
+        for _ in range(95):
+            hist.record(0.0015)
+        for _ in range(4):
+            hist.record(0.040)
+        hist.record(0.300)
+
+        self.assertEqual(hist.percentile(0.95), 2.0)
+        self.assertEqual(hist.percentile(0.99), 50.0)
+        self.assertAlmostEqual(hist.percentile(1.0), 300.0)
+        self.assertEqual(_Histogram().percentile(0.99), 0.0)
+
+    def test_record_does_not_grow_buckets(self) -> None:
+        """Recording reuses the bucket list allocated at construction."""
+        hist = _Histogram()
+        counts = hist.counts
+        for i in range(1000):
+            hist.record(i / 1000)
+        self.assertIs(hist.counts, counts)
+        self.assertEqual(len(counts), len(_Histogram.BOUNDS_MS) + 1)
+
+
+class TestTaskTimingMetrics(TestCase):
+    """Tests for per-task lateness and duration tracking with a fake clock."""
+
+    def setUp(self) -> None:
+        self.scheduler = Scheduler.instance()
+        self.clock = _FakeClock()
+        self._patch = _patch_scheduler_clock(self.clock)
+        self._patch.start()
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+
+    def _make_task(self, work_seconds: float) -> Task:
+        clock = self.clock
+
+        async def work() -> None:
+            clock.advance(work_seconds)
+
+        task = Task("Timed", 50, work, TaskType.ONE_SHOT, 0)
+        return task
+
+    def test_lateness_and_duration_recorded(self) -> None:
+        """Each run records start lateness and run duration."""
+        task = self._make_task(work_seconds=0.030)
+        for late in (0.0, 0.004, 0.004, 0.120):
+            task.next_run_time = self.clock.now - late
+            asyncio.run(self.scheduler._run_task(task))
+
+        bounds = list(_Histogram.BOUNDS_MS)
+        self.assertEqual(task.lateness.count, 4)
+        self.assertEqual(task.lateness.counts[bounds.index(1)], 1)
+        self.assertEqual(task.lateness.counts[bounds.index(5)], 2)
+        self.assertEqual(task.lateness.counts[bounds.index(250)], 1)
+        self.assertAlmostEqual(task.lateness.max_ms, 120.0)
+
+        self.assertEqual(task.duration.count, 4)
+        self.assertEqual(task.duration.counts[bounds.index(50)], 4)
+        self.assertAlmostEqual(task.duration.max_ms, 30.0)
+
+    def test_failed_runs_are_timed(self) -> None:
+        """Duration is recorded even when the task raises."""
+        clock = self.clock
+
+        async def failing() -> None:
+            clock.advance(0.2)
+            raise TaskNonFatalError("boom")
+
+        task = Task("Failing", 50, failing, TaskType.ONE_SHOT, 0)
+        task.next_run_time = self.clock.now
+        asyncio.run(self.scheduler._run_task(task))
+
+        self.assertEqual(task.duration.count, 1)
+        self.assertAlmostEqual(task.duration.max_ms, 200.0)
+
+    def test_dump_state_and_export_include_histograms(self) -> None:
+        """dump_state has full summaries; export_metrics is compact and JSON-serializable."""
+
+        async def noop() -> None:
+            pass
+
+        handle = self.scheduler.schedule_periodic(coroutine=noop, period=5.0, priority=50, name="Exported")
+        try:
+            task = self.scheduler.task_registry[handle.task_id]
+            task.lateness.record(0.003)
+            task.duration.record(0.012)
+
+            queued = [t for t in self.scheduler.dump_state()["queued_tasks"] if t["id"] == handle.task_id][0]
+            self.assertEqual(queued["lateness"]["count"], 1)
+            self.assertEqual(queued["duration"]["p99_ms"], 12.0)
+
+            metrics = self.scheduler.export_metrics()
+            self.assertEqual(metrics["bounds_ms"], list(_Histogram.BOUNDS_MS))
+            row = [r for r in metrics["tasks"] if r[0] == handle.task_id][0]
+            self.assertEqual(row[1], "Exported")
+            self.assertEqual(row[3][:4], [1, 3.0, 3.0, 3.0])
+            self.assertEqual(sum(row[4][4]), 1)
+            json.dumps(metrics)
+        finally:
+            self.scheduler.cancel(handle)
+
+        exported_ids = [r[0] for r in self.scheduler.export_metrics()["tasks"]]
+        self.assertNotIn(handle.task_id, exported_ids)
+
+    def test_finished_one_shot_is_not_exported(self) -> None:
+        """A one-shot task is retired from the registry once it has run."""
+        scheduler = _fresh_scheduler()
+
+        async def noop() -> None:
+            pass
+
+        handle = scheduler.schedule_now(coroutine=noop, priority=50, name="Blink")
+        self.assertIn(handle.task_id, [r[0] for r in scheduler.export_metrics()["tasks"]])
+
+        asyncio.run(scheduler._run_task(scheduler.ready_queue.pop()))
+
+        self.assertNotIn(handle.task_id, [r[0] for r in scheduler.export_metrics()["tasks"]])
+        self.assertNotIn(handle.task_id, scheduler.task_registry)
+
+
+def _fresh_scheduler() -> Scheduler:
+    """Create an isolated Scheduler (bypassing the singleton) for event-loop tests."""
+    scheduler = object.__new__(Scheduler)
+    scheduler._init()
+    return scheduler
+
+
+def _run_loop_for(scheduler: Scheduler, seconds: float) -> None:
+    """Run the scheduler's event loop for roughly the given wall-clock time."""
+
+    async def stop() -> None:
+        await Scheduler.sleep(seconds)
+        raise TaskFatalError("test finished")
+
+    scheduler.schedule_now(coroutine=stop, priority=90, name="Stop")
+    with contextlib.suppress(TaskFatalError):
+        asyncio.run(scheduler._event_loop())
+
+
+class TestTicklessIdle(TestCase):
+    """Tests for deadline-based idling and wake-ups in the event loop."""
+
+    def setUp(self) -> None:
+        self.scheduler = _fresh_scheduler()
+        self._level = patch("core.logging_helper._log_level", 60)  # Keep the fatal stop quiet
+        self._level.start()
+
+    def tearDown(self) -> None:
+        self._level.stop()
+
+    def test_idle_loop_sleeps_until_next_deadline(self) -> None:
+        """With only long-interval work queued the loop barely wakes."""
+
+        async def noop() -> None:
+            pass
+
+        self.scheduler.schedule_recurring(coroutine=noop, interval=300.0, priority=40, name="Weather Updates")
+        self.scheduler.schedule_recurring(coroutine=noop, interval=3000.0, priority=70, name="RTC Update")
+
+        _run_loop_for(self.scheduler, 0.5)
+
+        # A 0.1s polling cap would need at least 5 waits here
+        self.assertLessEqual(self.scheduler.total_idle_waits, 3)
+
+    def test_schedule_now_wakes_idle_loop(self) -> None:
+        """Work scheduled while the loop idles on a far deadline starts promptly."""
+        started: list[float] = []
+
+        async def noop() -> None:
+            pass
+
+        async def urgent() -> None:
+            started.append(time.monotonic())
+
+        scheduled_at: list[float] = []
+
+        async def trigger() -> None:
+            await Scheduler.sleep(0.1)
+            scheduled_at.append(time.monotonic())
+            self.scheduler.schedule_now(coroutine=urgent, priority=10, name="Urgent")
+
+        self.scheduler.schedule_recurring(coroutine=noop, interval=300.0, priority=40, name="Far Away")
+        self.scheduler.schedule_now(coroutine=trigger, priority=50, name="Trigger")
+
+        _run_loop_for(self.scheduler, 0.3)
+
+        self.assertEqual(len(started), 1)
+        self.assertLess(started[0] - scheduled_at[0], 0.02)
+
+    def test_fast_periodic_keeps_rate_next_to_long_tasks(self) -> None:
+        """A 100Hz task is not throttled while the only other work is minutes away."""
+        runs = [0]
+
+        async def tick() -> None:
+            runs[0] += 1
+
+        async def noop() -> None:
+            pass
+
+        self.scheduler.schedule_recurring(coroutine=noop, interval=300.0, priority=40, name="Weather Updates")
+        self.scheduler.schedule_periodic(coroutine=tick, period=0.01, priority=0, name="Button Monitor")
+
+        _run_loop_for(self.scheduler, 0.5)
+
+        # ~50 expected; polling at the old 0.1s cap gave ~5
+        self.assertGreater(runs[0], 35)
+
+    def test_fatal_error_wakes_loop_waiting_without_deadline(self) -> None:
+        """An empty heap waits indefinitely but still exits on a fatal task error."""
+        start = time.monotonic()
+        _run_loop_for(self.scheduler, 0.1)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertGreaterEqual(self.scheduler.total_idle_waits, 1)
+
+
+class TestEagerCancellation(TestCase):
+    """Tests for heap index tracking and immediate removal of cancelled tasks."""
+
+    def setUp(self) -> None:
+        self.scheduler = _fresh_scheduler()
+        self._level = patch("core.logging_helper._log_level", 60)  # Registration/cancel logs are noise here
+        self._level.start()
+
+    def tearDown(self) -> None:
+        self._level.stop()
+
+    async def _noop(self) -> None:
+        pass
+
+    def _assert_heap_consistent(self) -> None:
+        heap = self.scheduler.ready_queue.heap
+        for i, task in enumerate(heap):
+            self.assertEqual(task.heap_index, i)
+            if i:
+                self.assertFalse(task < heap[(i - 1) // 2], f"heap order broken at {i}")
+
+    def test_cancel_removes_queued_task_immediately(self) -> None:
+        """A queued task leaves the heap and registry as soon as it is cancelled."""
+        handle = self.scheduler.schedule_recurring(coroutine=self._noop, interval=3600.0, name="Update Check")
+        task = self.scheduler.task_registry[handle.task_id]
+
+        self.assertTrue(self.scheduler.cancel(handle))
+
+        self.assertEqual(len(self.scheduler.ready_queue), 0)
+        self.assertNotIn(handle.task_id, self.scheduler.task_registry)
+        self.assertEqual(task.heap_index, -1)
+        self.assertFalse(self.scheduler.cancel(handle))
+
+    def test_removal_from_middle_keeps_heap_order(self) -> None:
+        """Cancelling arbitrary tasks leaves a valid heap that pops in order."""
+        handles = [
+            self.scheduler.schedule_recurring(coroutine=self._noop, interval=float((i * 37) % 101), priority=i % 91)
+            for i in range(200)
+        ]
+        for handle in handles[::3]:
+            self.scheduler.cancel(handle)
+            self._assert_heap_consistent()
+
+        popped = []
+        while len(self.scheduler.ready_queue):
+            popped.append(self.scheduler.ready_queue.pop())
+        self.assertEqual(len(popped), 200 - len(handles[::3]))
+        for earlier, later in zip(popped, popped[1:], strict=False):
+            self.assertFalse(later < earlier)
+
+    def test_task_cancelled_while_running_is_not_requeued(self) -> None:
+        """Cancelling a task mid-run retires it instead of rescheduling it."""
+        holder: dict[str, TaskHandle] = {}
+
+        async def cancel_self() -> None:
+            self.scheduler.cancel(holder["handle"])
+
+        holder["handle"] = self.scheduler.schedule_periodic(coroutine=cancel_self, period=1.0, name="Portal Slice")
+        task = self.scheduler.ready_queue.pop()
+
+        asyncio.run(self.scheduler._run_task(task))
+
+        self.assertEqual(len(self.scheduler.ready_queue), 0)
+        self.assertNotIn(task.task_id, self.scheduler.task_registry)
+
+    def test_stress_schedule_and_cancel_10000(self) -> None:
+        """10,000 schedule/cancel pairs keep the heap bounded and stay fast."""
+        resident = [
+            self.scheduler.schedule_periodic(coroutine=self._noop, period=0.04 * (i + 1), name=f"Resident {i}")
+            for i in range(20)
+        ]
+        baseline = len(self.scheduler.ready_queue)
+
+        start = time.perf_counter()
+        for i in range(10000):
+            handle = self.scheduler.schedule_recurring(coroutine=self._noop, interval=300.0 + i, name="Transient")
+            self.scheduler.cancel(handle)
+        elapsed = time.perf_counter() - start
+        ops_per_sec = 20000 / elapsed
+
+        # Previously every cancelled entry stayed queued until it reached the top
+        self.assertEqual(len(self.scheduler.ready_queue), baseline)
+        self.assertEqual(len(self.scheduler.task_registry), len(resident))
+        self._assert_heap_consistent()
+        self.assertGreater(ops_per_sec, 2000)
+
+
+class TestStarvation(TestCase):
+    """Tests for deadline-ordered fairness and pop-time starvation detection."""
+
+    def setUp(self) -> None:
+        self.scheduler = _fresh_scheduler()
+        self._level = patch("core.logging_helper._log_level", 60)
+        self._level.start()
+
+    def tearDown(self) -> None:
+        self._level.stop()
+
+    def test_low_priority_task_runs_behind_saturated_periodic(self) -> None:
+        """A priority-90 task still runs promptly while a priority-0 task is always due."""
+        busy_runs = [0]
+        ran_at: list[float] = []
+        due_at: list[float] = []
+
+        async def saturate() -> None:
+            busy_runs[0] += 1
+            time.sleep(0.006)  # Longer than the period, so the task is permanently behind
+
+        async def background() -> None:
+            ran_at.append(time.monotonic())
+
+        async def submit() -> None:
+            await Scheduler.sleep(0.05)
+            due_at.append(time.monotonic())
+            self.scheduler.schedule_now(coroutine=background, priority=90, name="Background")
+
+        self.scheduler.schedule_periodic(coroutine=saturate, period=0.002, priority=0, name="Saturated")
+        self.scheduler.schedule_now(coroutine=submit, priority=0, name="Submit")
+
+        _run_loop_for(self.scheduler, 0.3)
+
+        self.assertGreater(busy_runs[0], 10)
+        self.assertEqual(len(ran_at), 1)
+        # At most a couple of saturated runs can go first
+        self.assertLess(ran_at[0] - due_at[0], 0.05)
+
+    def test_long_wait_is_counted_at_pop(self) -> None:
+        """A task popped more than MAX_STARVATION_TIME after its due time is reported."""
+
+        async def noop() -> None:
+            pass
+
+        handle = self.scheduler.schedule_now(coroutine=noop, priority=90, name="Late")
+        task = self.scheduler.task_registry[handle.task_id]
+        assert task.next_run_time is not None
+        task.next_run_time -= Scheduler.MAX_STARVATION_TIME + 5
+
+        _run_loop_for(self.scheduler, 0.05)
+
+        self.assertEqual(self.scheduler.total_tasks_starved, 1)
+        self.assertEqual(self.scheduler.dump_state()["tasks_starved"], 1)
+
+    def test_dump_state_reports_ready_since_for_overdue_tasks(self) -> None:
+        """ready_since is derived from the due time instead of being tracked by a scan."""
+
+        async def noop() -> None:
+            pass
+
+        self.scheduler.schedule_now(coroutine=noop, name="Due")
+        future = self.scheduler.schedule_recurring(coroutine=noop, interval=300.0, name="Future")
+        self.scheduler.task_registry[future.task_id].next_run_time = time.monotonic() + 300.0
+
+        by_name = {t["name"]: t for t in self.scheduler.dump_state()["queued_tasks"]}
+        self.assertIsNotNone(by_name["Due"]["ready_since"])
+        self.assertIsNone(by_name["Future"]["ready_since"])
+
+    def test_no_periodic_scan_with_500_live_tasks(self) -> None:
+        """Dispatch cost with 500 queued tasks stays logarithmic; there is no O(n) pass."""
+
+        async def noop() -> None:
+            pass
+
+        for i in range(500):
+            self.scheduler.schedule_recurring(coroutine=noop, interval=60.0 + i, priority=i % 91)
+        self.assertFalse(hasattr(self.scheduler, "_apply_starvation_prevention"))
+
+        # Pop and re-queue the head, as the loop does for every dispatch
+        queue = self.scheduler.ready_queue
+        start = time.perf_counter()
+        for _ in range(2000):
+            task = queue.pop()
+            task.next_run_time += 1000.0
+            queue.push(task)
+        per_dispatch = (time.perf_counter() - start) / 2000
+
+        self.assertEqual(len(queue), 500)
+        self.assertLess(per_dispatch, 0.001)
+
+
+class TestResidentPeriodic(TestCase):
+    """Tests for periodic tasks driven by one long-lived coroutine."""
+
+    def setUp(self) -> None:
+        self.scheduler = _fresh_scheduler()
+        self._level = patch("core.logging_helper._log_level", 60)
+        self._level.start()
+
+    def tearDown(self) -> None:
+        self._level.stop()
+
+    def test_resident_task_keeps_rate_and_timing_stats(self) -> None:
+        """A resident 100Hz task runs at full rate and records lateness/duration per run."""
+
+        async def sample() -> None:
+            pass
+
+        handle = self.scheduler.schedule_periodic(coroutine=sample, period=0.01, name="Button Monitor", resident=True)
+        task = self.scheduler.task_registry[handle.task_id]
+
+        _run_loop_for(self.scheduler, 0.3)
+
+        self.assertGreater(task.execution_count, 20)
+        self.assertEqual(task.lateness.count, task.execution_count)
+        self.assertEqual(task.duration.count, task.execution_count)
+        self.assertEqual([t["name"] for t in self.scheduler.dump_state()["resident_tasks"]], ["Button Monitor"])
+
+    def test_resident_task_uses_one_asyncio_task(self) -> None:
+        """Only the first run is dispatched; later runs reuse the same coroutine."""
+        created: list[Any] = []
+        real_create_task = asyncio.create_task
+
+        def counting_create_task(coro: Any) -> Any:
+            created.append(coro)
+            return real_create_task(coro)
+
+        async def frame() -> None:
+            pass
+
+        dispatched = self.scheduler.schedule_periodic(coroutine=frame, period=0.01, name="Dispatched")
+        resident = self.scheduler.schedule_periodic(coroutine=frame, period=0.01, name="Resident", resident=True)
+
+        with patch.object(asyncio, "create_task", counting_create_task):
+            _run_loop_for(self.scheduler, 0.2)
+
+        dispatched_runs = self.scheduler.task_registry[dispatched.task_id].execution_count
+        resident_runs = self.scheduler.task_registry[resident.task_id].execution_count
+        self.assertGreater(resident_runs, 10)
+        # One per dispatched run, one for the resident task, one for the stop task
+        self.assertEqual(len(created), dispatched_runs + 2)
+
+    def test_cancel_stops_resident_task_before_next_run(self) -> None:
+        """Cancelling a resident task between runs prevents any further runs."""
+        runs = [0]
+        holder: dict[str, TaskHandle] = {}
+
+        async def frame() -> None:
+            runs[0] += 1
+
+        async def cancel_later() -> None:
+            await Scheduler.sleep(0.1)
+            self.scheduler.cancel(holder["handle"])
+            runs.append(runs[0])  # Snapshot at cancel time
+
+        holder["handle"] = self.scheduler.schedule_periodic(
+            coroutine=frame, period=0.01, name="LED Animation", resident=True
+        )
+        self.scheduler.schedule_now(coroutine=cancel_later, name="Cancel")
+
+        _run_loop_for(self.scheduler, 0.3)
+
+        self.assertEqual(runs[0], runs[1])
+        self.assertNotIn(holder["handle"].task_id, self.scheduler.task_registry)
+        self.assertEqual(self.scheduler.dump_state()["resident_tasks"], [])
+
+    def test_resident_task_survives_non_fatal_errors(self) -> None:
+        """Errors are counted and the resident loop keeps going, like dispatched runs."""
+        runs = [0]
+
+        async def flaky() -> None:
+            runs[0] += 1
+            if runs[0] % 2:
+                raise TaskNonFatalError("glitch")
+
+        self.scheduler.schedule_periodic(coroutine=flaky, period=0.01, name="Flaky", resident=True)
+
+        _run_loop_for(self.scheduler, 0.2)
+
+        self.assertGreater(runs[0], 5)
+        self.assertEqual(self.scheduler.total_tasks_failed, (runs[0] + 1) // 2)
+
+    def test_fatal_error_in_resident_task_stops_loop(self) -> None:
+        """A fatal error from a resident task still reaches the event loop."""
+
+        async def fatal() -> None:
+            raise TaskFatalError("hardware gone")
+
+        self.scheduler.schedule_periodic(coroutine=fatal, period=0.01, name="Fatal", resident=True)
+
+        with self.assertRaises(TaskFatalError) as ctx:
+            asyncio.run(self.scheduler._event_loop())
+        self.assertEqual(str(ctx.exception), "hardware gone")
+
+
+def _allocated_bytes() -> int | None:
+    """Bytes currently allocated: gc.mem_alloc() on device, tracemalloc on desktop (None if tracing is off)."""
+    import gc
+
+    if hasattr(gc, "mem_alloc"):
+        return gc.mem_alloc()
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[0]
+
+
+class TestTaskFootprint(TestCase):
+    """Tests for slot-based tasks, small-int kinds and the precomputed sort key."""
+
+    async def _noop(self) -> None:
+        pass
+
+    def test_task_kind_is_small_int(self) -> None:
+        """Tasks store the kind as TaskType's int value and still expose the name."""
+        task = Task("Kind", 50, self._noop, TaskType.RECURRING, 1.0)
+        self.assertEqual(task.kind, TaskType.RECURRING.value)
+        self.assertEqual(task.task_type, "RECURRING")
+
+        by_name = Task("Named", 50, self._noop, "ONE_SHOT", 0)
+        self.assertEqual(by_name.kind, TaskType.ONE_SHOT.value)
+
+    def test_sort_key_follows_updates(self) -> None:
+        """Setting next_run_time refreshes the precomputed key."""
+        task = Task("Key", 50, self._noop, TaskType.ONE_SHOT, 0)
+        task.next_run_time = 10.0
+        self.assertEqual(task.sort_key, (10.0, 50, task.task_id))
+
+        task.next_run_time = None
+        self.assertEqual(task.sort_key[1:], (50, task.task_id))
+        self.assertLess(task.sort_key[0], -1e300)
+
+    def test_instances_have_no_dict(self) -> None:
+        """Task, TaskHandle and histograms are slot-based (where the runtime honours __slots__)."""
+        import sys
+
+        if sys.implementation.name != "cpython":
+            return  # MicroPython accepts __slots__ but keeps a per-instance map
+        task = Task("Slots", 50, self._noop, TaskType.PERIODIC, 1.0)
+        for obj in (task, TaskHandle(task.task_id), task.lateness):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+        with self.assertRaises(AttributeError):
+            setattr(task, "unexpected", True)  # noqa: B010 - a plain assignment trips pylint's slot check
+
+    def test_benchmark_heap_throughput_and_bytes_per_task(self) -> None:
+        """Push/pop 1000 tasks and measure allocation per task."""
+        import gc
+        import random
+
+        tracing = False
+        if not hasattr(gc, "mem_alloc"):
+            import tracemalloc
+
+            tracemalloc.start()
+            tracing = True
+        try:
+            gc.collect()
+            before = _allocated_bytes()
+            tasks = [Task("Bench", i % 91, self._noop, TaskType.PERIODIC, 1.0) for i in range(1000)]
+            after = _allocated_bytes()
+        finally:
+            if tracing:
+                tracemalloc.stop()
+        if before is not None and after is not None:
+            bytes_per_task = (after - before) / len(tasks)
+            self.assertLess(bytes_per_task, 1024)
+
+        rng = random.Random(1)
+        for task in tasks:
+            task.next_run_time = rng.random() * 100
+        heap = _MinHeap()
+        start = time.monotonic()
+        for task in tasks:
+            heap.push(task)
+        last = None
+        while len(heap):
+            task = heap.pop()
+            if last is not None:
+                self.assertFalse(task < last)
+            last = task
+        elapsed = time.monotonic() - start
+        self.assertGreater(2 * len(tasks) / max(elapsed, 1e-6), 1000)
+
+
+class TestOverrunPolicy(TestCase):
+    """Fault injection: block the loop for 500ms and check each overrun policy."""
+
+    PERIOD = 0.05
+
+    def setUp(self) -> None:
+        self.scheduler = _fresh_scheduler()
+        self._level = patch("core.logging_helper._log_level", 60)
+        self._level.start()
+
+    def tearDown(self) -> None:
+        self._level.stop()
+
+    def _run_with_stall(self, overrun: Any) -> tuple[Task, list[float], float]:
+        """Run a 20Hz task through a 500ms loop stall; return (task, run times, stall end)."""
+        runs: list[float] = []
+        stall_end: list[float] = []
+
+        async def frame() -> None:
+            runs.append(time.monotonic())
+
+        async def stall() -> None:
+            await Scheduler.sleep(0.12)
+            time.sleep(0.5)  # Blocks the whole loop, as a synchronous flash write or HTTP call would
+            stall_end.append(time.monotonic())
+
+        handle = self.scheduler.schedule_periodic(coroutine=frame, period=self.PERIOD, name="Frame", overrun=overrun)
+        task = self.scheduler.task_registry[handle.task_id]
+        self.scheduler.schedule_now(coroutine=stall, name="Stall")
+
+        _run_loop_for(self.scheduler, 0.9)
+
+        return task, runs, stall_end[0]
+
+    @staticmethod
+    def _burst(runs: list[float], stall_end: float) -> int:
+        """Runs that started within 30ms after the stall ended."""
+        return len([t for t in runs if stall_end <= t < stall_end + 0.03])
+
+    def test_skip_drops_missed_frames_and_keeps_grid(self) -> None:
+        """SKIP runs at most one late frame, counts the skipped periods and stays on the time grid."""
+        first_due = time.monotonic()
+        task, runs, stall_end = self._run_with_stall(OverrunPolicy.SKIP)
+
+        self.assertLessEqual(self._burst(runs, stall_end), 2)
+        self.assertGreaterEqual(task.skipped_runs, 7)
+        self.assertGreaterEqual(task.missed_deadlines, 1)
+        assert task.last_scheduled_time is not None
+        periods = (task.last_scheduled_time - first_due) / self.PERIOD
+        self.assertLess(abs(periods - round(periods)), 0.2)
+        self.assertEqual(self.scheduler.dump_state()["queued_tasks"][0]["skipped_runs"], task.skipped_runs)
+
+    def test_catch_up_runs_every_missed_period(self) -> None:
+        """CATCH_UP bursts through the missed periods and records each late run."""
+        task, runs, stall_end = self._run_with_stall(OverrunPolicy.CATCH_UP)
+
+        self.assertGreaterEqual(self._burst(runs, stall_end), 7)
+        self.assertEqual(task.skipped_runs, 0)
+        self.assertGreaterEqual(task.missed_deadlines, 7)
+
+    def test_drift_runs_immediately_then_restarts_period(self) -> None:
+        """DRIFT (default) runs right after the stall, then continues from there without a burst."""
+        task, runs, stall_end = self._run_with_stall(None)
+
+        self.assertEqual(task.overrun, OverrunPolicy.DRIFT.value)
+        self.assertLessEqual(self._burst(runs, stall_end), 2)
+        self.assertEqual(task.skipped_runs, 0)
+        self.assertGreaterEqual(task.missed_deadlines, 1)
+        self.assertEqual(self.scheduler.dump_state()["queued_tasks"][0]["missed_deadlines"], task.missed_deadlines)
+
+    def test_explicit_deadline_overrides_period(self) -> None:
+        """A run that finishes within the period but after an explicit deadline is counted."""
+
+        async def slow() -> None:
+            time.sleep(0.02)
+
+        handle = self.scheduler.schedule_periodic(coroutine=slow, period=1.0, name="Slow", deadline=0.01)
+        task = self.scheduler.task_registry[handle.task_id]
+        self.scheduler.ready_queue.pop()
+
+        asyncio.run(self.scheduler._run_task(task))
+
+        self.assertEqual(task.missed_deadlines, 1)
+
+
 # Entry point for running tests
 if __name__ == "__main__":
     import unittest
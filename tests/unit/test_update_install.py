@@ -2,16 +2,28 @@
 Unit tests for update installation utilities.
 
 Tests the public API of utils.update_install module (process_pending_update).
-Private helpers are tested indirectly through the public API.
+Private helpers are tested indirectly through the public API, apart from the
+desktop benchmark of _move_directory_contents and the skip-unchanged install
+helpers, which run on a real directory tree.
 """
 
 import contextlib
+import hashlib
+import os
+import shutil
 import sys
+import tempfile
+import time
+import tracemalloc
 from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, "src")
 
+from core.app_typing import Any
+from managers.weather_manager import WeatherManager
+from services.weather_service import WeatherService
 from tests.unit import TestCase
+from utils import recovery, update_install
 from utils.update_install import PRESERVED_FILES
 
 
@@ -26,14 +38,27 @@ class TestPreservedFiles(TestCase):
         """incompatible_releases.json should be preserved."""
         self.assertIn("incompatible_releases.json", PRESERVED_FILES)
 
+    def test_preserved_files_includes_rotated_boot_log(self) -> None:
+        """Both halves of the rotated boot log must be preserved."""
+        self.assertIn("boot_log.txt", PRESERVED_FILES)
+        self.assertIn("boot_log.txt.1", PRESERVED_FILES)
+
+    def test_preserved_files_includes_geocode_cache(self) -> None:
+        """The geocode cache must survive updates so the lookup is not repeated."""
+        self.assertIn(WeatherService.LOCATION_CACHE_FILE.lstrip("/"), PRESERVED_FILES)
+
+    def test_preserved_files_includes_weather_cache(self) -> None:
+        """The weather cache must survive updates so the first boot after one has a color."""
+        self.assertIn(WeatherManager.CACHE_FILE.lstrip("/"), PRESERVED_FILES)
+
     def test_preserved_files_includes_development(self) -> None:
         """DEVELOPMENT flag should be preserved."""
         self.assertIn("DEVELOPMENT", PRESERVED_FILES)
 
     def test_preserved_files_is_minimal(self) -> None:
-        """Only user-provided data should be preserved."""
-        # Should have exactly 4 files
-        self.assertEqual(len(PRESERVED_FILES), 4)
+        """Only user-provided data, logs and caches should be preserved."""
+        # Should have exactly 7 files
+        self.assertEqual(len(PRESERVED_FILES), 7)
 
 
 class TestProcessPendingUpdate(TestCase):
@@ -384,6 +409,88 @@ class TestProcessPendingUpdate(TestCase):
         # Verify _delete_all_except WAS called for full release
         self._delete_all_except_mock.assert_called()
 
+    def test_release_with_file_hashes_skips_unchanged_files(self) -> None:
+        """A manifest "files" table replaces the full reset with a file-level one that skips identical files."""
+        from utils.update_install import process_pending_update
+
+        file_hashes = {"/boot.py": "aa", "/core/scheduler.mpy": "bb"}
+        self._setup_manifest_file({"version": "0.6.0", "files": file_hashes})
+        self._check_compat_mock.return_value = (True, None)
+        self._validate_files_mock.return_value = (True, [])
+        self._move_contents_mock.return_value = 0
+        unchanged = {"/pending_update/root/boot.py"}
+
+        with (
+            patch("utils.update_install._pop_installed_index", return_value={"/boot.py": "aa"}) as mock_pop,
+            patch("utils.update_install._unchanged_files", return_value=unchanged) as mock_unchanged,
+            patch("utils.update_install._remove_obsolete_files") as mock_remove_obsolete,
+            patch("utils.update_install._save_installed_index") as mock_save,
+            contextlib.suppress(SystemExit, Exception),
+        ):
+            process_pending_update()
+
+        mock_pop.assert_called_once_with("0.5.0")
+        mock_unchanged.assert_called_once_with("/pending_update/root", file_hashes, {"/boot.py": "aa"})
+        self._delete_all_except_mock.assert_not_called()
+        mock_remove_obsolete.assert_called_once()
+        self.assertEqual(mock_remove_obsolete.call_args.args[0], set(file_hashes))
+        self._move_contents_mock.assert_called_once_with("/pending_update/root", "/", unchanged)
+        mock_save.assert_called_once_with("0.6.0", file_hashes)
+
+    def test_installed_index_not_saved_after_failed_move(self) -> None:
+        """The hash index is only rewritten when every staged file was moved."""
+        from utils.update_install import process_pending_update
+
+        self._setup_manifest_file({"version": "0.6.0", "files": {"/boot.py": "aa"}})
+        self._check_compat_mock.return_value = (True, None)
+        self._validate_files_mock.return_value = (True, [])
+        self._move_contents_mock.return_value = 1
+
+        with (
+            patch("utils.update_install._pop_installed_index", return_value=None),
+            patch("utils.update_install._remove_obsolete_files"),
+            patch("utils.update_install._save_installed_index") as mock_save,
+            contextlib.suppress(SystemExit, Exception),
+        ):
+            process_pending_update()
+
+        self._move_contents_mock.assert_called_once()
+        mock_save.assert_not_called()
+
+    def test_delta_release_removes_listed_files_instead_of_full_reset(self) -> None:
+        """Delta releases keep installed files and only delete the ones the delta removed."""
+        from utils.update_install import process_pending_update
+
+        manifest = {"version": "0.6.0", "delta_from": "0.5.0"}
+        self._setup_manifest_file(manifest)
+        self._check_compat_mock.return_value = (True, None)
+        self._validate_files_mock.return_value = (True, [])
+        delta_index = {"delta_from": "0.5.0", "unchanged": {}, "patched": {}, "replaced": {}, "removed": ["/old.mpy"]}
+
+        with (
+            patch("utils.update_install.load_delta_index", return_value=delta_index),
+            contextlib.suppress(SystemExit, Exception),
+        ):
+            process_pending_update()
+
+        self._delete_all_except_mock.assert_not_called()
+        self._move_contents_mock.assert_called()
+        self._os_mock.remove.assert_any_call("/old.mpy")
+
+    def test_delta_for_other_base_version_aborts(self) -> None:
+        """A delta built against a different installed version is rejected."""
+        from utils.update_install import process_pending_update
+
+        self._setup_manifest_file({"version": "0.6.0", "delta_from": "0.4.0"})
+        self._check_compat_mock.return_value = (True, None)
+
+        with patch("utils.update_install.load_delta_index", return_value={"delta_from": "0.4.0"}):
+            process_pending_update()
+
+        self._mark_incompat_mock.assert_called()
+        self._delete_all_except_mock.assert_not_called()
+        self._move_contents_mock.assert_not_called()
+
     def test_no_pending_update_exits_early(self) -> None:
         """When no pending update exists, process_pending_update exits early."""
         from utils.update_install import process_pending_update
@@ -426,7 +533,301 @@ class TestProcessPendingUpdate(TestCase):
         self._reset_mock.assert_not_called()
 
 
+class _NullLog:
+    """Logger stand-in that records nothing (keeps allocations out of the benchmark)."""
+
+    def info(self, _msg: str) -> None:
+        pass
+
+    error = critical = warning = debug = info
+
+
+class TestMoveDirectoryContentsBenchmark(TestCase):
+    """Desktop benchmark: promote a 200-file staged tree into the root."""
+
+    FILE_COUNT = 200
+    LARGE_FILE_SIZE = 128 * 1024  # e.g. the single-file web UI
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self._patches: list[Any] = [
+            patch("utils.update_install._boot_file_logger", _NullLog),
+            patch("utils.update_install._update_led", lambda indicate_error=False: None),
+        ]
+        for p in self._patches:
+            p.start()
+
+        self.tree: dict[str, bytes] = {"/www/index.html": bytes(i % 251 for i in range(self.LARGE_FILE_SIZE))}
+        for i in range(self.FILE_COUNT - 1):
+            self.tree[f"/pkg_{i % 10}/module_{i:03d}.mpy"] = bytes((i + j) % 251 for j in range(2048 + i * 8))
+
+    def tearDown(self) -> None:
+        for p in self._patches:
+            p.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _stage(self, name: str) -> tuple[str, str]:
+        staged = os.path.join(self.test_dir, name, "staged")
+        root = os.path.join(self.test_dir, name, "root")
+        for path, data in self.tree.items():
+            os.makedirs(os.path.dirname(staged + path), exist_ok=True)
+            with open(staged + path, "wb") as f:
+                f.write(data)
+        os.makedirs(root)
+        return staged, root
+
+    def _assert_promoted(self, staged: str, root: str) -> None:
+        tree = {}
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                with open(path, "rb") as f:
+                    tree[path[len(root) :]] = f.read()
+        self.assertEqual(tree, self.tree)
+        self.assertEqual(os.listdir(staged), [])
+
+    @staticmethod
+    def _legacy_move(src_dir: str, dest_dir: str) -> int:
+        """Previous behaviour: read every file fully into RAM and write it back out."""
+        copied = 0
+        for item in os.listdir(src_dir):
+            src_path, dest_path = f"{src_dir}/{item}", f"{dest_dir}/{item}"
+            if os.path.isdir(src_path):
+                with contextlib.suppress(OSError):
+                    os.mkdir(dest_path)
+                copied += TestMoveDirectoryContentsBenchmark._legacy_move(src_path, dest_path)
+                os.rmdir(src_path)
+                continue
+            with open(src_path, "rb") as src_file:
+                content = src_file.read()
+            with open(dest_path, "wb") as dest_file:
+                dest_file.write(content)
+            os.remove(src_path)
+            copied += len(content)
+        return copied
+
+    def _run(self, name: str, rename_fails: bool = False, legacy: bool = False) -> tuple[float, int, int]:
+        """Move one staged tree; return (seconds, bytes copied, peak traced bytes)."""
+        staged, root = self._stage(name)
+        copied = 0
+        copy_file = update_install.copy_file
+
+        def counting_copy_file(src_path: str, dst_path: str, buffer: bytearray | None = None) -> int:
+            nonlocal copied
+            n = copy_file(src_path, dst_path, buffer)
+            copied += n
+            return n
+
+        def cross_device_rename(src: str, dst: str) -> None:
+            raise OSError(18, "Invalid cross-device link")
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(patch.object(update_install, "copy_file", counting_copy_file))
+            if rename_fails:
+                stack.enter_context(patch("os.rename", cross_device_rename))
+            tracemalloc.start()
+            start = time.perf_counter()
+            if legacy:
+                copied = self._legacy_move(staged, root)
+            else:
+                self.assertEqual(update_install._move_directory_contents(staged, root), 0)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self._assert_promoted(staged, root)
+        return elapsed, copied, peak
+
+    def test_benchmark_200_file_tree(self) -> None:
+        """Renames copy nothing; the copy fallback streams through one small buffer."""
+        total_bytes = sum(len(data) for data in self.tree.values())
+
+        legacy_time, legacy_copied, legacy_peak = self._run("legacy", legacy=True)
+        rename_time, rename_copied, rename_peak = self._run("rename")
+        _, fallback_copied, fallback_peak = self._run("fallback", rename_fails=True)
+
+        self.assertEqual(legacy_copied, total_bytes)
+        self.assertGreaterEqual(legacy_peak, self.LARGE_FILE_SIZE)
+
+        self.assertEqual(rename_copied, 0)
+        self.assertLess(rename_time, legacy_time)
+        self.assertLess(rename_peak, self.LARGE_FILE_SIZE // 4)
+
+        self.assertEqual(fallback_copied, total_bytes)
+        self.assertLess(fallback_peak, self.LARGE_FILE_SIZE // 4)
+
+
 if __name__ == "__main__":
     import unittest
 
     unittest.main()
+
+
+def _module_bytes(index: int, revision: int = 0) -> bytes:
+    """Deterministic stand-in for a compiled module."""
+    return bytes((index * 31 + revision * 7 + i) % 251 for i in range(512))
+
+
+class TestSkipUnchangedInstall(TestCase):
+    """Count flash writes when installing a patch release over the previous one."""
+
+    MODULE_COUNT = 20
+
+    def setUp(self) -> None:
+        """Install the previous release and stage a patch release."""
+        self.test_dir = tempfile.mkdtemp()
+        self.root_dir = self.test_dir + "/root"
+        self.staged_dir = self.test_dir + "/staged"
+        self.index_path = self.test_dir + "/installed_files.json"
+
+        self.old_tree = {"/boot.py": b"import core.boot_support\n", "/manifest.json": b'{"version": "1.0.0"}'}
+        for i in range(self.MODULE_COUNT):
+            self.old_tree[f"/modules/module_{i:02d}.mpy"] = _module_bytes(i)
+        self.old_tree["/modules/retired.mpy"] = b"retired"
+
+        # Patch release: two modules rebuilt, one added, one dropped
+        self.new_tree = dict(self.old_tree)
+        del self.new_tree["/modules/retired.mpy"]
+        self.new_tree["/modules/module_03.mpy"] = _module_bytes(3, revision=1)
+        self.new_tree["/modules/module_11.mpy"] = _module_bytes(11, revision=1)
+        self.new_tree["/modules/added.mpy"] = b"added"
+        self.new_tree["/manifest.json"] = b'{"version": "1.0.1"}'
+
+        self._write_tree(self.root_dir, self.old_tree)
+        self._write_tree(self.staged_dir, self.new_tree)
+
+        # What builder.py records in the packaged manifest (manifest.json excluded)
+        self.file_hashes = self._hashes(self.new_tree)
+        self.old_hashes = self._hashes(self.old_tree)
+
+        # A file lands on flash either by rename or, as a fallback, by a copy
+        self.writes: list[str] = []
+        rename = os.rename
+        copy_file = update_install.copy_file
+
+        def counting_rename(src: str, dst: str) -> None:
+            self.writes.append(dst)
+            rename(src, dst)
+
+        def counting_copy_file(src_path: str, dst_path: str, buffer: bytearray | None = None) -> int:
+            self.writes.append(dst_path)
+            return copy_file(src_path, dst_path, buffer)
+
+        self._patches: list[Any] = [
+            patch.object(recovery, "hashlib", hashlib),
+            patch("utils.update_install._boot_file_logger", _NullLog),
+            patch("utils.update_install._update_led", lambda indicate_error=False: None),
+            patch("os.rename", counting_rename),
+            patch.object(update_install, "copy_file", counting_copy_file),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        for p in self._patches:
+            p.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write_tree(base_dir: str, tree: dict[str, bytes]) -> None:
+        for path, data in tree.items():
+            os.makedirs(os.path.dirname(base_dir + path), exist_ok=True)
+            with open(base_dir + path, "wb") as f:
+                f.write(data)
+
+    def _read_tree(self) -> dict[str, bytes]:
+        tree = {}
+        for dirpath, _, filenames in os.walk(self.root_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                with open(path, "rb") as f:
+                    tree[path[len(self.root_dir) :]] = f.read()
+        return tree
+
+    @staticmethod
+    def _hashes(tree: dict[str, bytes]) -> dict[str, str]:
+        return {path: hashlib.sha256(data).hexdigest() for path, data in tree.items() if path != "/manifest.json"}
+
+    def _cached_index(self) -> dict[str, list] | None:
+        """Save the index for the installed release, then load it as the next install would."""
+        update_install._save_installed_index("1.0.0", self.old_hashes, self.index_path, self.root_dir)
+        self.writes.clear()  # The index's own atomic rename is not an install write
+        return update_install._pop_installed_index("1.0.0", self.index_path)
+
+    def _install(self, unchanged: set[str] | None) -> int:
+        """Run the file-level reset and move the staged files into the test root."""
+        update_install._remove_obsolete_files(set(self.file_hashes), [], self.root_dir)
+        return update_install._move_directory_contents(self.staged_dir, self.root_dir, unchanged)
+
+    def test_patch_release_writes_only_changed_files(self) -> None:
+        """Without a cached index, installed files are hashed and only changed ones are written."""
+        unchanged = update_install._unchanged_files(self.staged_dir, self.file_hashes, None, self.root_dir)
+        failures = self._install(unchanged)
+
+        self.assertEqual(failures, 0)
+        # module_03, module_11, added.mpy, plus manifest.json which is always rewritten
+        self.assertEqual(len(self.writes), 4)
+        self.assertEqual(self._read_tree(), self.new_tree)
+
+    def test_cached_index_skips_unchanged_files(self) -> None:
+        """The cached hash index gives the same result without hashing installed files."""
+        installed_index = self._cached_index()
+        with patch.object(update_install, "file_sha256") as mock_hash:
+            unchanged = update_install._unchanged_files(
+                self.staged_dir, self.file_hashes, installed_index, self.root_dir
+            )
+        failures = self._install(unchanged)
+
+        mock_hash.assert_not_called()
+        self.assertEqual(failures, 0)
+        self.assertEqual(len(self.writes), 4)
+        self.assertEqual(self._read_tree(), self.new_tree)
+
+    def test_file_changed_since_index_is_rehashed(self) -> None:
+        """A file edited after the index was saved is hashed again and rewritten."""
+        installed_index = self._cached_index()
+        edited = self.root_dir + "/modules/module_05.mpy"
+        mtime = os.stat(edited).st_mtime + 10
+        with open(edited, "wb") as f:
+            f.write(_module_bytes(5, revision=2))  # Same size, different content
+        os.utime(edited, (mtime, mtime))
+
+        unchanged = update_install._unchanged_files(self.staged_dir, self.file_hashes, installed_index, self.root_dir)
+        failures = self._install(unchanged)
+
+        self.assertEqual(failures, 0)
+        self.assertNotIn(self.staged_dir + "/modules/module_05.mpy", unchanged)
+        self.assertEqual(len(self.writes), 5)
+        self.assertEqual(self._read_tree(), self.new_tree)
+
+    def test_full_reset_keeps_rotated_boot_log(self) -> None:
+        """The boot log and its rotated half survive the file-level reset."""
+        logs = {"/boot_log.txt": b"newer", "/boot_log.txt.1": b"older"}
+        self._write_tree(self.root_dir, logs)
+
+        update_install._remove_obsolete_files(
+            set(self.file_hashes), update_install._get_preserved_paths(), self.root_dir
+        )
+
+        for path, data in logs.items():
+            with open(self.root_dir + path, "rb") as f:
+                self.assertEqual(f.read(), data)
+
+    def test_without_hash_table_every_file_is_written(self) -> None:
+        """Baseline: moving without a hash table rewrites the whole release."""
+        failures = self._install(None)
+
+        self.assertEqual(failures, 0)
+        self.assertEqual(len(self.writes), len(self.new_tree))
+        self.assertEqual(self._read_tree(), self.new_tree)
+
+    def test_installed_index_round_trip(self) -> None:
+        """The index is returned once for its own version and deleted on read."""
+        update_install._save_installed_index("1.0.0", self.old_hashes, self.index_path, self.root_dir)
+        self.assertIsNone(update_install._pop_installed_index("0.9.0", self.index_path))
+
+        installed_index = self._cached_index()
+        self.assertIsNotNone(installed_index)
+        assert installed_index is not None
+        self.assertEqual({path: entry[0] for path, entry in installed_index.items()}, self.old_hashes)
+        self.assertIsNone(update_install._pop_installed_index("1.0.0", self.index_path))
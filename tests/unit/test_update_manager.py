@@ -1,7 +1,22 @@
+import asyncio
+import builtins
+import hashlib
+import http.client
+import http.server
+import io
+import json
 import os
+import random
+import shutil
+import tempfile
+import threading
+import zipfile
 from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
 
-from core.app_typing import cast
+import utils.recovery as recovery
+import utils.update_install as update_install
+from core.app_typing import Any, cast
 from managers.update_manager import UpdateManager
 from tests.unit import TestCase
 
@@ -543,3 +558,422 @@ class TestCheckForUpdates(TestCase):
             assert result is not None
             # Should pick newest eligible across prod+dev archive: 1.5.0 (production) over 1.4.0-b1 (development)
             self.assertEqual(result["version"], "1.5.0")
+
+
+class _PendingUpdateTestCase(TestCase):
+    """Redirects /pending_update into a temp directory and builds a test package."""
+
+    def setUp(self) -> None:
+        UpdateManager._instance = None
+        self.test_dir = tempfile.mkdtemp()
+        pending_dir = os.path.join(self.test_dir, "pending_update")
+        self._patches: list[Any] = [
+            patch.object(update_install, "PENDING_UPDATE_DIR", pending_dir),
+            patch.object(update_install, "PENDING_ROOT_DIR", f"{pending_dir}/root"),
+            patch.object(update_install, "PENDING_STAGING_DIR", f"{pending_dir}/.staging"),
+            patch.object(update_install, "READY_MARKER_FILE", f"{pending_dir}/.ready"),
+            patch("managers.update_manager.hashlib", hashlib),
+        ]
+        for p in self._patches:
+            p.start()
+        self.zip_path = f"{pending_dir}/update.zip"
+
+        # Stored payload larger than the central directory search window so a
+        # second full pass over the package is clearly visible in the read count
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("manifest.json", json.dumps({"version": "2.0.0", "script_only_release": True}))
+            zf.writestr("payload.bin", os.urandom(300 * 1024))
+        self.package = buffer.getvalue()
+        self.package_sha256 = hashlib.sha256(self.package).hexdigest()
+
+    def tearDown(self) -> None:
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+        UpdateManager._instance = None
+
+
+class TestDownloadUpdateStreamingHash(_PendingUpdateTestCase):
+    """Test that download_update verifies the checksum while streaming."""
+
+    def _make_manager(self) -> UpdateManager:
+        manager = cast(UpdateManager, UpdateManager.instance())
+        manager.pixel_controller = None
+
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Length": str(len(self.package))}
+        response.iter_content.return_value = [self.package[i : i + 2048] for i in range(0, len(self.package), 2048)]
+        session = MagicMock()
+        session.head.return_value.headers = {"Content-Length": str(len(self.package)), "ETag": '"v2"'}
+        session.get.return_value = response
+        manager.connection_manager = MagicMock()
+        manager.connection_manager.get_session.return_value = session
+        return manager
+
+    def _download_counting_reads(self, manager: UpdateManager, expected_checksum: str) -> tuple[tuple[bool, str], int]:
+        """Run download_update and count bytes read back from the package file."""
+        real_open = builtins.open
+        zip_path = self.zip_path
+        bytes_read = [0]
+
+        class _CountingFile:
+            def __init__(self, f: Any) -> None:
+                self._f = f
+
+            def read(self, *args: Any) -> Any:
+                data = self._f.read(*args)
+                bytes_read[0] += len(data)
+                return data
+
+            def __enter__(self) -> "_CountingFile":
+                self._f.__enter__()
+                return self
+
+            def __exit__(self, *args: Any) -> Any:
+                return self._f.__exit__(*args)
+
+            def __getattr__(self, name: str) -> Any:
+                return getattr(self._f, name)
+
+        def counting_open(path: Any, mode: str = "r", *args: Any, **kwargs: Any) -> Any:
+            f = real_open(path, mode, *args, **kwargs)
+            if path == zip_path and "r" in mode:
+                return _CountingFile(f)
+            return f
+
+        with patch("builtins.open", counting_open):
+            result = asyncio.run(
+                manager.download_update(zip_url="http://example.com/update.zip", expected_checksum=expected_checksum)
+            )
+        return result, bytes_read[0]
+
+    def test_package_read_at_most_once(self) -> None:
+        """Verification does not re-read the package; only extraction reads it."""
+        manager = self._make_manager()
+        (success, message), bytes_read = self._download_counting_reads(manager, self.package_sha256)
+
+        self.assertTrue(success, message)
+        # Extraction reads each member once plus the end-of-central-directory search window
+        self.assertLessEqual(bytes_read, len(self.package) + 65536)
+        self.assertTrue(os.path.exists(os.path.join(update_install.PENDING_ROOT_DIR, "manifest.json")))
+
+    def test_checksum_mismatch_fails_before_extraction(self) -> None:
+        """A digest mismatch at end-of-stream aborts without reading the package."""
+        manager = self._make_manager()
+        with patch.object(manager, "_record_failed_update"):
+            (success, message), bytes_read = self._download_counting_reads(manager, "0" * 64)
+
+        self.assertFalse(success)
+        self.assertIn("mismatch", message.lower())
+        self.assertEqual(bytes_read, 0)
+        self.assertFalse(os.path.exists(update_install.PENDING_UPDATE_DIR))
+
+
+class _HttpClientResponse:
+    """adafruit_requests-style response backed by http.client."""
+
+    def __init__(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        self._conn = conn
+        self._response = response
+        self.status_code = response.status
+        self.headers = dict(response.getheaders())
+
+    def iter_content(self, chunk_size: int) -> Any:
+        while True:
+            chunk = self._response.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        self._response.close()
+        self._conn.close()
+
+
+class _HttpClientSession:
+    """adafruit_requests-style session for talking to the local test server."""
+
+    def _request(self, method: str, url: str, headers: dict[str, str] | None) -> _HttpClientResponse:
+        parts = urlsplit(url)
+        conn = http.client.HTTPConnection(parts.hostname or "127.0.0.1", parts.port, timeout=5)
+        conn.request(method, parts.path, headers=headers or {})
+        return _HttpClientResponse(conn, conn.getresponse())
+
+    def head(self, url: str, headers: dict[str, str] | None = None) -> _HttpClientResponse:
+        return self._request("HEAD", url, headers)
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> _HttpClientResponse:
+        return self._request("GET", url, headers)
+
+
+class _FlakyPackageServer:
+    """
+    Local HTTP server for the package that drops connections at random offsets.
+
+    Each GET is cut short with probability drop_rate (after a random number of
+    body bytes) until max_drops connections have been dropped.
+    """
+
+    def __init__(self, package: bytes, honor_range: bool, drop_rate: float, max_drops: int, seed: int) -> None:
+        self.package = package
+        self.honor_range = honor_range
+        self.drop_rate = drop_rate
+        self.max_drops = max_drops
+        self.rng = random.Random(seed)
+        self.etag = '"pkg-1"'
+        self.drops = 0
+        self.body_bytes_sent = 0
+        self.request_headers: list[dict[str, str]] = []
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send_headers(self, status: int, length: int, content_range: str | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", str(length))
+                self.send_header("ETag", server.etag)
+                if server.honor_range:
+                    self.send_header("Accept-Ranges", "bytes")
+                if content_range:
+                    self.send_header("Content-Range", content_range)
+                self.end_headers()
+
+            def do_HEAD(self) -> None:
+                self._send_headers(200, len(server.package))
+
+            def do_GET(self) -> None:
+                server.request_headers.append(dict(self.headers.items()))
+                total = len(server.package)
+                start = 0
+                range_header = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                if server.honor_range and range_header and if_range in (None, server.etag):
+                    start = int(range_header.split("=")[1].rstrip("-"))
+                    self._send_headers(206, total - start, f"bytes {start}-{total - 1}/{total}")
+                else:
+                    self._send_headers(200, total)
+
+                body = server.package[start:]
+                if server.drops < server.max_drops and server.rng.random() < server.drop_rate:
+                    server.drops += 1
+                    body = body[: server.rng.randrange(1, len(body))]
+                    self.close_connection = True
+                self.wfile.write(body)
+                server.body_bytes_sent += len(body)
+
+        self._httpd = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/update.zip"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+
+class TestDownloadUpdateResume(_PendingUpdateTestCase):
+    """Test that interrupted downloads resume with HTTP Range requests."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._servers: list[_FlakyPackageServer] = []
+
+    def tearDown(self) -> None:
+        for server in self._servers:
+            server.close()
+        super().tearDown()
+
+    def _serve(self, honor_range: bool = True, drop_rate: float = 0.8, max_drops: int = 6) -> _FlakyPackageServer:
+        server = _FlakyPackageServer(self.package, honor_range, drop_rate, max_drops, seed=21)
+        self._servers.append(server)
+        return server
+
+    def _make_manager(self) -> UpdateManager:
+        manager = cast(UpdateManager, UpdateManager.instance())
+        manager.pixel_controller = None
+        manager.connection_manager = MagicMock()
+        manager.connection_manager.get_session.return_value = _HttpClientSession()
+        return manager
+
+    def _download(self, manager: UpdateManager, url: str) -> tuple[bool, str]:
+        return asyncio.run(manager.download_update(zip_url=url, expected_checksum=self.package_sha256))
+
+    def _download_until_complete(self, server: _FlakyPackageServer, max_attempts: int = 20) -> int:
+        """Retry download_update until it succeeds, returning the number of attempts."""
+        manager = self._make_manager()
+        with patch.object(manager, "_record_failed_update") as mock_record:
+            for attempt in range(1, max_attempts + 1):
+                success, message = self._download(manager, server.url)
+                if success:
+                    mock_record.assert_not_called()
+                    return attempt
+                self.assertIn("interrupted", message.lower())
+        self.fail(f"Download did not complete in {max_attempts} attempts")
+
+    def test_resume_transfers_each_byte_about_once(self) -> None:
+        """Dropped transfers resume where they stopped instead of restarting at byte zero."""
+        server = self._serve()
+        attempts = self._download_until_complete(server)
+
+        self.assertGreater(server.drops, 0)
+        self.assertEqual(attempts, server.drops + 1)
+        # Only the partial chunk in flight at each drop is fetched twice
+        self.assertLess(server.body_bytes_sent, len(self.package) + server.drops * 2048)
+        self.assertTrue(all("Range" in headers for headers in server.request_headers[1:]))
+        self.assertTrue(os.path.exists(os.path.join(update_install.PENDING_ROOT_DIR, "manifest.json")))
+        self.assertFalse(os.path.exists(f"{self.zip_path}.journal"))
+
+    def test_resume_transfers_fewer_bytes_than_restarting(self) -> None:
+        """The same drop pattern costs far more when the server ignores Range."""
+        resuming = self._serve(honor_range=True)
+        self._download_until_complete(resuming)
+        shutil.rmtree(update_install.PENDING_UPDATE_DIR)
+
+        restarting = self._serve(honor_range=False)
+        self._download_until_complete(restarting)
+
+        self.assertEqual(resuming.drops, restarting.drops)
+        self.assertGreater(restarting.body_bytes_sent, resuming.body_bytes_sent + len(self.package) // 2)
+        self.assertTrue(os.path.exists(os.path.join(update_install.PENDING_ROOT_DIR, "manifest.json")))
+
+    def test_changed_etag_restarts_from_zero(self) -> None:
+        """A partial download is discarded when the server's ETag no longer matches."""
+        server = self._serve(drop_rate=1.0, max_drops=1)
+        manager = self._make_manager()
+        with patch.object(manager, "_record_failed_update"):
+            success, _ = self._download(manager, server.url)
+            self.assertFalse(success)
+            self.assertTrue(os.path.exists(f"{self.zip_path}.journal"))
+
+            server.etag = '"pkg-2"'
+            success, message = self._download(manager, server.url)
+
+        self.assertTrue(success, message)
+        self.assertNotIn("Range", server.request_headers[-1])
+
+
+class TestDownloadUpdateDelta(_PendingUpdateTestCase):
+    """Test that download_update prefers a delta package and falls back to the full one."""
+
+    FULL_URL = "http://example.com/v2.0.0"
+    DELTA_URL = "http://example.com/v2.0.0/wicid_delta.zip"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._patches.append(patch.object(recovery, "hashlib", hashlib))
+        self._patches.append(patch.dict(os.environ, {"VERSION": "1.0.0"}))
+        for p in self._patches[-2:]:
+            p.start()
+
+    def _delta_package(self, unchanged: dict[str, str]) -> bytes:
+        payload = b"changed module"
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr(
+                "manifest.json", json.dumps({"version": "2.0.0", "script_only_release": True, "delta_from": "1.0.0"})
+            )
+            delta_index = {
+                "delta_from": "1.0.0",
+                "unchanged": unchanged,
+                "patched": {},
+                "replaced": {"/payload.bin": hashlib.sha256(payload).hexdigest()},
+                "removed": [],
+            }
+            zf.writestr(update_install.DELTA_INDEX_FILE, json.dumps(delta_index))
+            zf.writestr("payload.bin", payload)
+        return buffer.getvalue()
+
+    def _make_manager(
+        self, delta_package: bytes, delta_status: int = 200, delta_sha256: str | None = None
+    ) -> tuple[UpdateManager, MagicMock]:
+        manager = cast(UpdateManager, UpdateManager.instance())
+        manager.pixel_controller = None
+        packages = {self.FULL_URL: self.package, self.DELTA_URL: delta_package}
+        statuses = {self.FULL_URL: 200, self.DELTA_URL: delta_status}
+
+        def get(url: str, headers: dict[str, str] | None = None) -> MagicMock:
+            data = packages[url]
+            response = MagicMock()
+            response.status_code = statuses[url]
+            response.headers = {"Content-Length": str(len(data))}
+            response.iter_content.return_value = [data[i : i + 2048] for i in range(0, len(data), 2048)]
+            return response
+
+        session = MagicMock()
+        session.head.return_value.headers = {}
+        session.get.side_effect = get
+        manager.connection_manager = MagicMock()
+        manager.connection_manager.get_session.return_value = session
+        manager._cached_update_info = {
+            "version": "2.0.0",
+            "zip_url": self.FULL_URL,
+            "sha256": self.package_sha256,
+            "delta_from": "1.0.0",
+            "delta_url": self.DELTA_URL,
+            "delta_sha256": delta_sha256 or hashlib.sha256(delta_package).hexdigest(),
+        }
+        return manager, session
+
+    def _requested_urls(self, session: MagicMock) -> list[str]:
+        return [call.args[0] for call in session.get.call_args_list]
+
+    def test_delta_package_used_when_base_matches(self) -> None:
+        """Devices on delta_from download only the delta package."""
+        manager, session = self._make_manager(self._delta_package(unchanged={}))
+        with patch.object(manager, "_record_failed_update") as mock_record:
+            success, message = asyncio.run(manager.download_update())
+
+        self.assertTrue(success, message)
+        mock_record.assert_not_called()
+        self.assertEqual(self._requested_urls(session), [self.DELTA_URL])
+        with open(os.path.join(update_install.PENDING_ROOT_DIR, "payload.bin"), "rb") as f:
+            self.assertEqual(f.read(), b"changed module")
+
+    def test_base_mismatch_falls_back_to_full_package(self) -> None:
+        """A delta whose base files do not match is dropped in favour of the full package."""
+        delta_package = self._delta_package(unchanged={"/missing/module.mpy": "0" * 64})
+        manager, session = self._make_manager(delta_package)
+        with patch.object(manager, "_record_failed_update") as mock_record:
+            success, message = asyncio.run(manager.download_update())
+
+        self.assertTrue(success, message)
+        mock_record.assert_not_called()
+        self.assertEqual(self._requested_urls(session), [self.DELTA_URL, self.FULL_URL])
+        self.assertFalse(os.path.exists(os.path.join(update_install.PENDING_ROOT_DIR, update_install.DELTA_INDEX_FILE)))
+
+    def test_missing_delta_asset_falls_back_without_hashing(self) -> None:
+        """A 404 for the delta is a quiet fallback, not a checksum failure."""
+        manager, session = self._make_manager(b"<html>Not Found</html>", delta_status=404)
+        with (
+            patch.object(manager, "_record_failed_update") as mock_record,
+            patch.object(manager, "logger") as mock_logger,
+        ):
+            success, message = asyncio.run(manager.download_update())
+
+        self.assertTrue(success, message)
+        mock_record.assert_not_called()
+        mock_logger.critical.assert_not_called()
+        mock_logger.error.assert_not_called()
+        self.assertEqual(self._requested_urls(session), [self.DELTA_URL, self.FULL_URL])
+
+    def test_delta_checksum_mismatch_falls_back_with_warning(self) -> None:
+        """A corrupt delta is reported as a warning before the full package is fetched."""
+        manager, session = self._make_manager(self._delta_package(unchanged={}), delta_sha256="0" * 64)
+        with (
+            patch.object(manager, "_record_failed_update") as mock_record,
+            patch.object(manager, "logger") as mock_logger,
+        ):
+            success, message = asyncio.run(manager.download_update())
+
+        self.assertTrue(success, message)
+        mock_record.assert_not_called()
+        mock_logger.critical.assert_not_called()
+        warnings = [call.args[0] for call in mock_logger.warning.call_args_list]
+        self.assertTrue(any("Delta package failed verification" in w for w in warnings), warnings)
+        self.assertEqual(self._requested_urls(session), [self.DELTA_URL, self.FULL_URL])
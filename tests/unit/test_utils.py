@@ -6,10 +6,23 @@ Tests verify:
 - Version comparison
 - OS version matching
 - Release compatibility checking
+- Atomic JSON persistence
 """
 
+import os
+import shutil
+import tempfile
+
 from tests.unit import TestCase
-from utils.utils import check_release_compatibility, compare_versions, os_matches_target, suppress
+from utils.utils import (
+    check_release_compatibility,
+    compare_versions,
+    copy_file,
+    os_matches_target,
+    read_json,
+    suppress,
+    write_json_atomic,
+)
 
 
 class TestSuppress(TestCase):
@@ -464,3 +477,65 @@ class TestIsReleaseIncompatible(TestCase):
         with patch("builtins.open", side_effect=OSError("missing")):
             is_incompat, reason, attempts = is_release_incompatible("2.0.0")
             self.assertFalse(is_incompat)
+
+
+class TestAtomicJson(TestCase):
+    """Test write_json_atomic() and read_json()."""
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "data.json")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_round_trip_replaces_existing_file(self) -> None:
+        """Writing over an existing file replaces it and leaves no temp file."""
+        write_json_atomic(self.path, {"a": 1})
+        write_json_atomic(self.path, {"a": 2})
+
+        self.assertEqual(read_json(self.path), {"a": 2})
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_read_falls_back_to_temp_file(self) -> None:
+        """A completed temp file is used when power was lost before the rename."""
+        with open(self.path + ".tmp", "w") as f:
+            f.write('{"a": 3}')
+
+        self.assertEqual(read_json(self.path), {"a": 3})
+
+    def test_read_missing_or_corrupt_returns_none(self) -> None:
+        """Missing or truncated files read as None."""
+        self.assertIsNone(read_json(self.path))
+        with open(self.path, "w") as f:
+            f.write('{"a": ')
+        self.assertIsNone(read_json(self.path))
+
+
+class TestCopyFile(TestCase):
+    """Test copy_file()."""
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.test_dir, "src.bin")
+        self.dst = os.path.join(self.test_dir, "dst.bin")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_copies_in_buffer_sized_chunks(self) -> None:
+        """Files larger than the buffer are copied whole and overwrite the destination."""
+        data = bytes(i % 251 for i in range(10_000))
+        with open(self.src, "wb") as f:
+            f.write(data)
+        with open(self.dst, "wb") as f:
+            f.write(b"stale contents that are longer than nothing")
+
+        self.assertEqual(copy_file(self.src, self.dst, bytearray(64)), len(data))
+        with open(self.dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_missing_source_raises(self) -> None:
+        """A missing source raises OSError."""
+        with self.assertRaises(OSError):
+            copy_file(self.src, self.dst)
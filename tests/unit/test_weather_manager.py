@@ -6,8 +6,15 @@ and error handling.
 """
 
 import asyncio
+import json
+import os
 import sys
-from unittest.mock import MagicMock
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
 
 from tests.unit import TestCase
 from tests.unit.unit_mocks import MockConnectionManager, MockWeatherService, reset_all_mocks
@@ -18,7 +25,29 @@ mock_cm_module = type(sys)("managers.connection_manager")
 mock_cm_module.ConnectionManager = MockConnectionManager  # type: ignore[attr-defined]
 sys.modules["managers.connection_manager"] = mock_cm_module
 
+from core.app_typing import Any  # noqa: E402
 from managers.weather_manager import WeatherManager  # noqa: E402
+from services.weather_service import WeatherService  # noqa: E402
+
+
+class _IsolatedCacheTestCase(TestCase):
+    """TestCase that keeps the weather snapshot and geocode caches in a per-test temp dir."""
+
+    def setUp(self) -> None:
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._cache_patches: list[Any] = [
+            patch.object(WeatherManager, "CACHE_FILE", os.path.join(self._cache_dir.name, "weather_cache.json")),
+            patch.object(
+                WeatherService, "LOCATION_CACHE_FILE", os.path.join(self._cache_dir.name, "geocode_cache.json")
+            ),
+        ]
+        for cache_patch in self._cache_patches:
+            cache_patch.start()
+
+    def tearDown(self) -> None:
+        for cache_patch in self._cache_patches:
+            cache_patch.stop()
+        self._cache_dir.cleanup()
 
 
 def run_async(coro):  # type: ignore[no-untyped-def]
@@ -26,11 +55,12 @@ def run_async(coro):  # type: ignore[no-untyped-def]
     return asyncio.run(coro)
 
 
-class TestWeatherManagerCachedData(TestCase):
+class TestWeatherManagerCachedData(_IsolatedCacheTestCase):
     """Test cached weather data access."""
 
     def setUp(self) -> None:
         """Reset mocks and manager."""
+        super().setUp()
         reset_all_mocks()
         WeatherManager._instance = None
         MockConnectionManager.set_test_instance(MockConnectionManager())
@@ -41,13 +71,14 @@ class TestWeatherManagerCachedData(TestCase):
             WeatherManager._instance.shutdown()
             WeatherManager._instance = None
         reset_all_mocks()
+        super().tearDown()
 
     def test_initial_cached_values_are_none(self) -> None:
         """All cached values are None before first update."""
         manager = WeatherManager.instance()
 
         self.assertIsNone(manager.get_current_temperature())
-        self.assertIsNone(manager.get_daily_high())
+        self.assertIsNone(manager._daily_high)
         self.assertIsNone(manager.get_precip_chance())
 
     def test_cached_getters_return_stored_values(self) -> None:
@@ -60,15 +91,16 @@ class TestWeatherManagerCachedData(TestCase):
         manager._precip_chance = 30
 
         self.assertEqual(manager.get_current_temperature(), 72.5)
-        self.assertEqual(manager.get_daily_high(), 85.0)
+        self.assertEqual(manager._daily_high, 85.0)
         self.assertEqual(manager.get_precip_chance(), 30)
 
 
-class TestWeatherManagerSingleton(TestCase):
+class TestWeatherManagerSingleton(_IsolatedCacheTestCase):
     """Test singleton and compatibility behavior."""
 
     def setUp(self) -> None:
         """Reset mocks and manager."""
+        super().setUp()
         reset_all_mocks()
         WeatherManager._instance = None
         MockConnectionManager.set_test_instance(MockConnectionManager())
@@ -79,6 +111,7 @@ class TestWeatherManagerSingleton(TestCase):
             WeatherManager._instance.shutdown()
             WeatherManager._instance = None
         reset_all_mocks()
+        super().tearDown()
 
     def test_instance_returns_same_object(self) -> None:
         """Multiple instance() calls return same object."""
@@ -97,11 +130,12 @@ class TestWeatherManagerSingleton(TestCase):
         self.assertEqual(manager2._init_weather_zip, "90210")
 
 
-class TestWeatherManagerShutdown(TestCase):
+class TestWeatherManagerShutdown(_IsolatedCacheTestCase):
     """Test shutdown behavior."""
 
     def setUp(self) -> None:
         """Reset mocks and manager."""
+        super().setUp()
         reset_all_mocks()
         WeatherManager._instance = None
         MockConnectionManager.set_test_instance(MockConnectionManager())
@@ -112,6 +146,7 @@ class TestWeatherManagerShutdown(TestCase):
             WeatherManager._instance.shutdown()
             WeatherManager._instance = None
         reset_all_mocks()
+        super().tearDown()
 
     def test_shutdown_clears_references(self) -> None:
         """Shutdown clears weather service and cached data."""
@@ -136,11 +171,12 @@ class TestWeatherManagerShutdown(TestCase):
         manager.shutdown()  # Should not raise
 
 
-class TestWeatherManagerUpdate(TestCase):
+class TestWeatherManagerUpdate(_IsolatedCacheTestCase):
     """Test weather update logic."""
 
     def setUp(self) -> None:
         """Reset mocks and manager."""
+        super().setUp()
         reset_all_mocks()
         WeatherManager._instance = None
         MockConnectionManager.set_test_instance(MockConnectionManager())
@@ -151,6 +187,7 @@ class TestWeatherManagerUpdate(TestCase):
             WeatherManager._instance.shutdown()
             WeatherManager._instance = None
         reset_all_mocks()
+        super().tearDown()
 
     def test_update_skips_when_service_none(self) -> None:
         """Update does nothing when weather service not initialized."""
@@ -208,3 +245,237 @@ class TestWeatherManagerUpdate(TestCase):
             # MemoryError from service gets wrapped as TaskNonFatalError
             # (the outer MemoryError handler only catches direct MemoryErrors)
             self.assertEqual(type(e).__name__, "TaskNonFatalError")
+
+
+class _ForecastStubHandler(BaseHTTPRequestHandler):
+    """Local Open-Meteo stand-in that adds fixed latency to every request."""
+
+    LATENCY = 0.03  # seconds, stands in for TLS handshake + round trip
+    request_paths: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        _ForecastStubHandler.request_paths.append(self.path)
+        time.sleep(self.LATENCY)
+        body = json.dumps(
+            {
+                "current_weather": {"temperature": 68.0, "time": "2025-02-06T14:15"},
+                "daily": {"temperature_2m_max": [77.0]},
+                "hourly": {
+                    "time": ["2025-02-06T14:00", "2025-02-06T15:00", "2025-02-06T16:00", "2025-02-06T17:00"],
+                    "precipitation_probability": [5, 15, 45, 25],
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _StubResponse:
+    def __init__(self, raw: Any) -> None:
+        self._raw = raw
+
+    def json(self) -> Any:
+        return json.loads(self._raw.read())
+
+    def close(self) -> None:
+        self._raw.close()
+
+
+class _StubSession:
+    """Session that redirects Open-Meteo requests to the local stub server."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    def get(self, url: str, **kwargs: Any) -> _StubResponse:
+        local_url = url.replace("https://api.open-meteo.com", self.base_url)
+        return _StubResponse(urllib.request.urlopen(local_url, timeout=5))
+
+
+class TestWeatherManagerCombinedRequest(_IsolatedCacheTestCase):
+    """Test that each refresh costs one HTTP request against a local stub server."""
+
+    REFRESHES = 3
+    server: ThreadingHTTPServer
+    thread: threading.Thread
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ForecastStubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        """Reset mocks and manager."""
+        super().setUp()
+        reset_all_mocks()
+        WeatherManager._instance = None
+        MockConnectionManager.set_test_instance(MockConnectionManager())
+        _ForecastStubHandler.request_paths = []
+        port = self.server.server_address[1]
+        self.service = WeatherService("10001", session=_StubSession(f"http://127.0.0.1:{port}"))
+        self.service.lat = 40.7128
+        self.service.lon = -74.006
+
+    def tearDown(self) -> None:
+        """Clean up manager."""
+        if WeatherManager._instance is not None:
+            WeatherManager._instance.shutdown()
+            WeatherManager._instance = None
+        reset_all_mocks()
+        super().tearDown()
+
+    def test_one_request_per_refresh(self) -> None:
+        """Each _update_weather call issues exactly one forecast request."""
+        manager = WeatherManager.instance()
+        manager._weather = self.service
+
+        for _ in range(self.REFRESHES):
+            run_async(manager._update_weather())
+
+        self.assertEqual(len(_ForecastStubHandler.request_paths), self.REFRESHES)
+        self.assertEqual(manager.get_current_temperature(), 68.0)
+        self.assertEqual(manager._daily_high, 77.0)
+        self.assertEqual(manager.get_precip_chance(), 45)
+
+
+class _SlowWeatherService(MockWeatherService):
+    """MockWeatherService whose fetch takes a fixed time, like a real network refresh."""
+
+    FETCH_TIME = 0.05
+
+    async def fetch_snapshot(
+        self, start_offset: float, duration: float
+    ) -> tuple[float | None, float | None, int | None]:
+        await asyncio.sleep(self.FETCH_TIME)
+        return await super().fetch_snapshot(start_offset, duration)
+
+
+class TestWeatherManagerPersistentCache(_IsolatedCacheTestCase):
+    """Test the persisted stale-while-revalidate weather snapshot."""
+
+    def setUp(self) -> None:
+        """Reset mocks and manager."""
+        super().setUp()
+        reset_all_mocks()
+        WeatherManager._instance = None
+        MockConnectionManager.set_test_instance(MockConnectionManager())
+
+    def tearDown(self) -> None:
+        """Clean up manager."""
+        if WeatherManager._instance is not None:
+            WeatherManager._instance.shutdown()
+            WeatherManager._instance = None
+        reset_all_mocks()
+        super().tearDown()
+
+    def _write_cache(self, age: float, zip_code: str = "10001") -> None:
+        with open(WeatherManager.CACHE_FILE, "w") as f:
+            json.dump(
+                {
+                    "zip": zip_code,
+                    "timestamp": time.time() - age,
+                    "current_temp": 61.0,
+                    "daily_high": 70.0,
+                    "precip_chance": 20,
+                },
+                f,
+            )
+
+    def test_fresh_cache_served_immediately(self) -> None:
+        """A young snapshot for the same ZIP is available before any refresh."""
+        self._write_cache(age=120)
+
+        manager = WeatherManager.instance(weather_zip="10001")
+
+        self.assertEqual(manager.get_current_temperature(), 61.0)
+        self.assertEqual(manager._daily_high, 70.0)
+        self.assertEqual(manager.get_precip_chance(), 20)
+        self.assertTrue(manager.is_from_cache())
+
+    def test_stale_cache_ignored(self) -> None:
+        """A snapshot older than the max age is not served."""
+        self._write_cache(age=WeatherManager.DEFAULT_CACHE_MAX_AGE + 60)
+
+        manager = WeatherManager.instance(weather_zip="10001")
+
+        self.assertIsNone(manager.get_current_temperature())
+        self.assertFalse(manager.is_from_cache())
+
+    def test_cache_from_future_ignored(self) -> None:
+        """A snapshot newer than the clock (RTC reset) has unknown age and is not served."""
+        self._write_cache(age=-3600)
+
+        manager = WeatherManager.instance(weather_zip="10001")
+
+        self.assertIsNone(manager.get_current_temperature())
+
+    def test_cache_for_other_zip_ignored(self) -> None:
+        """A snapshot for a different ZIP is not served."""
+        self._write_cache(age=60, zip_code="94105")
+
+        manager = WeatherManager.instance(weather_zip="10001")
+
+        self.assertIsNone(manager.get_current_temperature())
+
+    def test_refresh_persists_snapshot(self) -> None:
+        """A live refresh replaces cached values and writes them to the cache file."""
+        self._write_cache(age=60)
+        manager = WeatherManager.instance(weather_zip="10001")
+        manager._weather = MockWeatherService(current_temp=75.0, daily_high=88.0, window_precip=25)
+
+        run_async(manager._update_weather())
+
+        self.assertFalse(manager.is_from_cache())
+        with open(WeatherManager.CACHE_FILE) as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot["zip"], "10001")
+        self.assertEqual(snapshot["current_temp"], 75.0)
+        self.assertEqual(snapshot["precip_chance"], 25)
+        self.assertFalse(os.path.exists(WeatherManager.CACHE_FILE + ".tmp"))
+
+    def test_cache_writes_are_rate_limited(self) -> None:
+        """Back-to-back refreshes write the cache file only once."""
+        manager = WeatherManager.instance(weather_zip="10001")
+        manager._weather = MockWeatherService()
+
+        with patch("managers.weather_manager.write_json_atomic") as mock_write:
+            run_async(manager._update_weather())
+            run_async(manager._update_weather())
+
+        self.assertEqual(mock_write.call_count, 1)
+
+    def test_time_to_first_color_with_and_without_cache(self) -> None:
+        """Benchmark: with a cache the first color is available before the first fetch completes."""
+
+        async def boot_until_data() -> float:
+            start = time.monotonic()
+            manager = WeatherManager.instance(weather_zip="10001")
+            manager._weather = _SlowWeatherService()
+            refresh = asyncio.create_task(manager._update_weather())
+            while manager.get_current_temperature() is None or manager.get_precip_chance() is None:
+                await asyncio.sleep(0.005)
+            elapsed = time.monotonic() - start
+            await refresh
+            return elapsed
+
+        without_cache = run_async(boot_until_data())
+        WeatherManager._instance.shutdown()  # type: ignore[union-attr]
+        WeatherManager._instance = None
+
+        # The first boot persisted its snapshot; the "reboot" serves it immediately
+        with_cache = run_async(boot_until_data())
+
+        self.assertGreaterEqual(without_cache, _SlowWeatherService.FETCH_TIME)
+        self.assertLess(with_cache, _SlowWeatherService.FETCH_TIME)
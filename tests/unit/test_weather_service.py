@@ -6,7 +6,11 @@ Uses MockSession for HTTP responses without network access.
 """
 
 import asyncio
+import json
+import os
 import sys
+import tempfile
+from unittest.mock import patch
 
 # Mock CircuitPython modules before importing the service
 from tests.unit.unit_mocks import MockSession
@@ -32,12 +36,27 @@ from services.weather_service import WeatherService  # noqa: E402
 from tests.unit import TestCase  # noqa: E402
 
 
+class _IsolatedCacheTestCase(TestCase):
+    """TestCase that keeps the persisted geocode in a per-test temp dir."""
+
+    def setUp(self) -> None:
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._cache_patch = patch.object(
+            WeatherService, "LOCATION_CACHE_FILE", os.path.join(self._cache_dir.name, "geocode_cache.json")
+        )
+        self._cache_patch.start()
+
+    def tearDown(self) -> None:
+        self._cache_patch.stop()
+        self._cache_dir.cleanup()
+
+
 def run_async(coro):  # type: ignore[no-untyped-def]
     """Run an async coroutine synchronously."""
     return asyncio.run(coro)
 
 
-class TestWeatherServiceInit(TestCase):
+class TestWeatherServiceInit(_IsolatedCacheTestCase):
     """Test WeatherService initialization."""
 
     def test_init_stores_zip_code(self) -> None:
@@ -60,7 +79,7 @@ class TestWeatherServiceInit(TestCase):
         self.assertEqual(service.timezone, "America%2FNew_York")
 
 
-class TestWeatherServiceGeocoding(TestCase):
+class TestWeatherServiceGeocoding(_IsolatedCacheTestCase):
     """Test location geocoding functionality."""
 
     def test_ensure_location_success(self) -> None:
@@ -125,116 +144,203 @@ class TestWeatherServiceGeocoding(TestCase):
         self.assertFalse(result)
 
 
-class TestWeatherServiceAPI(TestCase):
-    """Test weather API methods."""
+class TestWeatherServicePrecipWindow(_IsolatedCacheTestCase):
+    """Test precipitation window calculation."""
 
     def setUp(self) -> None:
         """Create service with pre-set coordinates."""
+        super().setUp()
         self.session = MockSession()
         self.service = WeatherService("10001", session=self.session)
-        # Pre-set coordinates to skip geocoding
         self.service.lat = 40.7128
         self.service.lon = -74.006
 
-    def test_get_current_temperature(self) -> None:
-        """Returns temperature from API response."""
-        self.session.add_response({"current_weather": {"temperature": 72.5}})
+    def _add_forecast(self, times: list[str], probs: list[int]) -> None:
+        """Queue a snapshot response with the given hourly precipitation data."""
+        self.session.add_response(
+            {
+                "current_weather": {"temperature": 72.5, "time": "2025-02-06T14:15"},
+                "daily": {"temperature_2m_max": [85.0]},
+                "hourly": {"time": times, "precipitation_probability": probs},
+            }
+        )
 
-        result = run_async(self.service.get_current_temperature())
+    def test_precip_window_finds_max(self) -> None:
+        """Returns max probability in window."""
+        self._add_forecast(
+            ["2025-02-06T14:00", "2025-02-06T15:00", "2025-02-06T16:00", "2025-02-06T17:00"], [10, 30, 50, 20]
+        )
 
-        self.assertEqual(result, 72.5)
+        # Start 1 hour from current, duration 2 hours (covers 15:00 and 16:00)
+        _, _, result = run_async(self.service.fetch_snapshot(1, 2))
 
-    def test_get_current_temperature_no_location(self) -> None:
-        """Returns None when location unavailable."""
-        self.service.lat = None
-        self.service.lon = None
-        self.session.add_response([])  # Geocoding fails
+        self.assertEqual(result, 50)
 
-        result = run_async(self.service.get_current_temperature())
+    def test_precip_window_no_match(self) -> None:
+        """Returns 0 when current hour not found in data."""
+        self._add_forecast(["2025-02-06T10:00"], [50])  # Doesn't match current hour
 
-        self.assertIsNone(result)
+        _, _, result = run_async(self.service.fetch_snapshot(0, 1))
 
-    def test_get_daily_high(self) -> None:
-        """Returns daily high from API response."""
-        self.session.add_response({"daily": {"temperature_2m_max": [85.0]}})
+        self.assertEqual(result, 0)
 
-        result = run_async(self.service.get_daily_high())
+    def test_precip_window_out_of_bounds(self) -> None:
+        """Returns 0 when window extends beyond data."""
+        self._add_forecast(["2025-02-06T14:00"], [25])
 
-        self.assertEqual(result, 85.0)
+        # Start 5 hours out (beyond available data)
+        _, _, result = run_async(self.service.fetch_snapshot(5, 2))
 
+        self.assertEqual(result, 0)
 
-class TestWeatherServicePrecipWindow(TestCase):
-    """Test precipitation window calculation."""
+    def test_precip_window_clamps_negative_start(self) -> None:
+        """Negative offset is clamped to 0."""
+        self._add_forecast(["2025-02-06T14:00", "2025-02-06T15:00"], [60, 40])
+
+        _, _, result = run_async(self.service.fetch_snapshot(-1, 2))
+
+        self.assertEqual(result, 60)
+
+
+class TestWeatherServiceSnapshot(_IsolatedCacheTestCase):
+    """Test combined current/daily/hourly snapshot fetch."""
 
     def setUp(self) -> None:
         """Create service with pre-set coordinates."""
+        super().setUp()
         self.session = MockSession()
         self.service = WeatherService("10001", session=self.session)
         self.service.lat = 40.7128
         self.service.lon = -74.006
 
-    def test_precip_window_finds_max(self) -> None:
-        """Returns max probability in window."""
+    def test_snapshot_returns_all_values_from_one_request(self) -> None:
+        """Temperature, daily high and precip window come from a single GET."""
         self.session.add_response(
             {
-                "current_weather": {"time": "2025-02-06T14:15"},
+                "current_weather": {"temperature": 71.0, "time": "2025-02-06T14:15"},
+                "daily": {"temperature_2m_max": [84.0]},
                 "hourly": {
-                    "time": ["2025-02-06T14:00", "2025-02-06T15:00", "2025-02-06T16:00", "2025-02-06T17:00"],
-                    "precipitation_probability": [10, 30, 50, 20],
+                    "time": ["2025-02-06T14:00", "2025-02-06T15:00", "2025-02-06T16:00"],
+                    "precipitation_probability": [10, 40, 20],
                 },
             }
         )
 
-        # Start 1 hour from current, duration 2 hours (covers 15:00 and 16:00)
-        result = run_async(self.service.get_precip_chance_in_window(1, 2))
+        result = run_async(self.service.fetch_snapshot(0, 2))
 
-        self.assertEqual(result, 50)
+        self.assertEqual(result, (71.0, 84.0, 40))
+        self.assertEqual(self.session.get_call_count, 1)
 
-    def test_precip_window_no_match(self) -> None:
-        """Returns 0 when current hour not found in data."""
+    def test_snapshot_url_requests_all_blocks_with_trimmed_hourly(self) -> None:
+        """URL asks for current, daily and only the hourly steps the window needs."""
         self.session.add_response(
             {
-                "current_weather": {"time": "2025-02-06T14:15"},
-                "hourly": {
-                    "time": ["2025-02-06T10:00"],  # Doesn't match current hour
-                    "precipitation_probability": [50],
-                },
+                "current_weather": {"temperature": 71.0, "time": "2025-02-06T14:15"},
+                "daily": {"temperature_2m_max": [84.0]},
+                "hourly": {"time": ["2025-02-06T14:00"], "precipitation_probability": [0]},
             }
         )
 
-        result = run_async(self.service.get_precip_chance_in_window(0, 1))
+        run_async(self.service.fetch_snapshot(0, 4))
 
-        self.assertEqual(result, 0)
+        url = self.session.get_urls[0]
+        self.assertIn("current_weather=true", url)
+        self.assertIn("daily=temperature_2m_max", url)
+        self.assertIn("hourly=precipitation_probability", url)
+        self.assertIn("forecast_hours=5", url)
 
-    def test_precip_window_out_of_bounds(self) -> None:
-        """Returns 0 when window extends beyond data."""
-        self.session.add_response(
-            {
-                "current_weather": {"time": "2025-02-06T14:15"},
-                "hourly": {
-                    "time": ["2025-02-06T14:00"],
-                    "precipitation_probability": [25],
-                },
-            }
-        )
+    def test_snapshot_no_location(self) -> None:
+        """Returns all None when location unavailable."""
+        self.service.lat = None
+        self.service.lon = None
+        self.session.add_response([])
 
-        # Start 5 hours out (beyond available data)
-        result = run_async(self.service.get_precip_chance_in_window(5, 2))
+        result = run_async(self.service.fetch_snapshot(0, 4))
 
-        self.assertEqual(result, 0)
+        self.assertEqual(result, (None, None, None))
 
-    def test_precip_window_clamps_negative_start(self) -> None:
-        """Negative offset is clamped to 0."""
-        self.session.add_response(
-            {
-                "current_weather": {"time": "2025-02-06T14:15"},
-                "hourly": {
-                    "time": ["2025-02-06T14:00", "2025-02-06T15:00"],
-                    "precipitation_probability": [60, 40],
-                },
-            }
-        )
 
-        result = run_async(self.service.get_precip_chance_in_window(-1, 2))
+class TestWeatherServiceLocationCache(_IsolatedCacheTestCase):
+    """Test persisted geocoding results."""
 
-        self.assertEqual(result, 60)
+    GEOCODE = [{"lat": "40.7128", "lon": "-74.006"}]
+    SNAPSHOT = {
+        "current_weather": {"temperature": 70.0, "time": "2025-02-06T14:15"},
+        "daily": {"temperature_2m_max": [80.0]},
+        "hourly": {"time": ["2025-02-06T14:00"], "precipitation_probability": [10]},
+    }
+
+    def _geocode_calls(self, session: MockSession) -> int:
+        return sum(1 for url in session.get_urls if "nominatim" in url)
+
+    def test_cold_boot_persists_location(self) -> None:
+        """Successful geocode is written to the cache file keyed by ZIP."""
+        session = MockSession()
+        session.add_response(self.GEOCODE)
+        service = WeatherService("10001", session=session)
+
+        self.assertTrue(run_async(service._ensure_location()))
+
+        with open(WeatherService.LOCATION_CACHE_FILE) as f:
+            cached = json.load(f)
+        self.assertEqual(cached["zip"], "10001")
+        self.assertEqual(cached["lat"], 40.7128)
+        self.assertEqual(cached["lon"], -74.006)
+        self.assertEqual(cached["timezone"], service.timezone)
+
+    def test_warm_boot_makes_no_geocode_calls(self) -> None:
+        """A fresh service for the same ZIP reuses the persisted location."""
+        cold_session = MockSession()
+        cold_session.add_response(self.GEOCODE)
+        cold_session.add_response(self.SNAPSHOT)
+        run_async(WeatherService("10001", session=cold_session).fetch_snapshot(0, 4))
+        self.assertEqual(self._geocode_calls(cold_session), 1)
+
+        # Simulated reboot: new service instance and session, same ZIP
+        warm_session = MockSession()
+        warm_session.add_response(self.SNAPSHOT)
+        service = WeatherService("10001", session=warm_session)
+
+        result = run_async(service.fetch_snapshot(0, 4))
+
+        self.assertEqual(result, (70.0, 80.0, 10))
+        self.assertEqual(self._geocode_calls(warm_session), 0)
+        self.assertEqual(warm_session.get_call_count, 1)
+        self.assertEqual(service.lat, 40.7128)
+
+    def test_cache_for_other_zip_is_ignored(self) -> None:
+        """A cached location for a different ZIP triggers a new geocode."""
+        session = MockSession()
+        session.add_response(self.GEOCODE)
+        run_async(WeatherService("10001", session=session)._ensure_location())
+
+        other_session = MockSession()
+        other_session.add_response([{"lat": "34.05", "lon": "-118.24"}])
+        service = WeatherService("90001", session=other_session)
+
+        self.assertTrue(run_async(service._ensure_location()))
+        self.assertEqual(self._geocode_calls(other_session), 1)
+        self.assertEqual(service.lat, 34.05)
+
+    def test_corrupt_cache_falls_back_to_geocoding(self) -> None:
+        """Unreadable cache contents are ignored."""
+        with open(WeatherService.LOCATION_CACHE_FILE, "w") as f:
+            f.write("{not json")
+        session = MockSession()
+        session.add_response(self.GEOCODE)
+        service = WeatherService("10001", session=session)
+
+        self.assertTrue(run_async(service._ensure_location()))
+        self.assertEqual(self._geocode_calls(session), 1)
+
+    def test_invalidate_keeps_matching_zip(self) -> None:
+        """Invalidation only removes the cache when the ZIP changed."""
+        session = MockSession()
+        session.add_response(self.GEOCODE)
+        run_async(WeatherService("10001", session=session)._ensure_location())
+
+        WeatherService.invalidate_location_cache("10001")
+        self.assertTrue(os.path.exists(WeatherService.LOCATION_CACHE_FILE))
+
+        WeatherService.invalidate_location_cache("90001")
+        self.assertFalse(os.path.exists(WeatherService.LOCATION_CACHE_FILE))
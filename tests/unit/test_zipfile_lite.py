@@ -1,10 +1,18 @@
 """Unit tests for zipfile_lite module."""
 
+import os
+import random
+import shutil
 import struct
+import tempfile
+import tracemalloc
 import unittest
+import zipfile
 import zlib
 from unittest.mock import patch
 
+from core.app_typing import Any
+
 
 class TestZipFileInit(unittest.TestCase):
     """Test ZipFile initialization."""
@@ -306,5 +314,203 @@ class TestExtract(unittest.TestCase):
             self.assertIn("File not found", str(ctx.exception))
 
 
+class TestStreamingExtraction(unittest.TestCase):
+    """Test bounded-memory extraction of large members."""
+
+    MEMBER_SIZE = 1024 * 1024
+    test_dir: str
+    zip_path: str
+    content: bytes
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_dir = tempfile.mkdtemp()
+        cls.zip_path = os.path.join(cls.test_dir, "test.zip")
+
+        # Synthetic 1MB member that compresses but not trivially (like .mpy/web assets)
+        rng = random.Random(1234)
+        words = [bytes(rng.choice(b"abcdefghijklmnop") for _ in range(rng.randint(2, 10))) for _ in range(512)]
+        content = bytearray()
+        while len(content) < cls.MEMBER_SIZE:
+            content += rng.choice(words) + b" "
+        cls.content = bytes(content[: cls.MEMBER_SIZE])
+
+        with zipfile.ZipFile(cls.zip_path, "w") as zf:
+            zf.writestr("big.bin", cls.content, compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr("big_stored.bin", cls.content, compress_type=zipfile.ZIP_STORED)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.out_dir = tempfile.mkdtemp(dir=self.test_dir)
+
+    def _extract_peak(self, member: str) -> int:
+        from utils.zipfile_lite import ZipFile
+
+        zf = ZipFile(self.zip_path)
+        tracemalloc.start()
+        try:
+            zf.extract(member, self.out_dir)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def test_deflated_extraction_matches_content(self) -> None:
+        """Verify streamed inflate reproduces the original bytes."""
+        self._extract_peak("big.bin")
+        with open(os.path.join(self.out_dir, "big.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_stored_extraction_matches_content(self) -> None:
+        """Verify stored members are copied through the reusable buffer intact."""
+        self._extract_peak("big_stored.bin")
+        with open(os.path.join(self.out_dir, "big_stored.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_read_deflated_multi_chunk_member(self) -> None:
+        """Verify read() returns full content of a member spanning many chunks."""
+        from utils.zipfile_lite import ZipFile
+
+        self.assertEqual(ZipFile(self.zip_path).read("big.bin"), self.content)
+
+    def test_extraction_peak_memory_is_bounded(self) -> None:
+        """Benchmark: peak allocation extracting a 1MB member stays far below member size."""
+        with zipfile.ZipFile(self.zip_path) as zf:
+            info = zf.getinfo("big.bin")
+        with open(self.zip_path, "rb") as f:
+            f.seek(info.header_offset + 30 + len(info.filename) + len(info.extra))
+            compressed = f.read(info.compress_size)
+
+        # Whole-member approach: compressed bytes plus one-shot decompress
+        tracemalloc.start()
+        try:
+            zlib.decompress(compressed, -15)
+            _, whole_member_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        whole_member_peak += len(compressed)
+
+        deflated_peak = self._extract_peak("big.bin")
+        stored_peak = self._extract_peak("big_stored.bin")
+
+        # Streaming peak is the fixed buffers plus zlib's 32KB inflate window
+        self.assertGreater(whole_member_peak, self.MEMBER_SIZE)
+        self.assertLess(deflated_peak, 128 * 1024)
+        self.assertLess(stored_peak, 32 * 1024)
+        self.assertLess(deflated_peak * 10, whole_member_peak)
+
+
+class TestCrcVerification(unittest.TestCase):
+    """Test CRC-32 verification during extraction."""
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self.zip_path = os.path.join(self.test_dir, "test.zip")
+        self.out_dir = os.path.join(self.test_dir, "out")
+        os.mkdir(self.out_dir)
+        self.content = b"firmware module bytes " * 200
+        with zipfile.ZipFile(self.zip_path, "w") as zf:
+            zf.writestr("code.mpy", self.content, compress_type=zipfile.ZIP_STORED)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _corrupt_member_byte(self) -> None:
+        with zipfile.ZipFile(self.zip_path) as zf:
+            info = zf.getinfo("code.mpy")
+        data_offset = info.header_offset + 30 + len(info.filename) + len(info.extra)
+        with open(self.zip_path, "r+b") as f:
+            f.seek(data_offset + 100)
+            byte = f.read(1)
+            f.seek(data_offset + 100)
+            f.write(bytes([byte[0] ^ 0x01]))
+
+    def test_parse_keeps_crc(self) -> None:
+        """Verify central directory parsing records each entry's CRC-32."""
+        from utils.zipfile_lite import ZipFile
+
+        zf = ZipFile(self.zip_path)
+        self.assertEqual(zf.file_list[0]["crc32"], zlib.crc32(self.content) & 0xFFFFFFFF)
+
+    def test_extract_valid_member_passes_crc(self) -> None:
+        """Verify an intact member extracts without error."""
+        from utils.zipfile_lite import ZipFile
+
+        ZipFile(self.zip_path).extract("code.mpy", self.out_dir)
+        with open(os.path.join(self.out_dir, "code.mpy"), "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_extract_corrupt_member_raises_and_removes_output(self) -> None:
+        """Verify a bit-flipped member fails CRC and leaves no partial file behind."""
+        from utils.zipfile_lite import ZipFile
+
+        self._corrupt_member_byte()
+        zf = ZipFile(self.zip_path)
+        with self.assertRaises(ValueError) as ctx:
+            zf.extract("code.mpy", self.out_dir)
+        self.assertIn("CRC-32 mismatch", str(ctx.exception))
+        self.assertFalse(os.path.exists(os.path.join(self.out_dir, "code.mpy")))
+
+    def test_read_corrupt_member_raises(self) -> None:
+        """Verify read() also rejects a member whose CRC does not match."""
+        from utils.zipfile_lite import ZipFile
+
+        self._corrupt_member_byte()
+        with self.assertRaises(ValueError):
+            ZipFile(self.zip_path).read("code.mpy")
+
+
+class TestMemberLookup(unittest.TestCase):
+    """Test name-indexed member lookup."""
+
+    ENTRY_COUNT = 300
+
+    def setUp(self) -> None:
+        self.test_dir = tempfile.mkdtemp()
+        self.zip_path = os.path.join(self.test_dir, "test.zip")
+        self.out_dir = os.path.join(self.test_dir, "out")
+        os.mkdir(self.out_dir)
+        with zipfile.ZipFile(self.zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(self.ENTRY_COUNT):
+                zf.writestr(f"file_{i:03d}.mpy", f"module {i}".encode() * 4)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_index_built_at_parse_time(self) -> None:
+        """Verify parsing builds a name-to-entry index covering every member."""
+        from utils.zipfile_lite import ZipFile
+
+        zf = ZipFile(self.zip_path)
+        assert zf._entries is not None
+        self.assertEqual(len(zf._entries), self.ENTRY_COUNT)
+        self.assertIs(zf._entries["file_150.mpy"], zf.file_list[150])
+
+    def test_extract_300_entries_by_name(self) -> None:
+        """Verify extracting every member by name never rescans the member list or central directory."""
+        from utils.zipfile_lite import ZipFile
+
+        zf = ZipFile(self.zip_path)
+        names = zf.namelist()
+        scans = [0]
+
+        class _CountingList(list):
+            def __iter__(self) -> Any:
+                scans[0] += 1
+                return super().__iter__()
+
+        zf.file_list = _CountingList(zf.file_list)
+        with patch.object(ZipFile, "_find_central_directory") as mock_find:
+            for name in names:
+                zf.extract(name, self.out_dir)
+
+        self.assertEqual(len(os.listdir(self.out_dir)), self.ENTRY_COUNT)
+        self.assertEqual(scans[0], 0)
+        mock_find.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
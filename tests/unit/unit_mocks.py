@@ -599,33 +599,24 @@ class MockWeatherService:
         Initialize mock weather service.
 
         Args:
-            current_temp: Value to return for get_current_temperature()
-            daily_high: Value to return for get_daily_high()
-            window_precip: Value to return for get_precip_chance_in_window()
+            current_temp: Current temperature returned by fetch_snapshot()
+            daily_high: Daily high returned by fetch_snapshot()
+            window_precip: Window precipitation chance returned by fetch_snapshot()
             should_raise: Exception to raise on any method call
         """
+        self.zip_code = "10001"
         self.current_temp = current_temp
         self.daily_high = daily_high
         self.window_precip = window_precip
         self.should_raise = should_raise
 
-    async def get_current_temperature(self) -> float | None:
-        """Return configured temperature or raise error."""
+    async def fetch_snapshot(
+        self, start_offset: float, duration: float
+    ) -> tuple[float | None, float | None, int | None]:
+        """Return all configured values from one call or raise error."""
         if self.should_raise:
             raise self.should_raise
-        return self.current_temp
-
-    async def get_daily_high(self) -> float | None:
-        """Return configured high temperature or raise error."""
-        if self.should_raise:
-            raise self.should_raise
-        return self.daily_high
-
-    async def get_precip_chance_in_window(self, start_offset: float, duration: float) -> int | None:
-        """Return configured window precipitation or raise error."""
-        if self.should_raise:
-            raise self.should_raise
-        return self.window_precip
+        return self.current_temp, self.daily_high, self.window_precip
 
 
 def reset_all_mocks() -> None: